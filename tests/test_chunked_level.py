@@ -0,0 +1,98 @@
+import time
+
+import pygame
+import pytest
+
+from zombie_knight.board import create_game_state
+from zombie_knight.state import ChunkedTileGrid
+from zombie_knight.state.chunked_level import ChunkCache, LevelFile, write_level
+from zombie_knight.tools.generate_level import generate_level_bands
+
+
+def write_test_level(tmp_path, columns: int = 256, rows: int = 128) -> str:
+    path = str(tmp_path / "level.zkl")
+    write_level(path, columns, rows, generate_level_bands(columns, rows, chunk_size=32), chunk_size=32)
+    return path
+
+
+def test_cache_evicts_the_least_recently_used_chunks(tmp_path):
+    level_file = LevelFile(write_test_level(tmp_path))
+    cache = ChunkCache(level_file, memory_limit=3 * 32 * 32)
+    try:
+        for key in [(0, 0), (1, 0), (2, 0), (0, 0), (3, 0)]:
+            cache.get(key)
+
+        assert list(cache.chunks) == [(2, 0), (0, 0), (3, 0)]
+        assert cache.get_memory() <= cache.memory_limit
+        assert (cache.hits, cache.misses) == (1, 4)
+        assert cache.get((1, 0)) == level_file.read_chunk(1, 0)
+    finally:
+        cache.shutdown()
+        level_file.close()
+
+
+def test_prefetch_loads_the_chunks_ahead_in_the_background(tmp_path):
+    with ChunkedTileGrid.open(write_test_level(tmp_path)) as tiles:
+        rect = pygame.Rect(0, 0, 32, 100)
+        tiles.prefetch(rect, pygame.Vector2(2000, 0), lookahead=1.0)
+        deadline = time.monotonic() + 5
+        while tiles.chunk_cache.pending and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        cache = tiles.chunk_cache
+        assert sorted(cache.chunks) == [
+            (column, row) for column in range(3) for row in range(2)
+        ]
+        assert cache.prefetched == len(cache.chunks)
+        tiles.query(rect)
+        assert cache.misses == 0
+
+
+def test_prefetch_without_velocity_loads_the_chunks_around(tmp_path):
+    with ChunkedTileGrid.open(write_test_level(tmp_path)) as tiles:
+        tiles.prefetch(pygame.Rect(32 * 32 * 2, 0, 32, 32))
+        deadline = time.monotonic() + 5
+        while tiles.chunk_cache.pending and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        assert sorted(tiles.chunk_cache.chunks) == [
+            (column, row) for column in range(1, 4) for row in range(2)
+        ]
+
+
+def test_full_scans_are_explicit(tmp_path):
+    path = write_test_level(tmp_path, 100, 40)
+
+    with ChunkedTileGrid.open(path) as tiles:
+        with pytest.raises(TypeError):
+            len(tiles)
+        with pytest.raises(TypeError):
+            iter(tiles)
+        region = tiles.get_region(100, 40)
+        assert list(tiles.iter_tiles()) == list(region)
+        assert tiles.count_tiles() == len(region)
+
+
+def test_region_matches_the_cells_of_the_level(tmp_path):
+    path = str(tmp_path / "level.zkl")
+    write_level(path, 150, 100, generate_level_bands(150, 100, chunk_size=32), chunk_size=32)
+
+    with ChunkedTileGrid.open(path) as tiles:
+        region = tiles.get_region(70, 200)
+
+        assert (region.columns, region.rows) == (70, 100)
+        assert all(
+            region.get(column, row) == tiles.get(column, row)
+            for row in range(region.rows)
+            for column in range(region.columns)
+        )
+
+
+def test_zombies_are_spawned_on_streamed_levels(tmp_path):
+    path = str(tmp_path / "level.zkl")
+    write_level(path, 300, 100, generate_level_bands(300, 100))
+
+    with ChunkedTileGrid.open(path) as tiles:
+        game_state = create_game_state(tiles)
+
+    assert game_state.zombies is not None and len(game_state.zombies) > 0
@@ -0,0 +1,64 @@
+import pygame
+import pytest
+
+from zombie_knight.rules.tile import CollideTileRule
+from zombie_knight.state import (
+    HorizontalDirection,
+    PlayerMode,
+    PlayerState,
+    TileGrid,
+    TileKind,
+)
+
+
+def create_wall_grid() -> TileGrid:
+    # A wall two tiles wide and six tiles tall, from (320, 64) to (384, 256).
+    return TileGrid.from_tile_map(
+        [
+            [TileKind.DIRT if 10 <= column < 12 and 2 <= row < 8 else 0 for column in range(20)]
+            for row in range(10)
+        ]
+    )
+
+
+def create_player(x: int, y: int, velocity: pygame.Vector2) -> PlayerState:
+    return PlayerState(
+        rect=pygame.Rect(x, y, 32, 100),
+        mode=PlayerMode.RUNNING,
+        horizontal_direction=HorizontalDirection.RIGHT,
+        animation_index=0,
+        lives=3,
+        score=0,
+        velocity=velocity,
+        acceleration=pygame.Vector2(0, 0),
+    )
+
+
+@pytest.mark.parametrize("merge_colliders", [False, True])
+def test_side_hit_on_a_merged_run_pushes_the_player_back(merge_colliders):
+    tiles = create_wall_grid()
+    rule = CollideTileRule(merge_colliders=merge_colliders)
+    # The player overlaps the left side of the wall by 4 pixels, its feet 40
+    # pixels below the top of the wall, above the center of the merged collider.
+    player = create_player(320 - 32 + 4, 64 + 40 - 100, pygame.Vector2(100, 10))
+
+    tile_index = rule.get_tile_index(tiles)
+    collided = rule.apply_collide_tile(player, tile_index)
+
+    if merge_colliders:
+        assert tile_index.query(player.rect)[0].rect == pygame.Rect(320, 64, 64, 192)
+    assert collided.rect.right == 320 - rule.tile_margin
+    assert collided.rect.y == player.rect.y
+    assert collided.velocity == (0, 10)
+
+
+@pytest.mark.parametrize("merge_colliders", [False, True])
+def test_landing_on_a_merged_run_stands_on_its_top(merge_colliders):
+    tiles = create_wall_grid()
+    rule = CollideTileRule(merge_colliders=merge_colliders)
+    player = create_player(340, 64 + 6 - 100, pygame.Vector2(0, 50))
+
+    collided = rule.apply_collide_tile(player, rule.get_tile_index(tiles))
+
+    assert collided.rect.bottom == 64 + rule.tile_margin
+    assert collided.velocity == (0, 0)
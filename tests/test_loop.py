@@ -0,0 +1,20 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zombie_knight.bench.synthetic import create_zombie_game_state
+from zombie_knight.loop import interpolate_game_state
+from zombie_knight.rules.zombie import ZombiePatrolRule
+
+
+def test_interpolate_game_state_moves_zombies_between_steps():
+    previous_game_state = create_zombie_game_state((40, 20), 20)
+    game_state = ZombiePatrolRule()(previous_game_state, [])
+
+    render_state = interpolate_game_state(previous_game_state, game_state, 0.5)
+
+    assert np.allclose(
+        render_state.zombies.positions,
+        (previous_game_state.zombies.positions + game_state.zombies.positions) / 2,
+    )
+    assert render_state.zombies.modes is game_state.zombies.modes
@@ -0,0 +1,31 @@
+import pygame
+
+from dataclasses import replace
+
+from zombie_knight.bench.synthetic import create_game_state
+from zombie_knight.board import apply_rules, create_rules
+from zombie_knight.input import ScriptedKeyboard
+from zombie_knight.rules.pipeline import RulePipeline, create_working_entity
+from zombie_knight.state import PlayerState
+
+
+def test_pipeline_matches_apply_rules():
+    rules = create_rules(ScriptedKeyboard())
+    pipeline = RulePipeline(rules)
+    expected = actual = create_game_state((40, 20))
+
+    for _ in range(200):
+        expected = apply_rules(expected, rules, [])
+        actual = pipeline(actual, [])
+
+    assert actual == expected
+
+
+def test_working_entity_is_an_entity_updated_in_place():
+    player = create_game_state((40, 20)).player
+    working_player = create_working_entity(player)
+
+    assert isinstance(working_player, PlayerState)
+    assert working_player.replace_velocity(pygame.Vector2(1, 2)) is working_player
+    assert working_player.publish() == replace(player, velocity=pygame.Vector2(1, 2))
+    assert player.velocity != pygame.Vector2(1, 2)
@@ -0,0 +1,74 @@
+import json
+
+from zombie_knight.bench.synthetic import create_game_state
+from zombie_knight.board import create_rules
+from zombie_knight.input import ScriptedKeyboard
+from zombie_knight.profiling import Profiler
+from zombie_knight.rules.pipeline import RulePipeline
+
+
+def test_fused_rules_are_timed_once_per_frame():
+    profiler = Profiler()
+    rules = create_rules(ScriptedKeyboard())
+    pipeline = RulePipeline(profiler.profile_rules(rules))
+    game_state = create_game_state((40, 20))
+
+    for _ in range(5):
+        game_state = pipeline(game_state, [])
+
+    summary = profiler.summarize()
+    assert "VelocityRule" in summary
+    assert all(section["count"] == 5 for section in summary.values())
+
+
+def test_disabled_profiler_leaves_the_rules_and_methods_untouched():
+    profiler = Profiler(enabled=False)
+    rules = create_rules(ScriptedKeyboard())
+    target = Target()
+    method = target.draw
+
+    assert profiler.profile_rules(rules) is rules
+    profiler.instrument(target, ("draw",))
+    with profiler.measure("frame"):
+        target.draw()
+
+    assert target.draw == method
+    assert "draw" not in vars(target)
+    assert profiler.summarize() == {}
+
+
+def test_histograms_keep_the_latest_durations(tmp_path):
+    profiler = Profiler(window=4)
+    for duration_ms in [100, 1, 2, 3, 4]:
+        profiler.record("section", duration_ms * 1_000_000)
+
+    profiler.dump(str(tmp_path / "profile.json"))
+    with open(tmp_path / "profile.json") as file:
+        summary = json.load(file)["section"]
+
+    assert summary["count"] == 5
+    assert summary["total_ms"] == 110
+    assert summary["max_ms"] == 4
+    assert summary["mean_ms"] == 2.5
+
+
+def test_instrumented_methods_are_timed_under_their_class_name():
+    profiler = Profiler()
+    target = Target()
+    profiler.instrument(target, ("draw", "draw_layer"))
+
+    target.draw()
+
+    summary = profiler.summarize()
+    assert list(summary) == ["Target.draw", "Target.draw_layer"]
+    assert summary["Target.draw_layer"]["count"] == 2
+    assert summary["Target.draw"]["p50_ms"] >= summary["Target.draw_layer"]["p50_ms"]
+
+
+class Target:
+    def draw(self) -> None:
+        self.draw_layer()
+        self.draw_layer()
+
+    def draw_layer(self) -> None:
+        pass
@@ -0,0 +1,112 @@
+import pygame
+import pytest
+
+from dataclasses import replace
+
+from zombie_knight.bench.synthetic import create_zombie_game_state
+from zombie_knight.board import apply_rules, create_game_state, create_rules
+from zombie_knight.input import ScriptedKeyboard
+from zombie_knight.recording import (
+    JUMP_BIT,
+    LEFT_BIT,
+    RECORDING_MAGIC,
+    RIGHT_BIT,
+    InputRecorder,
+    InputRecording,
+    hash_game_state,
+)
+from zombie_knight.replay import open_recorded_level, replay
+from zombie_knight.state import ChunkedTileGrid, TileKind
+from zombie_knight.state.chunked_level import write_level
+from zombie_knight.tools.generate_level import generate_level_bands
+
+
+def test_replay_loads_the_recorded_level(tmp_path):
+    level_path = str(tmp_path / "level.zkl")
+    write_level(level_path, 300, 100, generate_level_bands(300, 100))
+    keyboard = ScriptedKeyboard()
+
+    with ChunkedTileGrid.open(level_path) as tiles:
+        rules = create_rules(keyboard)
+        recorder = InputRecorder(
+            lambda game_state, events: apply_rules(game_state, rules, events),
+            keyboard,
+            level_path=level_path,
+        )
+        game_state = create_game_state(tiles)
+        keyboard.press([pygame.K_RIGHT])
+        for _ in range(300):
+            game_state = recorder(game_state, [])
+        recorder.save(str(tmp_path / "session.zkr"))
+
+    recording = InputRecording.load(str(tmp_path / "session.zkr"))
+    assert recording.level_path == level_path
+    with open_recorded_level(recording) as tiles:
+        result = replay(recording, tiles=tiles)
+        assert hash_game_state(result.game_state) == recording.final_state_hash
+
+
+def test_hash_covers_the_zombie_horde_and_the_tiles():
+    game_state = create_zombie_game_state((40, 20), 8)
+    moved_horde = game_state.zombies.replace_arrays(
+        positions=game_state.zombies.positions + [0.5, 0.0]
+    )
+    changed_kind = TileKind.DIRT if game_state.tiles.get(0, 0) is None else None
+    changed_tiles = game_state.tiles.replace_cells({(0, 0): changed_kind})
+
+    expected = hash_game_state(game_state)
+
+    assert hash_game_state(replace(game_state, zombies=moved_horde)) != expected
+    assert hash_game_state(replace(game_state, tiles=changed_tiles)) != expected
+
+
+@pytest.mark.parametrize("level_path", [None, "/levels/château.zkl"])
+def test_recording_round_trips_through_bytes(level_path):
+    recording = InputRecording(final_state_hash=bytes(range(16)), level_path=level_path)
+    for mask in [0] * 200 + [RIGHT_BIT] * 3 + [RIGHT_BIT | JUMP_BIT] + [LEFT_BIT] * 130:
+        recording.append(mask)
+
+    data = recording.to_bytes()
+    loaded = InputRecording.from_bytes(data)
+
+    assert loaded == recording
+    assert loaded.runs == [[0, 200], [RIGHT_BIT, 3], [RIGHT_BIT | JUMP_BIT, 1], [LEFT_BIT, 130]]
+    with pytest.raises(ValueError, match="Truncated"):
+        InputRecording.from_bytes(data[:-2])
+    with pytest.raises(ValueError, match="Unsupported"):
+        InputRecording.from_bytes(data.replace(RECORDING_MAGIC, b"XXXX", 1))
+
+
+def test_replay_matches_a_recording_on_the_built_in_map(tmp_path):
+    keyboard = ScriptedKeyboard()
+    rules = create_rules(keyboard)
+    recorder = InputRecorder(
+        lambda game_state, events: apply_rules(game_state, rules, events),
+        keyboard,
+    )
+    game_state = create_game_state()
+    jump = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+    for frame in range(240):
+        keyboard.press([pygame.K_RIGHT] if frame < 120 else [pygame.K_LEFT])
+        game_state = recorder(game_state, jump if frame % 60 == 0 else [])
+    recorder.save(str(tmp_path / "session.zkr"))
+
+    recording = InputRecording.load(str(tmp_path / "session.zkr"))
+    assert recording.level_path is None
+    assert recording.frame_count == 240
+    result = replay(recording)
+    assert hash_game_state(result.game_state) == recording.final_state_hash
+    assert hash_game_state(result.game_state) == hash_game_state(game_state)
+
+
+def test_replay_rejects_a_level_that_does_not_match_the_recording(tmp_path):
+    level_path = str(tmp_path / "level.zkl")
+    write_level(level_path, 300, 100, generate_level_bands(300, 100))
+    recording = InputRecording(level_path=level_path)
+    recording.append(0)
+
+    with pytest.raises(ValueError, match="open_recorded_level"):
+        replay(recording)
+    with ChunkedTileGrid.open(level_path) as tiles:
+        with pytest.raises(ValueError, match="built-in tile map"):
+            replay(InputRecording(runs=[[0, 1]], frame_count=1), tiles=tiles)
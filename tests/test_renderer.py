@@ -0,0 +1,44 @@
+import threading
+
+import pygame
+import pytest
+
+from zombie_knight.assets import AssetManager
+from zombie_knight.bench.synthetic import create_game_state
+from zombie_knight.render.renderer import Renderer
+
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    yield pygame.display.set_mode((320, 160))
+    pygame.display.quit()
+
+
+def get_asset_threads() -> list[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("asset-loader")
+    ]
+
+
+def test_close_stops_the_asset_threads_the_renderer_created(display):
+    with Renderer(display) as renderer:
+        renderer.render(create_game_state((10, 5)))
+
+    assert renderer.owns_asset_manager
+    assert not get_asset_threads()
+
+
+def test_close_leaves_a_passed_asset_manager_running(display):
+    asset_manager = AssetManager()
+    try:
+        with Renderer(display, asset_manager=asset_manager) as renderer:
+            renderer.render(create_game_state((10, 5)))
+
+        assert asset_manager.load_image(
+            "missing.png", alpha=False
+        ).future.exception() is not None
+    finally:
+        asset_manager.shutdown()
@@ -0,0 +1,37 @@
+import pytest
+
+from zombie_knight.bench.synthetic import create_game_state, create_zombie_game_state
+from zombie_knight.state import snapshot
+
+
+def test_snapshot_round_trip():
+    game_state = create_game_state((40, 20))
+
+    assert snapshot.load(snapshot.dump(game_state)) == game_state
+
+
+def test_load_rejects_unknown_cell_values():
+    data = bytearray(snapshot.dump(create_game_state((40, 20))))
+    data[-1] = 200
+
+    with pytest.raises(ValueError, match=r"Unknown tile value 200 in the cell \(39, 19\)"):
+        snapshot.load(data)
+
+
+def test_snapshot_round_trip_keeps_the_zombie_horde():
+    game_state = create_zombie_game_state((40, 20), 16)
+
+    loaded = snapshot.load(snapshot.dump(game_state))
+
+    assert loaded.player == game_state.player
+    assert loaded.tiles == game_state.tiles
+    assert len(loaded.zombies) == 16
+    assert list(loaded.zombies) == list(game_state.zombies)
+
+
+def test_load_keeps_the_cells_in_the_snapshot_buffer():
+    data = bytearray(snapshot.dump(create_game_state((40, 20))))
+
+    loaded = snapshot.load(data)
+
+    assert loaded.tiles.cells.obj is data
@@ -0,0 +1,41 @@
+import pygame
+
+from dataclasses import replace
+
+from zombie_knight.bench.synthetic import create_game_state
+
+
+def test_player_accessors_return_copies():
+    player = create_game_state((40, 20)).player
+    rect = player.rect.copy()
+    velocity = player.velocity.copy()
+
+    player.get_collision_rect().x += 10
+    player.get_velocity().x += 10
+    player.get_position().x += 10
+    player.get_acceleration().y += 10
+
+    assert player.rect == rect
+    assert player.velocity == velocity
+    assert player.get_position() == rect.topleft
+    assert player.get_acceleration() == (0, 0)
+
+
+def test_replace_position_copies_the_vector():
+    position = pygame.Vector2(10.4, 20.6)
+    player = create_game_state((40, 20)).player.replace_position(position)
+
+    position.x += 100
+
+    assert player.get_position() == (10.4, 20.6)
+    assert player.rect.topleft == (10, 21)
+
+
+def test_moving_the_rect_drops_the_stale_position():
+    player = create_game_state((40, 20)).player.replace_position(pygame.Vector2(10.4, 20.6))
+
+    moved = replace(player, rect=player.rect.move(50, 0))
+
+    assert moved.position is None
+    assert moved.get_position() == (60, 21)
+    assert replace(player, lives=1).get_position() == (10.4, 20.6)
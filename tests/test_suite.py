@@ -0,0 +1,68 @@
+import time
+
+from zombie_knight.bench.suite import (
+    Benchmark,
+    benchmarks,
+    compare_results,
+    run_suite,
+    time_benchmark,
+)
+
+
+def test_benchmark_keys_format_map_sizes():
+    assert Benchmark("collision", [], None).get_key((40, 20)) == "collision[40x20]"
+    assert Benchmark("frame", [], None).get_key(100) == "frame[100]"
+
+
+def test_calls_per_sample_grow_until_a_sample_is_long_enough():
+    calls = []
+
+    def function():
+        calls.append(None)
+        time.sleep(0.0001)
+
+    result = time_benchmark(function, repeats=3, min_sample_time=0.005)
+
+    assert result["loops"] > 1
+    assert len(calls) >= result["loops"] * (result["repeats"] + 1)
+    assert result["min_ms"] <= result["p50_ms"]
+    assert result["min_ms"] >= 0.1
+
+
+def test_comparison_flags_benchmarks_beyond_the_factor():
+    baseline = {"results": {"a": {"p50_ms": 1.0}, "b": {"p50_ms": 1.0}, "c": {"p50_ms": 1.0}}}
+    results = {
+        "results": {
+            "a": {"p50_ms": 1.5},
+            "b": {"p50_ms": 0.5},
+            "c": {"p50_ms": 1.1},
+            "new": {"p50_ms": 1.0},
+        }
+    }
+
+    comparison = compare_results(results, baseline, factor=1.25)
+
+    assert comparison["regressed"] == ["a"]
+    assert {key: value["status"] for key, value in comparison["benchmarks"].items()} == {
+        "a": "regressed",
+        "b": "improved",
+        "c": "unchanged",
+    }
+
+
+def test_suite_runs_the_benchmarks_matching_the_filter():
+    keys = [
+        suite_benchmark.get_key(param)
+        for suite_benchmark in benchmarks
+        for param in suite_benchmark.params
+    ]
+    assert len(keys) == len(set(keys))
+
+    result = run_suite(
+        r"^state\.create_tiles_from_tile_map\[40x20\]$",
+        repeats=1,
+        min_sample_time=0.001,
+    )
+
+    assert list(result["results"]) == ["state.create_tiles_from_tile_map[40x20]"]
+    assert result["environment"]["pygame"]
@@ -0,0 +1,77 @@
+import pygame
+
+from zombie_knight.bench.synthetic import create_crowd_game_state
+from zombie_knight.board import apply_rules, create_rules
+from zombie_knight.input import ScriptedKeyboard
+from zombie_knight.rules.pipeline import RulePipeline
+from zombie_knight.rules.physics.swept import SweptVelocityRule, sweep_axis
+from zombie_knight.state import (
+    HorizontalDirection,
+    PlayerMode,
+    PlayerState,
+    TileGrid,
+    TileKind,
+)
+
+
+def create_wall_grid() -> TileGrid:
+    # A wall one tile thick in column 10, from x=320 to x=352.
+    return TileGrid.from_tile_map(
+        [[TileKind.DIRT if column == 10 else 0 for column in range(20)] for row in range(10)]
+    )
+
+
+def create_player(x: float, y: float, velocity: pygame.Vector2) -> PlayerState:
+    return PlayerState(
+        rect=pygame.Rect(round(x), round(y), 32, 100),
+        mode=PlayerMode.RUNNING,
+        horizontal_direction=HorizontalDirection.RIGHT,
+        animation_index=0,
+        lives=3,
+        score=0,
+        velocity=velocity,
+        acceleration=pygame.Vector2(0, 0),
+        position=pygame.Vector2(x, y),
+    )
+
+
+def test_sweep_axis_finds_the_first_face_crossed():
+    tiles = create_wall_grid()
+
+    hit = sweep_axis(tiles, pygame.Vector2(100, 50), (32, 100), 400, 0)
+
+    assert hit.time == (320 - 132) / 400
+    assert hit.normal == (-1, 0)
+    assert hit.cell == (10, 1)
+    assert sweep_axis(tiles, pygame.Vector2(100, 50), (32, 100), 100, 0) is None
+    assert sweep_axis(tiles, pygame.Vector2(500, 50), (32, 100), -400, 0).normal == (1, 0)
+
+
+def test_sweep_axis_ignores_tiles_overlapped_at_the_start():
+    tiles = create_wall_grid()
+
+    assert sweep_axis(tiles, pygame.Vector2(330, 50), (32, 100), 100, 0) is None
+
+
+def test_fast_bodies_stop_at_the_wall_instead_of_passing_through():
+    rule = SweptVelocityRule(timestep=1 / 60)
+    tiles = create_wall_grid()
+    # At 60000 px/s the body moves 1000 px in one step, far past the wall.
+    player = create_player(100.5, 50, pygame.Vector2(60000, 120))
+
+    moved = rule.apply_swept_velocity(player, rule.get_tile_index(tiles))
+
+    assert moved.get_position() == (320 - 32, 52)
+    assert moved.get_velocity() == (0, 120)
+
+
+def test_swept_pipeline_matches_apply_rules():
+    rules = create_rules(ScriptedKeyboard(), continuous_collision=True)
+    pipeline = RulePipeline(rules)
+    expected = actual = create_crowd_game_state((40, 20), 50)
+
+    for _ in range(100):
+        expected = apply_rules(expected, rules, [])
+        actual = pipeline(actual, [])
+
+    assert actual == expected
@@ -0,0 +1,41 @@
+import threading
+import time
+
+import pytest
+
+from zombie_knight.bench.synthetic import create_game_state
+from zombie_knight.telemetry import TelemetrySink, TelemetryWriter, read_records
+
+
+class BlockedSink(TelemetrySink):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.unblocked = threading.Event()
+
+    def write(self, line: bytes) -> None:
+        self.unblocked.wait()
+        with open(self.path, "ab") as file:
+            file.write(line)
+
+
+def test_sink_requires_write():
+    with pytest.raises(TypeError):
+        TelemetrySink()
+
+
+def test_records_hold_the_number_of_dropped_records(tmp_path):
+    sink = BlockedSink(str(tmp_path / "telemetry.jsonl"))
+    writer = TelemetryWriter(sink, queue_size=1)
+    game_state = create_game_state((40, 20))
+
+    for frame in range(10):
+        writer.submit_frame(frame, 1, 0, 0, 60.0, game_state)
+    sink.unblocked.set()
+    while not writer.queue.empty():
+        time.sleep(0.001)
+    writer.submit_frame(10, 1, 0, 0, 60.0, game_state)
+    writer.close()
+
+    records = read_records(sink.path)
+    assert writer.dropped > 0
+    assert records[-1]["dropped"] == writer.dropped
@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from multiprocessing import shared_memory
+
+from zombie_knight.vec_env import ACTION_KEYS, OBSERVATION_SIZE, GameInstance, VectorEnv
+
+
+def test_workers_step_the_instances_through_shared_memory():
+    env_count = 5
+    max_episode_frames = 6
+    frame_skip = 2
+    actions = np.arange(env_count) % len(ACTION_KEYS)
+    env = VectorEnv(
+        env_count,
+        worker_count=2,
+        max_episode_frames=max_episode_frames,
+        frame_skip=frame_skip,
+    )
+    try:
+        assert len(env.workers) == 2
+        observations = env.reset()
+        assert observations.shape == (env_count, OBSERVATION_SIZE)
+
+        instances = [GameInstance(max_episode_frames) for _ in range(env_count)]
+        expected_observations = np.zeros((env_count, OBSERVATION_SIZE))
+        for instance, observation in zip(instances, expected_observations):
+            instance.write_observation(observation)
+        np.testing.assert_array_equal(observations, expected_observations)
+
+        for step in range(4):
+            observations, rewards, dones = env.step(actions)
+            assert np.shares_memory(observations, env.arrays.observations)
+
+            for index, instance in enumerate(instances):
+                reward, done = instance.step(int(actions[index]), frame_skip)
+                if done:
+                    instance.reset()
+                assert rewards[index] == reward
+                assert dones[index] == done
+                instance.write_observation(expected_observations[index])
+            np.testing.assert_array_equal(observations, expected_observations)
+            # The episodes end after 6 frames, i.e. in the third step of 2 frames.
+            assert dones.all() == (step == 2)
+
+        assert rewards[2] > 0 > rewards[1]
+    finally:
+        workers = list(env.workers)
+        memory_name = env.arrays.memory.name
+        env.close()
+
+    assert not any(worker.is_alive() for worker in workers)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=memory_name)
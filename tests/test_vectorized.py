@@ -0,0 +1,48 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zombie_knight.bench.synthetic import create_body_game_state, create_crowd_game_state
+from zombie_knight.board import apply_rules
+from zombie_knight.rules.physics.movement import GravityRule, AccelerationRule, VelocityRule
+from zombie_knight.rules.physics.vectorized import VectorizedMovementRule
+from zombie_knight.state import MatterArrays
+
+
+def test_vectorized_movement_matches_per_object_rules():
+    rules = [GravityRule(), AccelerationRule(), VelocityRule()]
+    vectorized_rule = VectorizedMovementRule()
+    crowd_game_state = create_crowd_game_state((40, 20), 100)
+    body_game_state = create_body_game_state((40, 20), 100)
+
+    for frame in range(200):
+        crowd_game_state = apply_rules(crowd_game_state, rules, [])
+        body_game_state = vectorized_rule(body_game_state, [])
+
+        expected = MatterArrays.from_matters(crowd_game_state.crowd)
+        for name in ("positions", "velocities", "accelerations"):
+            assert np.array_equal(
+                getattr(body_game_state.bodies, name),
+                getattr(expected, name),
+            ), f"The {name} differ at frame {frame}"
+        assert body_game_state.player == crowd_game_state.player
+
+
+def test_vectorized_movement_keeps_previous_arrays():
+    game_state = create_body_game_state((40, 20), 10)
+    positions = game_state.bodies.positions.copy()
+
+    new_game_state = VectorizedMovementRule()(game_state, [])
+
+    assert np.array_equal(game_state.bodies.positions, positions)
+    assert not np.array_equal(new_game_state.bodies.positions, positions)
+
+
+def test_matter_arrays_write_back_to_matters():
+    matters = create_crowd_game_state((40, 20), 10).crowd
+
+    new_matters = MatterArrays.from_matters(matters).to_matters(matters)
+
+    assert [matter.get_position() for matter in new_matters] == [
+        matter.get_position() for matter in matters
+    ]
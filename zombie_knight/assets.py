@@ -0,0 +1,286 @@
+import os
+import re
+import threading
+import time
+
+import pygame
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, TypeVar
+
+from .constants.assets import ASSET_LOADER_WORKERS
+
+
+T = TypeVar("T")
+
+
+class AssetHandle(Generic[T]):
+    def __init__(
+        self,
+        path: str,
+        future: Future,
+        requested_at: float,
+    ) -> None:
+        """
+        Initializes the asset handle.
+
+        Args:
+            path (str): The path of the asset.
+            future (Future): The future resolving to the asset and its decode start and end times.
+            requested_at (float): The perf_counter time the asset was requested at.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.future = future
+        self.requested_at = requested_at
+
+    def is_ready(self) -> bool:
+        """
+        Checks if the asset has been loaded.
+
+        Returns:
+            bool: True if the asset has been loaded or failed to load, False otherwise.
+        """
+        return self.future.done()
+
+    def get(self, timeout: float | None = None) -> T:
+        """
+        Gets the asset, waiting for it to be loaded if needed.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait.
+
+        Returns:
+            T: The loaded asset.
+        """
+        asset, _, _ = self.future.result(timeout)
+        return asset
+
+    def get_latency(self) -> float | None:
+        """
+        Gets the time from requesting the asset until it was loaded.
+
+        Returns:
+            float | None: The latency in seconds or None if the asset is not loaded.
+        """
+        if not self.future.done() or self.future.exception() is not None:
+            return None
+        _, _, finished_at = self.future.result()
+        return finished_at - self.requested_at
+
+    def get_decode_time(self) -> float | None:
+        """
+        Gets the time spent decoding the asset, excluding the time it was queued.
+
+        Returns:
+            float | None: The decode time in seconds or None if the asset is not loaded.
+        """
+        if not self.future.done() or self.future.exception() is not None:
+            return None
+        _, started_at, finished_at = self.future.result()
+        return finished_at - started_at
+
+
+class AssetManager:
+    def __init__(
+        self,
+        max_workers: int = ASSET_LOADER_WORKERS,
+    ) -> None:
+        """
+        Initializes the asset manager.
+        Assets are decoded on a thread pool in the order they are requested,
+        so the assets needed for the first frame should be requested first.
+
+        Args:
+            max_workers (int): The number of decoding threads.
+
+        Returns:
+            None
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="asset-loader",
+        )
+        self.handles: dict[str, AssetHandle] = {}
+        self.lock = threading.Lock()
+
+    def load_image(
+        self,
+        path: str,
+        alpha: bool = True,
+    ) -> AssetHandle[pygame.Surface]:
+        """
+        Requests an image converted to the display pixel format.
+
+        Args:
+            path (str): The path of the image.
+            alpha (bool): Whether to keep the per-pixel alpha of the image.
+
+        Returns:
+            AssetHandle[pygame.Surface]: The handle of the image.
+        """
+        return self.load(path, lambda: decode_image(path, alpha))
+
+    def load_images(
+        self,
+        paths: list[str],
+        alpha: bool = True,
+    ) -> list[AssetHandle[pygame.Surface]]:
+        """
+        Requests a list of images, e.g. the frames of an animation.
+
+        Args:
+            paths (list[str]): The paths of the images.
+            alpha (bool): Whether to keep the per-pixel alpha of the images.
+
+        Returns:
+            list[AssetHandle[pygame.Surface]]: The handles of the images.
+        """
+        return [self.load_image(path, alpha) for path in paths]
+
+    def load_sound(self, path: str) -> AssetHandle[pygame.mixer.Sound]:
+        """
+        Requests a sound.
+
+        Args:
+            path (str): The path of the sound.
+
+        Returns:
+            AssetHandle[pygame.mixer.Sound]: The handle of the sound.
+        """
+        return self.load(path, lambda: pygame.mixer.Sound(path))
+
+    def load_sounds(self, paths: list[str]) -> list[AssetHandle[pygame.mixer.Sound]]:
+        """
+        Requests a list of sounds.
+
+        Args:
+            paths (list[str]): The paths of the sounds.
+
+        Returns:
+            list[AssetHandle[pygame.mixer.Sound]]: The handles of the sounds.
+        """
+        return [self.load_sound(path) for path in paths]
+
+    def load(self, path: str, decode: Callable[[], T]) -> AssetHandle[T]:
+        """
+        Requests an asset, reusing the handle if it was requested before.
+
+        Args:
+            path (str): The path of the asset.
+            decode (Callable[[], T]): The function decoding the asset.
+
+        Returns:
+            AssetHandle[T]: The handle of the asset.
+        """
+        with self.lock:
+            handle = self.handles.get(path)
+            if handle is None:
+                handle = AssetHandle(
+                    path,
+                    self.executor.submit(timed, decode),
+                    time.perf_counter(),
+                )
+                self.handles[path] = handle
+        return handle
+
+    def wait(self) -> None:
+        """
+        Waits until every requested asset has been loaded or failed to load.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            handles = list(self.handles.values())
+        for handle in handles:
+            handle.future.exception()
+
+    def get_load_latencies(self) -> dict[str, float]:
+        """
+        Gets the load latency of every loaded asset.
+
+        Returns:
+            dict[str, float]: The latency in seconds of every loaded asset by path.
+        """
+        with self.lock:
+            handles = list(self.handles.values())
+        return {
+            handle.path: latency
+            for handle in handles
+            if (latency := handle.get_latency()) is not None
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stops the decoding threads, dropping assets that have not started loading.
+
+        Returns:
+            None
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def timed(decode: Callable[[], T]) -> tuple[T, float, float]:
+    """
+    Decodes an asset and records when decoding started and finished.
+
+    Args:
+        decode (Callable[[], T]): The function decoding the asset.
+
+    Returns:
+        tuple[T, float, float]: The asset and the perf_counter start and end times.
+    """
+    started_at = time.perf_counter()
+    asset = decode()
+    return asset, started_at, time.perf_counter()
+
+
+def decode_image(path: str, alpha: bool) -> pygame.Surface:
+    """
+    Decodes an image and converts it to the display pixel format.
+
+    Args:
+        path (str): The path of the image.
+        alpha (bool): Whether to keep the per-pixel alpha of the image.
+
+    Returns:
+        pygame.Surface: The decoded image.
+    """
+    image = pygame.image.load(path)
+    return image.convert_alpha() if alpha else image.convert()
+
+
+def get_frame_number(file_name: str) -> int:
+    """
+    Gets the frame number of an animation frame from its file name.
+
+    Args:
+        file_name (str): The file name, e.g. "Run (10).png" or "tile003.png".
+
+    Returns:
+        int: The last number in the file name.
+    """
+    numbers = re.findall(r"\d+", file_name)
+    if not numbers:
+        raise ValueError(f"Animation frame {file_name!r} has no frame number")
+    return int(numbers[-1])
+
+
+def list_animation_frame_paths(directory: str) -> list[str]:
+    """
+    Lists the frame images of an animation directory in frame number order.
+
+    Args:
+        directory (str): The directory of the animation.
+
+    Returns:
+        list[str]: The paths of the frame images.
+    """
+    file_names = sorted(
+        (name for name in os.listdir(directory) if name.endswith(".png")),
+        key=get_frame_number,
+    )
+    return [os.path.join(directory, file_name) for file_name in file_names]
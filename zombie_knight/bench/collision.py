@@ -0,0 +1,108 @@
+import argparse
+import json
+import sys
+import time
+
+from dataclasses import replace
+
+from .render import parse_size
+from .stats import summarize_ns
+from .synthetic import create_game_state
+from ..rules.tile import CollideTileRule
+from ..state.game_state import GameState
+from ..state.collider_mesh import ColliderMesh
+from ..constants.tile import TILE_SIZE
+
+
+def benchmark_collision(
+    map_size: tuple[int, int],
+    frames: int,
+    seed: int = 0,
+) -> dict:
+    """
+    Times CollideTileRule on a synthetic map with the player standing on the floor,
+    with merged colliders and tile by tile.
+    The spatial index is built before measuring, as it is built once per tile list.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        frames (int): The number of measured frames.
+        seed (int): The seed of the synthetic game state.
+
+    Returns:
+        dict: The map size, tile count, and the collider count and frame times of both modes.
+    """
+    game_state = create_game_state(map_size, seed)
+    game_state = place_on_floor(game_state)
+    results = {
+        "map_size": list(map_size),
+        "tile_count": len(game_state.tiles),
+    }
+
+    for name, merge_colliders in (("tiles", False), ("merged", True)):
+        rule = CollideTileRule(merge_colliders=merge_colliders)
+
+        index_started_at = time.perf_counter_ns()
+        tile_index = rule.get_tile_index(game_state.tiles)
+        index_time = time.perf_counter_ns() - index_started_at
+
+        frame_times = []
+        for _ in range(frames):
+            started_at = time.perf_counter_ns()
+            rule(game_state, [])
+            frame_times.append(time.perf_counter_ns() - started_at)
+
+        results[name] = {
+            "collider_count": (
+                len(tile_index.get_colliders())
+                if isinstance(tile_index, ColliderMesh)
+                else len(game_state.tiles)
+            ),
+            "index_build_ms": index_time / 1e6,
+            "frame_time": summarize_ns(frame_times),
+        }
+
+    return results
+
+
+def place_on_floor(game_state: GameState) -> GameState:
+    """
+    Moves the player so that it overlaps the top of the floor in the middle of the map.
+
+    Args:
+        game_state (GameState): The game state.
+
+    Returns:
+        GameState: The game state with the player on the floor.
+    """
+    floor_top = max(tile.rect.top for tile in game_state.tiles) - TILE_SIZE[1]
+    floor_right = max(tile.rect.right for tile in game_state.tiles)
+    rect = game_state.player.rect.copy()
+    rect.midbottom = (floor_right // 2, floor_top + 1)
+    return replace(game_state, player=replace(game_state.player, rect=rect))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks CollideTileRule against maps of growing size.",
+    )
+    parser.add_argument(
+        "--map-sizes",
+        type=parse_size,
+        nargs="+",
+        default=[(40, 20), (200, 100), (1000, 100), (2000, 500)],
+    )
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = [
+        benchmark_collision(map_size, args.frames, args.seed)
+        for map_size in args.map_sizes
+    ]
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
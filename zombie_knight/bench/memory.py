@@ -0,0 +1,187 @@
+import argparse
+import dataclasses
+import json
+import sys
+import tracemalloc
+
+import pygame
+
+from dataclasses import dataclass
+from typing import Callable
+
+from .render import parse_size
+from .synthetic import create_player_states, create_tile_map
+from ..constants.tile import TILE_SIZE
+from ..state.direction import HorizontalDirection
+from ..state.player import PlayerMode
+from ..state.tile_grid import TileGrid
+from ..state.utils import create_tiles_from_tile_map
+
+
+@dataclass
+class LegacyTileState:
+    rect: pygame.Rect
+
+
+class LegacyGrassTileState(LegacyTileState):
+    pass
+
+
+class LegacyDirtTileState(LegacyTileState):
+    pass
+
+
+class LegacyLeftTileState(LegacyTileState):
+    pass
+
+
+class LegacyRightTileState(LegacyTileState):
+    pass
+
+
+@dataclass
+class LegacyPlayerState:
+    rect: pygame.Rect
+    mode: PlayerMode
+    horizontal_direction: HorizontalDirection
+    animation_index: int
+    lives: int
+    score: int
+    velocity: pygame.Vector2
+    acceleration: pygame.Vector2
+
+
+legacy_tile_classes = {
+    1: LegacyGrassTileState,
+    2: LegacyDirtTileState,
+    3: LegacyLeftTileState,
+    4: LegacyRightTileState,
+}
+
+
+def create_legacy_tiles(tile_map: list[list[int]]) -> list[LegacyTileState]:
+    """
+    Creates tile states the way create_tiles_from_tile_map used to, with a
+    subclass instance and a rect for every solid cell.
+
+    Args:
+        tile_map (list[list[int]]): The tile map.
+
+    Returns:
+        list[LegacyTileState]: The list of tile states.
+    """
+    width, height = TILE_SIZE
+    return [
+        legacy_tile_classes[tile](
+            rect=pygame.Rect(x * width, y * height, width, height)
+        )
+        for y, row in enumerate(tile_map)
+        for x, tile in enumerate(row)
+        if tile in legacy_tile_classes
+    ]
+
+
+def create_legacy_player_states(count: int, seed: int = 0) -> list[LegacyPlayerState]:
+    """
+    Creates player states with the unslotted layout.
+
+    Args:
+        count (int): The number of player states.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        list[LegacyPlayerState]: The player states.
+    """
+    return [
+        LegacyPlayerState(
+            **{
+                field.name: getattr(player_state, field.name)
+                for field in dataclasses.fields(LegacyPlayerState)
+            }
+        )
+        for player_state in create_player_states(count, (4096, 4096), seed)
+    ]
+
+
+def measure_bytes_per_object(create: Callable[[], list]) -> dict:
+    """
+    Measures the memory held by a list of objects and everything it references.
+
+    Args:
+        create (Callable[[], list]): The function creating the objects.
+
+    Returns:
+        dict: The object count, the total bytes and the bytes per object.
+    """
+    tracemalloc.start()
+    try:
+        objects = create()
+        total_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "count": len(objects),
+        "bytes": total_bytes,
+        "bytes_per_object": total_bytes / max(len(objects), 1),
+    }
+
+
+def benchmark_memory(
+    map_size: tuple[int, int],
+    entity_count: int,
+    seed: int = 0,
+) -> dict:
+    """
+    Compares the memory of the legacy and the compact state layouts and of the tile grid.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        entity_count (int): The number of player states.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict: The memory of the tiles and the entities for both layouts.
+    """
+    width, height = map_size
+    tile_map = create_tile_map(width, height, seed)
+
+    return {
+        "map_size": list(map_size),
+        "tiles": {
+            "legacy": measure_bytes_per_object(lambda: create_legacy_tiles(tile_map)),
+            "compact": measure_bytes_per_object(
+                lambda: create_tiles_from_tile_map(tile_map)
+            ),
+            "grid": measure_bytes_per_object(lambda: TileGrid.from_tile_map(tile_map)),
+        },
+        "entities": {
+            "legacy": measure_bytes_per_object(
+                lambda: create_legacy_player_states(entity_count, seed)
+            ),
+            "compact": measure_bytes_per_object(
+                lambda: create_player_states(entity_count, (4096, 4096), seed)
+            ),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Reports the memory per tile and per entity of the state layouts.",
+    )
+    parser.add_argument("--map-size", type=parse_size, default=(1000, 1000))
+    parser.add_argument("--entities", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    json.dump(
+        benchmark_memory(args.map_size, args.entities, args.seed),
+        sys.stdout,
+        indent=2,
+    )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import json
+import sys
+import time
+
+from typing import Callable
+
+from .stats import summarize_ns
+from .synthetic import create_body_game_state, create_crowd_game_state
+from ..board import apply_rules
+from ..rules.physics.movement import GravityRule, AccelerationRule, VelocityRule
+from ..rules.physics.vectorized import VectorizedMovementRule
+from ..rules.pipeline import RulePipeline
+from ..state.game_state import GameState
+
+
+def time_steps(
+    step: Callable[[GameState], GameState],
+    game_state: GameState,
+    frames: int,
+) -> list[int]:
+    """
+    Steps a game state frame by frame and times every step.
+
+    Args:
+        step (Callable[[GameState], GameState]): The function applying the movement to a game state.
+        game_state (GameState): The initial game state.
+        frames (int): The number of measured frames.
+
+    Returns:
+        list[int]: The step times in nanoseconds.
+    """
+    step_times = []
+    for _ in range(frames):
+        started_at = time.perf_counter_ns()
+        game_state = step(game_state)
+        step_times.append(time.perf_counter_ns() - started_at)
+    return step_times
+
+
+def benchmark_physics(body_count: int, frames: int, seed: int = 0) -> dict:
+    """
+    Times a whole movement step of the per-object rules, of the rule pipeline and of the vectorized rule.
+    The per-object rules and the pipeline move a crowd of matters held in a
+    list, the vectorized rule moves the same bodies held as matter arrays in
+    the game state, so every step includes all the work done per frame.
+
+    Args:
+        body_count (int): The number of bodies, including the player.
+        frames (int): The number of measured frames.
+        seed (int): The seed of the synthetic bodies.
+
+    Returns:
+        dict: The body count and the step times of every backend.
+    """
+    crowd_game_state = create_crowd_game_state((40, 20), body_count, seed)
+    body_game_state = create_body_game_state((40, 20), body_count, seed)
+    rules = [GravityRule(), AccelerationRule(), VelocityRule()]
+    pipeline = RulePipeline(rules)
+    vectorized_rule = VectorizedMovementRule()
+
+    return {
+        "body_count": body_count,
+        "per_object": summarize_ns(
+            time_steps(
+                lambda game_state: apply_rules(game_state, rules, []),
+                crowd_game_state,
+                frames,
+            )
+        ),
+        "pipeline": summarize_ns(
+            time_steps(
+                lambda game_state: pipeline(game_state, []),
+                crowd_game_state,
+                frames,
+            )
+        ),
+        "vectorized": summarize_ns(
+            time_steps(
+                lambda game_state: vectorized_rule(game_state, []),
+                body_game_state,
+                frames,
+            )
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares the per-object movement rules with the vectorized backend.",
+    )
+    parser.add_argument(
+        "--body-counts",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1000, 10000],
+    )
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = [
+        benchmark_physics(body_count, args.frames, args.seed)
+        for body_count in args.body_counts
+    ]
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from .stats import summarize_ns
+from .synthetic import create_game_state
+from ..board import apply_rules, create_rules
+from ..rules.pipeline import RulePipeline
+from ..state.game_state import GameState
+from ..state.player import PlayerState
+
+
+def run_frames(
+    step: Callable[[GameState], GameState],
+    game_state: GameState,
+    frames: int,
+) -> tuple[GameState, list[int]]:
+    """
+    Steps a game state frame by frame and times every frame.
+
+    Args:
+        step (Callable[[GameState], GameState]): The function applying the rules to a game state.
+        game_state (GameState): The initial game state.
+        frames (int): The number of frames.
+
+    Returns:
+        tuple[GameState, list[int]]: The final game state and the frame times in nanoseconds.
+    """
+    frame_times = []
+    for _ in range(frames):
+        started_at = time.perf_counter_ns()
+        game_state = step(game_state)
+        frame_times.append(time.perf_counter_ns() - started_at)
+    return game_state, frame_times
+
+
+@contextmanager
+def count_state_copies() -> Iterator[dict[str, int]]:
+    """
+    Counts the GameState and PlayerState instances created inside the context.
+
+    Returns:
+        Iterator[dict[str, int]]: The counts by class name, filled in while the context runs.
+    """
+    counts = {cls.__name__: 0 for cls in (GameState, PlayerState)}
+    original_inits = {}
+    for cls in (GameState, PlayerState):
+        original_inits[cls] = cls.__init__
+
+        def counting_init(self, *args, __cls=cls, **kwargs):
+            counts[__cls.__name__] += 1
+            original_inits[__cls](self, *args, **kwargs)
+
+        cls.__init__ = counting_init
+    try:
+        yield counts
+    finally:
+        for cls, original_init in original_inits.items():
+            cls.__init__ = original_init
+
+
+def measure_allocations(
+    step: Callable[[GameState], GameState],
+    game_state: GameState,
+    frames: int,
+) -> dict[str, float]:
+    """
+    Measures the state copies and the peak traced memory of the frames.
+
+    Args:
+        step (Callable[[GameState], GameState]): The function applying the rules to a game state.
+        game_state (GameState): The initial game state.
+        frames (int): The number of frames.
+
+    Returns:
+        dict[str, float]: The state copies and peak allocated bytes per frame.
+    """
+    peaks = []
+    with count_state_copies() as counts:
+        tracemalloc.start()
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            game_state = step(game_state)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+        tracemalloc.stop()
+
+    return {
+        **{f"{name}_per_frame": count / frames for name, count in counts.items()},
+        "peak_bytes_per_frame": sum(peaks) / frames,
+    }
+
+
+def benchmark_pipeline(frames: int, seed: int = 0) -> dict:
+    """
+    Compares apply_rules with the fused RulePipeline on the rules of the game.
+
+    Args:
+        frames (int): The number of measured frames.
+        seed (int): The seed of the synthetic game state.
+
+    Returns:
+        dict: The frame times and allocations of both paths.
+    """
+    game_state = create_game_state((40, 20), seed)
+    rules = create_rules()
+    pipeline = RulePipeline(rules)
+    paths = {
+        "apply_rules": lambda state: apply_rules(state, rules, []),
+        "pipeline": lambda state: pipeline(state, []),
+    }
+
+    final_states = {}
+    results = {}
+    for name, step in paths.items():
+        final_states[name], frame_times = run_frames(step, game_state, frames)
+        results[name] = {
+            "frame_time_us": {
+                key.replace("_ms", "_us"): value * 1e3
+                for key, value in summarize_ns(frame_times).items()
+            },
+            **measure_allocations(step, game_state, frames),
+        }
+
+    if final_states["apply_rules"] != final_states["pipeline"]:
+        raise AssertionError("The pipeline and apply_rules produced different states")
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares apply_rules with the fused rule pipeline.",
+    )
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        results = benchmark_pipeline(args.frames, args.seed)
+    finally:
+        pygame.quit()
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import pygame
+
+from dataclasses import replace
+
+from .stats import summarize_ns
+from .synthetic import create_game_state, create_player_states
+from ..render.camera import Camera
+from ..render.renderer import Renderer
+from ..state.game_state import GameState
+from ..state.player import PlayerState
+
+
+def benchmark_render(
+    map_size: tuple[int, int],
+    sprite_count: int,
+    resolution: tuple[int, int],
+    frames: int,
+    warmup_frames: int = 10,
+    seed: int = 0,
+    camera: bool = False,
+) -> dict:
+    """
+    Renders synthetic game states on an offscreen display and times every stage.
+    Sprites cycle through their animation frames so the frame cache is exercised.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        sprite_count (int): The number of player sprites to render.
+        resolution (tuple[int, int]): The size of the display.
+        frames (int): The number of measured frames.
+        warmup_frames (int): The number of frames rendered before measuring.
+        seed (int): The seed of the synthetic game state.
+        camera (bool): Whether to render through a camera following the player,
+            culling the tiles outside the viewport.
+
+    Returns:
+        dict: The configuration, frames per second and frame and stage times.
+    """
+    display = pygame.display.set_mode(resolution)
+    with Renderer(display, camera=Camera(resolution) if camera else None) as renderer:
+        game_state = create_game_state(map_size, seed)
+        player_states = create_player_states(sprite_count, resolution, seed)
+        if camera:
+            renderer.camera.follow(
+                game_state.player.rect,
+                renderer.get_tile_index(game_state.tiles).get_world_rect(),
+            )
+            player_states = [
+                replace(player_state, rect=renderer.camera.to_world(player_state.rect))
+                for player_state in player_states
+            ]
+
+        frame_times: list[int] = []
+        stage_times: dict[str, list[int]] = {
+            "background": [],
+            "tiles": [],
+            "player": [],
+        }
+        for frame in range(warmup_frames + frames):
+            player_states = [animate(player_state) for player_state in player_states]
+            times = render_frame(renderer, game_state, player_states)
+            if frame < warmup_frames:
+                continue
+            for stage, stage_time in times.items():
+                stage_times[stage].append(stage_time)
+            frame_times.append(sum(times.values()))
+
+    total_seconds = sum(frame_times) / 1e9
+    return {
+        "config": {
+            "map_size": list(map_size),
+            "sprite_count": sprite_count,
+            "resolution": list(resolution),
+            "frames": frames,
+            "seed": seed,
+            "camera": camera,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "video_driver": pygame.display.get_driver(),
+            "machine": platform.machine(),
+        },
+        "fps": frames / total_seconds,
+        "frame_time": summarize_ns(frame_times),
+        "stages": {
+            stage: summarize_ns(times) for stage, times in stage_times.items()
+        },
+    }
+
+
+def render_frame(
+    renderer: Renderer,
+    game_state: GameState,
+    player_states: list[PlayerState],
+) -> dict[str, int]:
+    """
+    Renders one frame stage by stage.
+
+    Args:
+        renderer (Renderer): The renderer.
+        game_state (GameState): The game state holding the tiles.
+        player_states (list[PlayerState]): The player sprites to render.
+
+    Returns:
+        dict[str, int]: The time of every stage in nanoseconds.
+    """
+    started_at = time.perf_counter_ns()
+    renderer.render_background()
+    background_done_at = time.perf_counter_ns()
+    renderer.render_tiles(game_state.tiles)
+    tiles_done_at = time.perf_counter_ns()
+    for player_state in player_states:
+        renderer.render_player(player_state)
+    player_done_at = time.perf_counter_ns()
+
+    return {
+        "background": background_done_at - started_at,
+        "tiles": tiles_done_at - background_done_at,
+        "player": player_done_at - tiles_done_at,
+    }
+
+
+def animate(player_state: PlayerState) -> PlayerState:
+    """
+    Advances the animation of a player sprite by one frame.
+
+    Args:
+        player_state (PlayerState): The player state.
+
+    Returns:
+        PlayerState: The player state showing the next animation frame.
+    """
+    return replace(
+        player_state,
+        animation_index=(player_state.animation_index + 1) % 10,
+    )
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    """
+    Parses a size given as WIDTHxHEIGHT.
+
+    Args:
+        value (str): The size, e.g. "1280x640".
+
+    Returns:
+        tuple[int, int]: The width and the height.
+    """
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks Renderer.render headless with SDL's dummy video driver.",
+    )
+    parser.add_argument("--map-size", type=parse_size, default=(40, 20))
+    parser.add_argument("--sprites", type=int, default=1)
+    parser.add_argument("--resolution", type=parse_size, default=(1280, 640))
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--warmup-frames", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--camera", action="store_true")
+    parser.add_argument("--output", help="The JSON file to write the results to.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        result = benchmark_render(
+            args.map_size,
+            args.sprites,
+            args.resolution,
+            args.frames,
+            args.warmup_frames,
+            args.seed,
+            args.camera,
+        )
+    finally:
+        pygame.quit()
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(result, output_file, indent=2)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
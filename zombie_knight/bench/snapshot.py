@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from .render import parse_size
+from .stats import summarize_ns
+from .synthetic import create_game_state
+from ..state import snapshot
+
+
+def time_round_trips(dump, load, game_state, repeats: int) -> dict:
+    """
+    Times the encoding and decoding of a game state.
+
+    Args:
+        dump: The function encoding a game state to bytes.
+        load: The function decoding the bytes.
+        game_state (GameState): The game state.
+        repeats (int): The number of measured round trips.
+
+    Returns:
+        dict: The size of the encoding and the dump and load times.
+    """
+    dump_times = []
+    load_times = []
+    for _ in range(repeats):
+        started_at = time.perf_counter_ns()
+        data = dump(game_state)
+        dump_times.append(time.perf_counter_ns() - started_at)
+
+        started_at = time.perf_counter_ns()
+        loaded_game_state = load(data)
+        load_times.append(time.perf_counter_ns() - started_at)
+
+    if loaded_game_state != game_state:
+        raise AssertionError("The round trip changed the game state")
+
+    return {
+        "bytes": len(data),
+        "dump": summarize_ns(dump_times),
+        "load": summarize_ns(load_times),
+    }
+
+
+def benchmark_snapshot(map_size: tuple[int, int], repeats: int, seed: int = 0) -> dict:
+    """
+    Compares the snapshot format with pickle for size and round trip time.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        repeats (int): The number of measured round trips.
+        seed (int): The seed of the synthetic game state.
+
+    Returns:
+        dict: The results of pickle, of the snapshot and of loading a memory mapped snapshot file.
+    """
+    game_state = create_game_state(map_size, seed)
+    results = {
+        "map_size": list(map_size),
+        "tile_count": len(game_state.tiles),
+        "pickle": time_round_trips(
+            lambda state: pickle.dumps(state, pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+            game_state,
+            repeats,
+        ),
+        "snapshot": time_round_trips(
+            snapshot.dump,
+            snapshot.load,
+            game_state,
+            repeats,
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot.bin")
+        snapshot.dump_file(game_state, path)
+        load_times = []
+        for _ in range(repeats):
+            started_at = time.perf_counter_ns()
+            snapshot.load_file(path)
+            load_times.append(time.perf_counter_ns() - started_at)
+    results["snapshot_mmap_load"] = summarize_ns(load_times)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares the game state snapshot format with pickle.",
+    )
+    parser.add_argument("--map-size", type=parse_size, default=(1000, 1000))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    json.dump(
+        benchmark_snapshot(args.map_size, args.repeats, args.seed),
+        sys.stdout,
+        indent=2,
+    )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import json
+import sys
+import time
+
+from .stats import summarize_ns
+from .synthetic import create_game_state
+from ..state.game_state import GameState
+from ..state.matter import Matter
+
+
+def get_matters_by_reflection(game_state: GameState) -> list[tuple[str, Matter]]:
+    """
+    Gets the matters of a game state by reflection, as GameState.get_matters used to.
+
+    Args:
+        game_state (GameState): The game state.
+
+    Returns:
+        list[tuple[str, Matter]]: The field name and the matter of every matter.
+    """
+    return [
+        (attr, getattr(game_state, attr))
+        for attr in dir(game_state)
+        if isinstance(getattr(game_state, attr), Matter)
+    ]
+
+
+def benchmark_get_matters(calls: int, seed: int = 0) -> dict:
+    """
+    Times GameState.get_matters against the reflection based lookup.
+
+    Args:
+        calls (int): The number of measured calls of each lookup.
+        seed (int): The seed of the synthetic game state.
+
+    Returns:
+        dict: The call times of both lookups.
+    """
+    game_state = create_game_state((40, 20), seed)
+    if game_state.get_matters() != get_matters_by_reflection(game_state):
+        raise AssertionError("The registry and reflection lookups differ")
+
+    results = {}
+    for name, get_matters in (
+        ("reflection", get_matters_by_reflection),
+        ("registry", GameState.get_matters),
+    ):
+        times = []
+        for _ in range(calls):
+            started_at = time.perf_counter_ns()
+            get_matters(game_state)
+            times.append(time.perf_counter_ns() - started_at)
+        results[name] = summarize_ns(times)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the matter lookup of GameState.",
+    )
+    parser.add_argument("--calls", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    json.dump(benchmark_get_matters(args.calls, args.seed), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from ..stats import percentile
+
+
+def summarize_ns(samples: list[int]) -> dict[str, float]:
+    """
+    Summarizes durations measured in nanoseconds.
+
+    Args:
+        samples (list[int]): The durations in nanoseconds.
+
+    Returns:
+        dict[str, float]: The mean, p50 and p99 of the durations in milliseconds.
+    """
+    return {
+        "mean_ms": sum(samples) / len(samples) / 1e6,
+        "p50_ms": percentile(samples, 50) / 1e6,
+        "p99_ms": percentile(samples, 99) / 1e6,
+    }
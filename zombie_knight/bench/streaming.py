@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+
+from .render import parse_size
+from .stats import summarize_ns
+from ..state.chunked_level import ChunkedTileGrid, ChunkCache, LevelFile, write_level
+from ..tools.generate_level import generate_level_bands
+from ..constants.physics import SIMULATION_TIMESTEP
+from ..constants.level import LEVEL_CHUNK_SIZE
+
+
+def walk_level(
+    tiles: ChunkedTileGrid,
+    speed: float,
+    viewport_size: tuple[int, int],
+    prefetch: bool,
+    memory_samples: int = 20,
+) -> dict:
+    """
+    Walks a player rect across the level from left to right while zigzagging up and down.
+    Every frame the chunks ahead are prefetched, the tiles under the player are
+    queried like for collisions and the tiles in the viewport like for rendering.
+
+    Args:
+        tiles (ChunkedTileGrid): The streamed level.
+        speed (float): The speed of the walk along each axis in pixels per second.
+        viewport_size (tuple[int, int]): The size of the camera viewport in pixels.
+        prefetch (bool): Whether to prefetch the chunks ahead of the walk.
+        memory_samples (int): The number of times the traced memory is sampled.
+
+    Returns:
+        dict: The frame times, the traced memory samples and the cache statistics.
+    """
+    world_rect = tiles.get_world_rect()
+    player_rect = pygame.Rect(0, 0, 32, 100)
+    viewport = pygame.Rect((0, 0), viewport_size)
+    step = speed * SIMULATION_TIMESTEP
+    frame_count = int((world_rect.width - player_rect.width) / step)
+    sample_every = max(frame_count // memory_samples, 1)
+    vertical_range = world_rect.height - player_rect.height
+
+    frame_times = []
+    memory = []
+    tracemalloc.start()
+    for frame in range(frame_count):
+        distance = frame * step
+        player_rect.x = round(distance)
+        player_rect.y = round(abs(distance % (2 * vertical_range) - vertical_range))
+        direction = 1 if distance % (2 * vertical_range) < vertical_range else -1
+        velocity = pygame.Vector2(speed, -speed * direction)
+        viewport.center = player_rect.center
+
+        started_at = time.perf_counter_ns()
+        if prefetch:
+            tiles.prefetch(player_rect, velocity)
+        tiles.query(player_rect)
+        tiles.query(viewport)
+        frame_times.append(time.perf_counter_ns() - started_at)
+
+        if frame % sample_every == 0:
+            memory.append(tracemalloc.get_traced_memory()[0])
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    cache = tiles.chunk_cache
+    return {
+        "frames": frame_count,
+        "frame": summarize_ns(frame_times),
+        "traced_memory": memory,
+        "traced_peak_memory": peak_memory,
+        "cached_chunks": len(cache.chunks),
+        "cache_memory": cache.get_memory(),
+        "hits": cache.hits,
+        "sync_misses": cache.misses,
+        "prefetched": cache.prefetched,
+    }
+
+
+def benchmark_streaming(
+    level_size: tuple[int, int],
+    memory_limit: int,
+    speed: float,
+    viewport_size: tuple[int, int],
+    chunk_size: int = LEVEL_CHUNK_SIZE,
+    seed: int = 0,
+) -> dict:
+    """
+    Generates a level file and walks across it with and without prefetching.
+
+    Args:
+        level_size (tuple[int, int]): The number of tile columns and rows.
+        memory_limit (int): The memory limit of the chunk cache in bytes.
+        speed (float): The speed of the walk along each axis in pixels per second.
+        viewport_size (tuple[int, int]): The size of the camera viewport in pixels.
+        chunk_size (int): The number of cells along each side of a chunk.
+        seed (int): The seed of the generated level.
+
+    Returns:
+        dict: The size of the level file and the results of both walks.
+    """
+    columns, rows = level_size
+    results = {
+        "level_size": list(level_size),
+        "tile_count": columns * rows,
+        "chunk_size": chunk_size,
+        "memory_limit": memory_limit,
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "level.zkl")
+        write_level(
+            path,
+            columns,
+            rows,
+            generate_level_bands(columns, rows, chunk_size, seed),
+            chunk_size,
+        )
+        results["file_bytes"] = os.path.getsize(path)
+
+        for name, prefetch in (("sync", False), ("prefetch", True)):
+            with ChunkedTileGrid(ChunkCache(LevelFile(path), memory_limit)) as tiles:
+                results[name] = walk_level(tiles, speed, viewport_size, prefetch)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Walks across a large streamed level and reports memory and chunk cache misses.",
+    )
+    parser.add_argument("--level-size", type=parse_size, default=(10000, 1000))
+    parser.add_argument("--memory-limit", type=int, default=1024 * 1024)
+    parser.add_argument("--speed", type=float, default=4000.0)
+    parser.add_argument("--viewport-size", type=parse_size, default=(1280, 640))
+    parser.add_argument("--chunk-size", type=int, default=LEVEL_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    json.dump(
+        benchmark_streaming(
+            args.level_size,
+            args.memory_limit,
+            args.speed,
+            args.viewport_size,
+            args.chunk_size,
+            args.seed,
+        ),
+        sys.stdout,
+        indent=2,
+    )
+    print()
+
+
+if __name__ == "__main__":
+    main()
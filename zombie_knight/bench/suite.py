@@ -0,0 +1,418 @@
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+
+import pygame
+
+from dataclasses import dataclass
+from typing import Callable
+
+from .collision import place_on_floor
+from ..stats import percentile
+from .synthetic import (
+    create_body_game_state,
+    create_crowd_game_state,
+    create_game_state,
+    create_tile_map,
+    create_zombie_game_state,
+)
+from ..board import apply_rules, create_rules
+from ..input import ScriptedKeyboard
+from ..render.camera import Camera
+from ..render.renderer import Renderer
+from ..rules.level import ChunkPrefetchRule
+from ..rules.physics.movement import GravityRule, AccelerationRule, VelocityRule
+from ..rules.physics.swept import SweptVelocityRule
+from ..rules.physics.vectorized import VectorizedMovementRule
+from ..numpy_support import np
+from ..rules.pipeline import RulePipeline
+from ..rules.player import PlayerMoveRule, PlayerJumpRule
+from ..rules.tile import CollideTileRule
+from ..rules.zombie import ZombieChaseRule, ZombiePatrolRule, ZombieDieRule
+from ..state import GameState, TileGrid, create_tiles_from_tile_map
+from ..constants.player import (
+    HORIZONTAL_ACCELERATION,
+    HORIZONTAL_FRICTION,
+    JUMP_VELOCITY,
+)
+
+
+MAP_SIZES = [(40, 20), (200, 100), (1000, 100), (2000, 500)]
+ENTITY_COUNTS = [1, 10, 100, 1000, 5000]
+RULE_ENTITY_COUNTS = [1, 1000]
+ZOMBIE_COUNTS = [100, 2000]
+RENDER_RESOLUTION = (1280, 640)
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    params: list
+    setup: Callable[..., Callable[[], object]]
+
+    def get_key(self, param) -> str:
+        """
+        Gets the key of the results of a benchmark parameter.
+
+        Args:
+            param: The parameter.
+
+        Returns:
+            str: The key, e.g. "collision.CollideTileRule[40x20]".
+        """
+        if isinstance(param, tuple) and all(isinstance(value, int) for value in param):
+            param = "x".join(map(str, param))
+        return f"{self.name}[{param}]"
+
+
+benchmarks: list[Benchmark] = []
+
+
+def benchmark(name: str, params: list) -> Callable:
+    """
+    Registers a benchmark in the suite.
+    The decorated function is called once per parameter, outside the timed
+    region, and returns the function to time.
+
+    Args:
+        name (str): The name of the benchmark.
+        params (list): The parameters to run the benchmark with.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def register(setup: Callable[..., Callable[[], object]]) -> Callable:
+        benchmarks.append(Benchmark(name, params, setup))
+        return setup
+
+    return register
+
+
+def create_rule_benchmark(
+    name: str,
+    create_rule: Callable[[], object],
+    events=(),
+    create_state: Callable[..., GameState] = create_crowd_game_state,
+) -> None:
+    """
+    Registers the benchmark of a rule applied to game states with a growing number of entities.
+
+    Args:
+        name (str): The name of the rule.
+        create_rule (Callable[[], object]): The function creating the rule.
+        events: The events passed to the rule.
+        create_state (Callable[..., GameState]): The function creating the game
+            state from a map size and an entity count.
+
+    Returns:
+        None
+    """
+
+    @benchmark(f"rules.{name}", RULE_ENTITY_COUNTS)
+    def setup(entity_count: int) -> Callable[[], object]:
+        game_state = create_state((40, 20), entity_count)
+        rule = create_rule()
+        rule_events = list(events)
+        rule(game_state, rule_events)
+        return lambda: rule(game_state, rule_events)
+
+
+create_rule_benchmark("GravityRule", GravityRule)
+create_rule_benchmark("AccelerationRule", AccelerationRule)
+create_rule_benchmark("VelocityRule", VelocityRule)
+create_rule_benchmark("SweptVelocityRule", SweptVelocityRule)
+create_rule_benchmark(
+    "PlayerMoveRule",
+    lambda: PlayerMoveRule(
+        horizontal_acceleration=HORIZONTAL_ACCELERATION,
+        horizontal_friction=HORIZONTAL_FRICTION,
+        keyboard=ScriptedKeyboard(),
+    ),
+)
+create_rule_benchmark(
+    "PlayerJumpRule",
+    lambda: PlayerJumpRule(jump_velocity=JUMP_VELOCITY),
+    [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)],
+)
+create_rule_benchmark("CollideTileRule", CollideTileRule)
+create_rule_benchmark("ChunkPrefetchRule", ChunkPrefetchRule)
+if np is not None:
+    create_rule_benchmark(
+        "VectorizedMovementRule",
+        VectorizedMovementRule,
+        create_state=create_body_game_state,
+    )
+
+
+def create_zombie_rule_benchmark(name: str, create_rule: Callable[[], object]) -> None:
+    """
+    Registers the benchmark of a zombie rule applied to hordes of growing size.
+
+    Args:
+        name (str): The name of the rule.
+        create_rule (Callable[[], object]): The function creating the rule.
+
+    Returns:
+        None
+    """
+
+    @benchmark(f"rules.{name}", ZOMBIE_COUNTS)
+    def setup(zombie_count: int) -> Callable[[], object]:
+        game_state = place_on_floor(create_zombie_game_state((200, 100), zombie_count))
+        rule = create_rule()
+        rule(game_state, [])
+        return lambda: rule(game_state, [])
+
+
+if np is not None:
+    create_zombie_rule_benchmark("ZombieChaseRule", ZombieChaseRule)
+    create_zombie_rule_benchmark("ZombiePatrolRule", ZombiePatrolRule)
+    create_zombie_rule_benchmark("ZombieDieRule", ZombieDieRule)
+
+
+@benchmark("collision.CollideTileRule", MAP_SIZES)
+def setup_collision(map_size: tuple[int, int]) -> Callable[[], object]:
+    game_state = place_on_floor(create_game_state(map_size))
+    rule = CollideTileRule()
+    rule.get_tile_index(game_state.tiles)
+    return lambda: rule(game_state, [])
+
+
+@benchmark("state.create_tiles_from_tile_map", MAP_SIZES)
+def setup_create_tiles(map_size: tuple[int, int]) -> Callable[[], object]:
+    tile_map = create_tile_map(*map_size)
+    return lambda: create_tiles_from_tile_map(tile_map)
+
+
+@benchmark("state.TileGrid.from_tile_map", MAP_SIZES)
+def setup_create_tile_grid(map_size: tuple[int, int]) -> Callable[[], object]:
+    tile_map = create_tile_map(*map_size)
+    return lambda: TileGrid.from_tile_map(tile_map)
+
+
+@benchmark("state.replace_matters", ENTITY_COUNTS)
+def setup_replace_matters(entity_count: int) -> Callable[[], object]:
+    game_state = create_crowd_game_state((40, 20), entity_count)
+    matters = [matter for _, matter in game_state.get_matters()]
+    return lambda: game_state.replace_matters(matters)
+
+
+@benchmark("render.Renderer.render", [(40, 20), (2000, 500)])
+def setup_render(map_size: tuple[int, int]) -> Callable[[], object]:
+    display = pygame.display.set_mode(RENDER_RESOLUTION)
+    # The smallest map fits the display and is drawn from a baked tile layer,
+    # larger maps are culled through a camera.
+    camera = None if map_size == (40, 20) else Camera(RENDER_RESOLUTION)
+    game_state = create_game_state(map_size)
+    # The timed frames draw the same game state, so every image they use is
+    # loaded by the first frame and the decoding threads can be stopped.
+    with Renderer(display, camera=camera) as renderer:
+        renderer.render(game_state)
+        renderer.asset_manager.wait()
+    return lambda: renderer.render(game_state)
+
+
+@benchmark("frame.apply_rules", ENTITY_COUNTS)
+def setup_apply_rules(entity_count: int) -> Callable[[], object]:
+    game_state = create_crowd_game_state((40, 20), entity_count)
+    rules = create_rules(ScriptedKeyboard())
+    apply_rules(game_state, rules, [])
+    return lambda: apply_rules(game_state, rules, [])
+
+
+@benchmark("frame.RulePipeline", ENTITY_COUNTS)
+def setup_pipeline(entity_count: int) -> Callable[[], object]:
+    game_state = create_crowd_game_state((40, 20), entity_count)
+    pipeline = RulePipeline(create_rules(ScriptedKeyboard()))
+    pipeline(game_state, [])
+    return lambda: pipeline(game_state, [])
+
+
+if np is not None:
+
+    @benchmark("frame.zombies", ZOMBIE_COUNTS)
+    def setup_zombie_frame(zombie_count: int) -> Callable[[], object]:
+        game_state = place_on_floor(create_zombie_game_state((200, 100), zombie_count))
+        pipeline = RulePipeline(create_rules(ScriptedKeyboard()))
+        pipeline(game_state, [])
+        return lambda: pipeline(game_state, [])
+
+
+def time_benchmark(
+    function: Callable[[], object],
+    repeats: int,
+    min_sample_time: float,
+) -> dict:
+    """
+    Times a function like asv does: the number of calls per sample is raised
+    until a sample takes at least min_sample_time, then the samples are timed.
+
+    Args:
+        function (Callable[[], object]): The function to time.
+        repeats (int): The number of timed samples.
+        min_sample_time (float): The minimum duration of a sample in seconds.
+
+    Returns:
+        dict: The calls per sample and the p50, min and mean time of one call in milliseconds.
+    """
+    loops = 1
+    while True:
+        started_at = time.perf_counter_ns()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter_ns() - started_at
+        if elapsed >= min_sample_time * 1e9:
+            break
+        loops *= 10 if elapsed < min_sample_time * 1e8 else 2
+
+    samples = []
+    for _ in range(repeats):
+        started_at = time.perf_counter_ns()
+        for _ in range(loops):
+            function()
+        samples.append((time.perf_counter_ns() - started_at) / loops)
+
+    return {
+        "loops": loops,
+        "repeats": repeats,
+        "p50_ms": percentile(samples, 50) / 1e6,
+        "min_ms": min(samples) / 1e6,
+        "mean_ms": sum(samples) / len(samples) / 1e6,
+    }
+
+
+def run_suite(
+    pattern: str = "",
+    repeats: int = 5,
+    min_sample_time: float = 0.05,
+) -> dict:
+    """
+    Runs the benchmarks whose keys match a pattern.
+
+    Args:
+        pattern (str): The regular expression the benchmark keys are searched with.
+        repeats (int): The number of timed samples per benchmark.
+        min_sample_time (float): The minimum duration of a sample in seconds.
+
+    Returns:
+        dict: The environment and the results by benchmark key.
+    """
+    results = {}
+    for suite_benchmark in benchmarks:
+        for param in suite_benchmark.params:
+            key = suite_benchmark.get_key(param)
+            if not re.search(pattern, key):
+                continue
+            function = suite_benchmark.setup(param)
+            results[key] = time_benchmark(function, repeats, min_sample_time)
+            print(f"{key}: {results[key]['p50_ms']:.4f} ms", file=sys.stderr)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__ if np is not None else None,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(results: dict, baseline: dict, factor: float) -> dict:
+    """
+    Compares results with a baseline saved by an earlier run.
+
+    Args:
+        results (dict): The results of run_suite.
+        baseline (dict): The results of the baseline run.
+        factor (float): The ratio of the p50 times above which a benchmark regressed,
+            and below the inverse of which it improved.
+
+    Returns:
+        dict: The ratio and status of every benchmark in both runs, and the regressed keys.
+    """
+    comparison = {}
+    for key, result in results["results"].items():
+        baseline_result = baseline["results"].get(key)
+        if baseline_result is None:
+            continue
+        ratio = result["p50_ms"] / baseline_result["p50_ms"]
+        if ratio > factor:
+            status = "regressed"
+        elif ratio < 1 / factor:
+            status = "improved"
+        else:
+            status = "unchanged"
+        comparison[key] = {
+            "baseline_ms": baseline_result["p50_ms"],
+            "current_ms": result["p50_ms"],
+            "ratio": ratio,
+            "status": status,
+        }
+
+    return {
+        "benchmarks": comparison,
+        "regressed": [
+            key for key, value in comparison.items() if value["status"] == "regressed"
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs the benchmark suite headless and compares it with a saved baseline.",
+    )
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="the regular expression selecting the benchmarks by key",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-sample-time", type=float, default=0.05)
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with a saved baseline")
+    parser.add_argument(
+        "--factor",
+        type=float,
+        default=1.25,
+        help="the slowdown ratio reported as a regression",
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmark keys")
+    args = parser.parse_args()
+
+    if args.list:
+        for suite_benchmark in benchmarks:
+            for param in suite_benchmark.params:
+                print(suite_benchmark.get_key(param))
+        return
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        results = run_suite(args.filter, args.repeats, args.min_sample_time)
+    finally:
+        pygame.quit()
+
+    if args.save is not None:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    output = results
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            output = compare_results(results, json.load(file), args.factor)
+
+    json.dump(output, sys.stdout, indent=2)
+    print()
+    if args.baseline is not None and output["regressed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import argparse
+import json
+import sys
+import time
+
+import pygame
+
+from dataclasses import replace
+
+from .render import parse_size
+from .stats import summarize_ns
+from .synthetic import create_game_state
+from ..rules.physics.movement import VelocityRule
+from ..rules.physics.swept import SweptVelocityRule
+from ..rules.pipeline import RulePipeline
+from ..rules.tile import CollideTileRule
+from ..state.game_state import GameState
+from ..constants.tile import TILE_SIZE
+
+
+def drop_player(
+    game_state: GameState,
+    rules: list,
+    speed: float,
+    frames: int,
+) -> dict:
+    """
+    Throws the player down at a constant speed from the top of the map onto the floor.
+
+    Args:
+        game_state (GameState): The game state with the player at the top of the map.
+        rules (list): The rules moving the player and resolving its collisions.
+        speed (float): The downward speed of the player in pixels per second.
+        frames (int): The number of simulated frames.
+
+    Returns:
+        dict: Whether the player ended below the floor and the frame times.
+    """
+    pipeline = RulePipeline(rules)
+    floor_top = (game_state.tiles.rows - 2) * TILE_SIZE[1]
+    velocity = pygame.Vector2(0, speed)
+
+    frame_times = []
+    for _ in range(frames):
+        game_state = replace(
+            game_state,
+            player=game_state.player.replace_velocity(velocity),
+        )
+        started_at = time.perf_counter_ns()
+        game_state = pipeline(game_state, [])
+        frame_times.append(time.perf_counter_ns() - started_at)
+
+    return {
+        "tunneled": game_state.player.rect.bottom > floor_top + TILE_SIZE[1],
+        "player_bottom": game_state.player.rect.bottom,
+        "frame_time": summarize_ns(frame_times),
+    }
+
+
+def benchmark_sweep(
+    map_size: tuple[int, int],
+    speeds: list[float],
+    frames: int,
+    seed: int = 0,
+) -> dict:
+    """
+    Compares discrete and swept tile collisions for a player falling at increasing speeds.
+    The player starts in an empty column, so it only hits the floor.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        speeds (list[float]): The downward speeds of the player in pixels per second.
+        frames (int): The number of simulated frames per speed.
+        seed (int): The seed of the synthetic game state.
+
+    Returns:
+        dict: The results of both collision modes by speed.
+    """
+    game_state = create_game_state(map_size, seed)
+    tiles = game_state.tiles
+    column = min(
+        range(tiles.columns - 1),
+        key=lambda column: sum(
+            tiles.get(column, row) is not None or tiles.get(column + 1, row) is not None
+            for row in range(tiles.rows - 2)
+        ),
+    )
+    player = game_state.player
+    game_state = replace(
+        game_state,
+        player=player.replace_position(pygame.Vector2(column * TILE_SIZE[0], 0)),
+    )
+
+    results = {"map_size": list(map_size), "column": column, "speeds": {}}
+    for speed in speeds:
+        results["speeds"][str(speed)] = {
+            "discrete": drop_player(
+                game_state,
+                [VelocityRule(), CollideTileRule()],
+                speed,
+                frames,
+            ),
+            "swept": drop_player(
+                game_state,
+                [SweptVelocityRule(), CollideTileRule()],
+                speed,
+                frames,
+            ),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compares discrete and swept tile collisions at increasing speeds.",
+    )
+    parser.add_argument("--map-size", type=parse_size, default=(200, 200))
+    parser.add_argument(
+        "--speeds",
+        type=lambda value: [float(speed) for speed in value.split(",")],
+        default=[500.0, 5000.0, 50000.0, 500000.0],
+    )
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    json.dump(
+        benchmark_sweep(args.map_size, args.speeds, args.frames, args.seed),
+        sys.stdout,
+        indent=2,
+    )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import random
+
+import pygame
+
+from dataclasses import dataclass, field, replace
+
+from ..state import (
+    GameState,
+    spawn_zombies,
+    PlayerState,
+    PlayerMode,
+    HorizontalDirection,
+    TileGrid,
+    MatterArrays,
+)
+from ..constants.tile import TILE_SIZE
+
+
+def create_tile_map(
+    width: int,
+    height: int,
+    seed: int = 0,
+    density: float = 0.15,
+) -> list[list[int]]:
+    """
+    Creates a random tile map with a solid floor and floating platforms.
+
+    Args:
+        width (int): The number of tile columns.
+        height (int): The number of tile rows.
+        seed (int): The seed of the random generator.
+        density (float): The fraction of rows above the floor that hold platforms.
+
+    Returns:
+        list[list[int]]: The tile map.
+    """
+    rng = random.Random(seed)
+    tile_map = [[0] * width for _ in range(height)]
+
+    for y in range(2, height - 2):
+        if rng.random() >= density:
+            continue
+        x = 0
+        while x < width:
+            length = rng.randint(3, 12)
+            if rng.random() < 0.5:
+                end = min(x + length, width) - 1
+                for platform_x in range(x, end + 1):
+                    tile_map[y][platform_x] = 1
+                tile_map[y][x] = 3
+                tile_map[y][end] = 4
+            x += length + rng.randint(2, 10)
+
+    for x in range(width):
+        tile_map[height - 2][x] = 1
+        tile_map[height - 1][x] = 2
+
+    return tile_map
+
+
+def create_player_states(
+    count: int,
+    world_size: tuple[int, int],
+    seed: int = 0,
+) -> list[PlayerState]:
+    """
+    Creates randomly placed and animated player states.
+
+    Args:
+        count (int): The number of player states.
+        world_size (tuple[int, int]): The size of the world in pixels.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        list[PlayerState]: The player states.
+    """
+    rng = random.Random(seed)
+    world_width, world_height = world_size
+    modes = list(PlayerMode)
+    directions = list(HorizontalDirection)
+
+    return [
+        PlayerState(
+            rect=pygame.Rect(
+                rng.randrange(max(world_width - 32, 1)),
+                rng.randrange(max(world_height - 100, 1)),
+                32,
+                100,
+            ),
+            mode=rng.choice(modes),
+            horizontal_direction=rng.choice(directions),
+            animation_index=rng.randrange(10),
+            lives=3,
+            score=0,
+            velocity=pygame.Vector2(rng.uniform(-5, 5), rng.uniform(-5, 5)),
+            acceleration=pygame.Vector2(0, 0),
+        )
+        for _ in range(count)
+    ]
+
+
+def create_game_state(
+    map_size: tuple[int, int],
+    seed: int = 0,
+) -> GameState:
+    """
+    Creates a game state over a random tile map.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        GameState: The game state.
+    """
+    width, height = map_size
+    tile_width, tile_height = TILE_SIZE
+    player = create_player_states(
+        1,
+        (width * tile_width, height * tile_height),
+        seed,
+    )[0]
+    return GameState(
+        player=player,
+        tiles=TileGrid.from_tile_map(create_tile_map(width, height, seed)),
+    )
+
+
+def create_zombie_game_state(
+    map_size: tuple[int, int],
+    zombie_count: int,
+    seed: int = 0,
+) -> GameState:
+    """
+    Creates a game state over a random tile map with a horde of zombies on its floors.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        zombie_count (int): The number of zombies.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        GameState: The game state.
+    """
+    game_state = create_game_state(map_size, seed)
+    return replace(
+        game_state,
+        zombies=spawn_zombies(game_state.tiles, zombie_count, seed),
+    )
+
+
+@dataclass
+class CrowdGameState(GameState):
+    crowd: list[PlayerState] = field(default_factory=list)
+
+
+def create_crowd_game_state(
+    map_size: tuple[int, int],
+    entity_count: int,
+    seed: int = 0,
+) -> CrowdGameState:
+    """
+    Creates a game state over a random tile map holding a crowd of entities besides the player.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        entity_count (int): The number of entities, including the player.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        CrowdGameState: The game state.
+    """
+    game_state = create_game_state(map_size, seed)
+    width, height = map_size
+    tile_width, tile_height = TILE_SIZE
+    return CrowdGameState(
+        player=game_state.player,
+        tiles=game_state.tiles,
+        crowd=create_player_states(
+            entity_count - 1,
+            (width * tile_width, height * tile_height),
+            seed + 1,
+        ),
+    )
+
+
+@dataclass
+class BodyGameState(GameState):
+    bodies: MatterArrays | None = None
+
+
+def create_body_game_state(
+    map_size: tuple[int, int],
+    entity_count: int,
+    seed: int = 0,
+) -> BodyGameState:
+    """
+    Creates the game state of create_crowd_game_state with the crowd stored as matter arrays.
+
+    Args:
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        entity_count (int): The number of entities, including the player.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        BodyGameState: The game state.
+    """
+    game_state = create_crowd_game_state(map_size, entity_count, seed)
+    return BodyGameState(
+        player=game_state.player,
+        tiles=game_state.tiles,
+        bodies=MatterArrays.from_matters(game_state.crowd),
+    )
@@ -0,0 +1,81 @@
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from ..vec_env import ACTION_KEYS, VectorEnv
+
+
+def benchmark_vec_env(
+    worker_count: int,
+    envs_per_worker: int,
+    steps: int,
+    frame_skip: int = 4,
+    seed: int = 0,
+) -> dict:
+    """
+    Times the steps of a vectorized environment with random actions.
+
+    Args:
+        worker_count (int): The number of worker processes.
+        envs_per_worker (int): The number of game instances of every worker.
+        steps (int): The number of measured steps.
+        frame_skip (int): The number of frames every action is repeated for.
+        seed (int): The seed of the random actions.
+
+    Returns:
+        dict: The worker count, the instance count and the simulated frames per second.
+    """
+    rng = np.random.default_rng(seed)
+    env_count = worker_count * envs_per_worker
+    env = VectorEnv(env_count, worker_count, frame_skip=frame_skip)
+    try:
+        env.reset()
+        env.step(np.zeros(env_count, dtype=np.int64))
+
+        started_at = time.perf_counter()
+        for _ in range(steps):
+            env.step(rng.integers(len(ACTION_KEYS), size=env_count))
+        elapsed = time.perf_counter() - started_at
+    finally:
+        env.close()
+
+    frames = steps * env_count * frame_skip
+    return {
+        "worker_count": worker_count,
+        "env_count": env_count,
+        "frames": frames,
+        "elapsed": elapsed,
+        "frames_per_second": frames / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the throughput of the vectorized environment.",
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--envs-per-worker", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--frame-skip", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = [
+        benchmark_vec_env(
+            worker_count,
+            args.envs_per_worker,
+            args.steps,
+            args.frame_skip,
+            args.seed,
+        )
+        for worker_count in args.workers
+    ]
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
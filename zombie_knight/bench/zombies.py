@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import pygame
+
+from .collision import place_on_floor
+from .render import parse_size
+from .stats import summarize_ns
+from ..stats import percentile
+from .synthetic import create_zombie_game_state
+from ..board import create_rules
+from ..input import ScriptedKeyboard
+from ..render.camera import Camera
+from ..render.renderer import Renderer
+from ..rules.pipeline import RulePipeline
+from ..state.zombie import ZombieMode
+from ..constants.physics import SIMULATION_TIMESTEP
+
+
+FRAME_BUDGET_MS = 1000 / 40
+
+
+def benchmark_zombies(
+    zombie_count: int,
+    map_size: tuple[int, int],
+    resolution: tuple[int, int],
+    frames: int,
+    warmup_frames: int = 20,
+    seed: int = 0,
+) -> dict:
+    """
+    Runs the game rules and renders through a camera with a horde of zombies and times every frame.
+    A frame simulates the steps of a frame at 40 frames per second, the rate
+    the game loop ticks at, so the frame time is compared with its 25 ms budget.
+
+    Args:
+        zombie_count (int): The number of zombies spawned on the floors of the map.
+        map_size (tuple[int, int]): The number of tile columns and rows.
+        resolution (tuple[int, int]): The size of the display.
+        frames (int): The number of measured frames.
+        warmup_frames (int): The number of frames run before measuring.
+        seed (int): The seed of the synthetic game state and of the spawned zombies.
+
+    Returns:
+        dict: The configuration, the zombie counts, and the frame, simulation and render times.
+    """
+    display = pygame.display.set_mode(resolution)
+    with Renderer(display, camera=Camera(resolution)) as renderer:
+        game_state = place_on_floor(create_zombie_game_state(map_size, zombie_count, seed))
+        step = RulePipeline(create_rules(ScriptedKeyboard()))
+        steps_per_frame = round(FRAME_BUDGET_MS / 1000 / SIMULATION_TIMESTEP)
+
+        simulation_times: list[int] = []
+        render_times: list[int] = []
+        visible_counts: list[int] = []
+        for frame in range(warmup_frames + frames):
+            started_at = time.perf_counter_ns()
+            for _ in range(steps_per_frame):
+                game_state = step(game_state, [])
+            simulated_at = time.perf_counter_ns()
+            renderer.render(game_state)
+            rendered_at = time.perf_counter_ns()
+            visible_counts.append(len(renderer.sprite_rects) - 1)
+            if frame < warmup_frames:
+                continue
+            simulation_times.append(simulated_at - started_at)
+            render_times.append(rendered_at - simulated_at)
+
+    frame_times = [
+        simulation_time + render_time
+        for simulation_time, render_time in zip(simulation_times, render_times)
+    ]
+    zombies = game_state.zombies
+    return {
+        "config": {
+            "zombie_count": zombie_count,
+            "map_size": list(map_size),
+            "resolution": list(resolution),
+            "frames": frames,
+            "steps_per_frame": steps_per_frame,
+            "seed": seed,
+        },
+        "zombies": {
+            "active": len(zombies),
+            "chasing": int((zombies.modes == ZombieMode.CHASING.value).sum()),
+            "visible_p50": percentile(visible_counts, 50),
+        },
+        "budget_ms": FRAME_BUDGET_MS,
+        "frame_time": {
+            **summarize_ns(frame_times),
+            "max_ms": max(frame_times) / 1e6,
+        },
+        "within_budget": percentile(frame_times, 99) / 1e6 < FRAME_BUDGET_MS,
+        "simulation_time": summarize_ns(simulation_times),
+        "render_time": summarize_ns(render_times),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the zombie rules and rendering against the 25 ms frame budget.",
+    )
+    parser.add_argument("--zombies", type=int, nargs="+", default=[2000])
+    parser.add_argument("--map-size", type=parse_size, default=(200, 100))
+    parser.add_argument("--resolution", type=parse_size, default=(1280, 640))
+    parser.add_argument("--frames", type=int, default=400)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        results = [
+            benchmark_zombies(
+                zombie_count,
+                args.map_size,
+                args.resolution,
+                args.frames,
+                seed=args.seed,
+            )
+            for zombie_count in args.zombies
+        ]
+    finally:
+        pygame.quit()
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    if not all(result["within_budget"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,192 @@
+import argparse
+import time
+
 import pygame
 
+from .assets import AssetManager, list_animation_frame_paths
+from .input import Keyboard, PygameKeyboard
+from .loop import FixedTimestepLoop
+from .profiling import Profiler
+from .telemetry import TelemetryWriter, create_sink
+from .recording import InputRecorder
 from .render.renderer import Renderer
+from .render.camera import Camera
 from .state import (
     GameState,
     PlayerState,
     PlayerMode,
     HorizontalDirection,
-    create_tiles_from_tile_map,
+    TileGrid,
+    ChunkedTileGrid,
+    ZombieHorde,
+    spawn_zombies,
 )
 from .rules.physics.movement import (
     GravityRule,
     AccelerationRule,
     VelocityRule,
 )
+from .rules.physics.swept import SweptVelocityRule
 from .rules.tile import CollideTileRule
+from .rules.level import ChunkPrefetchRule
+from .rules.pipeline import RulePipeline
 from .rules.player import PlayerMoveRule, PlayerJumpRule
+from .rules.zombie import ZombieChaseRule, ZombiePatrolRule, ZombieDieRule
+from .numpy_support import np
 from .constants.tile import TILE_MAP
-from .constants.player import HORIZONTAL_ACCELERATION, HORIZONTAL_FRICTION
+from .constants.player import (
+    HORIZONTAL_ACCELERATION,
+    HORIZONTAL_FRICTION,
+    JUMP_VELOCITY,
+)
+from .constants.zombie import ZOMBIE_SPAWN_COUNT, ZOMBIE_SPAWN_AREA
+from .constants.physics import MAX_RENDER_RATE
+from .constants.paths import STREAMED_ANIMATION_DIRECTORIES, SOUND_PATHS
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Zombie Knight")
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record the input of the session to replay it with zombie_knight.replay",
+    )
+    parser.add_argument(
+        "--level",
+        metavar="PATH",
+        help="stream the tiles from a chunked level file, e.g. made by zombie_knight.tools.generate_level",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="time every rule and render stage and write the frame time breakdown to a JSON file",
+    )
+    parser.add_argument(
+        "--telemetry",
+        metavar="TARGET",
+        help="stream a record of every frame to a file, udp://host:port or unix:///path",
+    )
+    args = parser.parse_args()
+
     pygame.init()
 
     display = pygame.display.set_mode((1280, 640))
+
+    asset_manager = AssetManager()
+    renderer = Renderer(
+        display,
+        dirty_rects=True,
+        asset_manager=asset_manager,
+        camera=Camera(display.get_size()),
+    )
+    stream_assets(asset_manager, renderer)
+    profiler = Profiler(enabled=args.profile is not None)
+    profiler.instrument(renderer)
+    tiles = ChunkedTileGrid.open(args.level) if args.level is not None else None
+    telemetry: TelemetryWriter | None = None
+    try:
+        if args.telemetry is not None:
+            telemetry = TelemetryWriter(create_sink(args.telemetry))
+        run(args, renderer, profiler, create_game_state(tiles), telemetry)
+    finally:
+        # The level, the telemetry and the asset manager hold threads and
+        # files, which are released however the game ends.
+        if telemetry is not None:
+            telemetry.close()
+        if tiles is not None:
+            tiles.close()
+        asset_manager.shutdown()
+        pygame.quit()
+
+
+def run(
+    args: argparse.Namespace,
+    renderer: Renderer,
+    profiler: Profiler,
+    game_state: GameState,
+    telemetry: TelemetryWriter | None,
+) -> None:
+    """
+    Runs the game loop until the window is closed.
+
+    Args:
+        args (argparse.Namespace): The command line arguments of the game.
+        renderer (Renderer): The renderer drawing the game states.
+        profiler (Profiler): The profiler timing the rules and the frames.
+        game_state (GameState): The initial game state.
+        telemetry (TelemetryWriter | None): The writer streaming the frame records, if any.
+
+    Returns:
+        None
+    """
     clock = pygame.time.Clock()
+    keyboard = PygameKeyboard()
+    step = RulePipeline(profiler.profile_rules(create_rules(keyboard)))
+    if args.record is not None:
+        step = InputRecorder(step, keyboard, level_path=args.level)
+    loop = FixedTimestepLoop(game_state, step)
+    frame = 0
+    clock.tick()
 
-    renderer = Renderer(display)
-    game_state = GameState(
+    while True:
+        events = list(pygame.event.get())
+        for event in events:
+            if event.type == pygame.QUIT:
+                if args.record is not None:
+                    step.save(args.record)
+                if args.profile is not None:
+                    profiler.dump(args.profile)
+                return
+
+        # The frame cap sleeps in tick, so it is called before the timers start.
+        elapsed = clock.tick(MAX_RENDER_RATE) / 1000
+        simulation_started_at = time.perf_counter_ns()
+        with profiler.measure("frame.simulate"):
+            steps = loop.advance(elapsed, events)
+
+        render_started_at = time.perf_counter_ns()
+        with profiler.measure("frame.render"):
+            render_state = loop.get_render_state()
+            changed_rects = renderer.render(render_state)
+            pygame.display.update(changed_rects)
+
+        if telemetry is not None:
+            telemetry.submit_frame(
+                frame,
+                steps,
+                render_started_at - simulation_started_at,
+                time.perf_counter_ns() - render_started_at,
+                clock.get_fps(),
+                render_state,
+            )
+        frame += 1
+
+
+def create_game_state(tiles: TileGrid | ChunkedTileGrid | None = None) -> GameState:
+    """
+    Creates the game state the game starts with.
+    Zombies are spawned on the floors of the level when numpy, which the
+    zombie horde is stored in, is installed. On a streamed level they are
+    spawned in the area at its top left around the player.
+
+    Args:
+        tiles (TileGrid | ChunkedTileGrid | None): The tiles of the level, the
+            built-in tile map by default.
+
+    Returns:
+        GameState: The initial game state.
+    """
+    tiles = tiles if tiles is not None else TileGrid.from_tile_map(TILE_MAP)
+    zombies: ZombieHorde | None = None
+    if np is not None:
+        spawn_grid = (
+            tiles.get_region(*ZOMBIE_SPAWN_AREA)
+            if isinstance(tiles, ChunkedTileGrid)
+            else tiles
+        )
+        zombies = spawn_zombies(spawn_grid, ZOMBIE_SPAWN_COUNT)
+
+    return GameState(
         player=PlayerState(
             rect=pygame.Rect(0, 0, 32, 100),
             mode=PlayerMode.IDLE,
@@ -37,33 +197,61 @@ def main():
             velocity=pygame.Vector2(0, 0),
             acceleration=pygame.Vector2(0, 0),
         ),
-        tiles=create_tiles_from_tile_map(TILE_MAP),
+        tiles=tiles,
+        zombies=zombies,
     )
 
-    rules = [
+
+def create_rules(
+    keyboard: Keyboard | None = None,
+    continuous_collision: bool = False,
+) -> list:
+    """
+    Creates the rules of the game in the order they are applied every simulation step.
+
+    Args:
+        keyboard (Keyboard | None): The keyboard the player is controlled with,
+            the pygame keyboard by default.
+        continuous_collision (bool): Whether collidables are swept through the
+            tiles as they move, so they cannot pass through tiles at high speeds.
+
+    Returns:
+        list: The rules of the game.
+    """
+    return [
         GravityRule(),
         AccelerationRule(),
-        VelocityRule(),
+        SweptVelocityRule() if continuous_collision else VelocityRule(),
         PlayerMoveRule(
             horizontal_acceleration=HORIZONTAL_ACCELERATION,
             horizontal_friction=HORIZONTAL_FRICTION,
+            keyboard=keyboard,
         ),
-        PlayerJumpRule(jump_velocity=10),
+        PlayerJumpRule(jump_velocity=JUMP_VELOCITY),
         CollideTileRule(),
+        ZombieChaseRule(),
+        ZombiePatrolRule(),
+        ZombieDieRule(),
+        ChunkPrefetchRule(),
     ]
 
-    while True:
-        events = list(pygame.event.get())
-        for event in events:
-            if event.type == pygame.QUIT:
-                pygame.quit()
 
-        renderer.render(game_state)
-        pygame.display.update()
+def stream_assets(asset_manager: AssetManager, renderer: Renderer) -> None:
+    """
+    Requests the assets that are not needed for the first frame.
+    They are decoded in the background after the assets requested by the renderer.
 
-        game_state = apply_rules(game_state, rules, events)
+    Args:
+        asset_manager (AssetManager): The asset manager to load the assets with.
+        renderer (Renderer): The renderer whose texture atlas may already hold the animations.
 
-        clock.tick(40)
+    Returns:
+        None
+    """
+    if renderer.texture_atlas is None:
+        for directory in STREAMED_ANIMATION_DIRECTORIES:
+            asset_manager.load_images(list_animation_frame_paths(directory))
+    asset_manager.load_sounds(SOUND_PATHS)
 
 
 def apply_rules(
@@ -0,0 +1 @@
+ASSET_LOADER_WORKERS = 4
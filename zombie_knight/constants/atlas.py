@@ -0,0 +1,2 @@
+ATLAS_MAX_SIZE = (4096, 4096)
+ATLAS_INDEX_VERSION = 1
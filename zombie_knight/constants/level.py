@@ -0,0 +1,4 @@
+LEVEL_CHUNK_SIZE = 64
+CHUNK_CACHE_MEMORY_LIMIT = 4 * 1024 * 1024
+CHUNK_PREFETCH_WORKERS = 1
+CHUNK_PREFETCH_LOOKAHEAD = 1.0
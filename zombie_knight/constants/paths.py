@@ -57,3 +57,45 @@ PLAYER_JUMP_IMAGE_PATHS = [
     "./assets/images/player/jump/Jump (9).png",
     "./assets/images/player/jump/Jump (10).png",
 ]
+
+IMAGES_DIRECTORY = "./assets/images"
+ATLAS_DIRECTORY = "./assets/atlases"
+ATLAS_INDEX_PATH = "./assets/atlases/index.json"
+
+ZOMBIE_BOY_WALK_IMAGE_DIRECTORY = "./assets/images/zombie/boy/walk"
+ZOMBIE_BOY_DEAD_IMAGE_DIRECTORY = "./assets/images/zombie/boy/dead"
+ZOMBIE_GIRL_WALK_IMAGE_DIRECTORY = "./assets/images/zombie/girl/walk"
+ZOMBIE_GIRL_DEAD_IMAGE_DIRECTORY = "./assets/images/zombie/girl/dead"
+GREEN_PORTAL_IMAGE_DIRECTORY = "./assets/images/portals/green"
+PURPLE_PORTAL_IMAGE_DIRECTORY = "./assets/images/portals/purple"
+RUBY_IMAGE_DIRECTORY = "./assets/images/ruby"
+
+JUMP_SOUND_PATH = "./assets/sounds/jump_sound.wav"
+LOST_RUBY_SOUND_PATH = "./assets/sounds/lost_ruby.wav"
+PLAYER_HIT_SOUND_PATH = "./assets/sounds/player_hit.wav"
+PORTAL_SOUND_PATH = "./assets/sounds/portal_sound.wav"
+RUBY_PICKUP_SOUND_PATH = "./assets/sounds/ruby_pickup.wav"
+SLASH_SOUND_PATH = "./assets/sounds/slash_sound.wav"
+ZOMBIE_HIT_SOUND_PATH = "./assets/sounds/zombie_hit.wav"
+ZOMBIE_KICK_SOUND_PATH = "./assets/sounds/zombie_kick.wav"
+
+SOUND_PATHS = [
+    JUMP_SOUND_PATH,
+    LOST_RUBY_SOUND_PATH,
+    PLAYER_HIT_SOUND_PATH,
+    PORTAL_SOUND_PATH,
+    RUBY_PICKUP_SOUND_PATH,
+    SLASH_SOUND_PATH,
+    ZOMBIE_HIT_SOUND_PATH,
+    ZOMBIE_KICK_SOUND_PATH,
+]
+
+STREAMED_ANIMATION_DIRECTORIES = [
+    ZOMBIE_BOY_WALK_IMAGE_DIRECTORY,
+    ZOMBIE_GIRL_WALK_IMAGE_DIRECTORY,
+    ZOMBIE_BOY_DEAD_IMAGE_DIRECTORY,
+    ZOMBIE_GIRL_DEAD_IMAGE_DIRECTORY,
+    GREEN_PORTAL_IMAGE_DIRECTORY,
+    PURPLE_PORTAL_IMAGE_DIRECTORY,
+    RUBY_IMAGE_DIRECTORY,
+]
@@ -1 +1,9 @@
-GRAVITY_ACCELERATION_CONST = 0.25
+# Accelerations are in pixels per second squared and times in seconds.
+GRAVITY_ACCELERATION_CONST = 400.0
+
+SIMULATION_TIMESTEP = 1 / 120
+MAX_CATCH_UP_STEPS = 8
+
+# Rendering is capped at the refresh rate of common displays, so the game loop
+# sleeps between frames instead of spinning at full CPU.
+MAX_RENDER_RATE = 60
@@ -1,2 +1,7 @@
-HORIZONTAL_ACCELERATION = 1.0
-HORIZONTAL_FRICTION = 0.1
+# Accelerations are in pixels per second squared, velocities in pixels per second
+# and the friction in 1 / second.
+HORIZONTAL_ACCELERATION = 1600.0
+HORIZONTAL_FRICTION = 4.0
+JUMP_VELOCITY = 400.0
+
+PLAYER_FRAME_CACHE_MEMORY_LIMIT = 16 * 1024 * 1024
@@ -0,0 +1,13 @@
+PROFILE_WINDOW = 1024
+
+RENDERER_STAGES = (
+    "render",
+    "render_dirty",
+    "restore_region",
+    "render_background",
+    "render_tiles",
+    "bake_tiles",
+    "render_sprites",
+    "render_zombies",
+    "render_player",
+)
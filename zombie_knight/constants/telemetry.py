@@ -0,0 +1,2 @@
+TELEMETRY_QUEUE_SIZE = 4096
+TELEMETRY_SPIKE_FACTOR = 3.0
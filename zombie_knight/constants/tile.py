@@ -1,4 +1,6 @@
 TILE_SIZE = (32, 32)
+DENSE_TILE_INDEX_MAX_CELLS = 4_000_000
+COLLIDER_STRIP_ROWS = 16
 
 TILE_MAP = [
     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
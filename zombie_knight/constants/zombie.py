@@ -0,0 +1,12 @@
+# Speeds are in pixels per second, distances and sizes in pixels and times in seconds.
+ZOMBIE_SIZE = (32, 64)
+ZOMBIE_WALK_SPEED = 40.0
+ZOMBIE_CHASE_SPEED = 90.0
+ZOMBIE_CHASE_DISTANCE = 320.0
+ZOMBIE_HIT_REACH = 32
+ZOMBIE_ANIMATION_FPS = 12.0
+ZOMBIE_DEATH_TIME = 1.5
+ZOMBIE_SPAWN_COUNT = 8
+# Zombies are spawned on the floors of this many columns and rows of cells at
+# the top left of a streamed level, around the player, so only those chunks are read.
+ZOMBIE_SPAWN_AREA = (64, 64)
@@ -0,0 +1,72 @@
+import pygame
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+
+class PressedKeys:
+    def __init__(self, keys: Iterable[int] = ()) -> None:
+        """
+        Initializes the pressed keys.
+        Like the result of pygame.key.get_pressed, they are indexed by key code.
+
+        Args:
+            keys (Iterable[int]): The key codes of the pressed keys.
+
+        Returns:
+            None
+        """
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class Keyboard(ABC):
+    @abstractmethod
+    def get_pressed(self) -> PressedKeys | pygame.key.ScancodeWrapper:
+        """
+        Gets the state of all keys.
+
+        Returns:
+            PressedKeys | pygame.key.ScancodeWrapper: Whether each key, indexed by key code, is pressed.
+        """
+        pass
+
+
+class PygameKeyboard(Keyboard):
+    def get_pressed(self) -> pygame.key.ScancodeWrapper:
+        return pygame.key.get_pressed()
+
+
+class ScriptedKeyboard(Keyboard):
+    def __init__(self) -> None:
+        """
+        Initializes the scripted keyboard, a keyboard whose keys are pressed by code.
+
+        Returns:
+            None
+        """
+        self.pressed_keys = PressedKeys()
+
+    def get_pressed(self) -> PressedKeys:
+        return self.pressed_keys
+
+    def press(self, keys: Iterable[int]) -> None:
+        """
+        Sets the keys held down, releasing every other key.
+
+        Args:
+            keys (Iterable[int]): The key codes of the pressed keys.
+
+        Returns:
+            None
+        """
+        self.pressed_keys = PressedKeys(keys)
+
+
+@dataclass(frozen=True)
+class FrameInput:
+    pressed_keys: frozenset[int] = frozenset()
+    events: list[pygame.event.Event] = field(default_factory=list)
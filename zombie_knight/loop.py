@@ -0,0 +1,199 @@
+import pygame
+
+from dataclasses import replace
+from typing import Callable
+
+from .state.game_state import GameState
+from .state.matter_arrays import MatterArrays
+from .state.zombie import ZombieHorde
+from .state.fields import get_entity_fields
+from .constants.physics import SIMULATION_TIMESTEP, MAX_CATCH_UP_STEPS
+
+
+class FixedTimestepLoop:
+    def __init__(
+        self,
+        game_state: GameState,
+        step: Callable[[GameState, list[pygame.event.Event]], GameState],
+        timestep: float = SIMULATION_TIMESTEP,
+        max_catch_up_steps: int = MAX_CATCH_UP_STEPS,
+    ) -> None:
+        """
+        Initializes the fixed timestep loop.
+        The rules are applied in steps of a fixed simulated time, however long
+        the rendered frames take. The real time passed since the last step is
+        kept in an accumulator and rendering interpolates between the last two
+        simulated states by the fraction of a step it holds.
+
+        Args:
+            game_state (GameState): The initial game state.
+            step (Callable[[GameState, list[pygame.event.Event]], GameState]): The function
+                applying the rules to a game state, e.g. a RulePipeline.
+            timestep (float): The simulated time of one step in seconds.
+            max_catch_up_steps (int): The maximum number of steps run for one frame.
+                Time the simulation could not catch up with is dropped.
+
+        Returns:
+            None
+        """
+        self.step = step
+        self.timestep = timestep
+        self.max_catch_up_steps = max_catch_up_steps
+        self.previous_game_state = game_state
+        self.game_state = game_state
+        self.accumulator = 0.0
+        self.pending_events: list[pygame.event.Event] = []
+
+    def advance(
+        self,
+        elapsed: float,
+        events: list[pygame.event.Event],
+    ) -> int:
+        """
+        Advances the simulation by the real time passed since the last frame.
+        The events are handed to the next step, so none are lost when a frame
+        runs no step, and none are seen twice when it runs several.
+
+        Args:
+            elapsed (float): The real time passed since the last frame in seconds.
+            events (list[pygame.event.Event]): The events occurred in the frame.
+
+        Returns:
+            int: The number of steps run.
+        """
+        self.accumulator += elapsed
+        self.pending_events += events
+
+        steps = 0
+        while self.accumulator >= self.timestep and steps < self.max_catch_up_steps:
+            self.previous_game_state = self.game_state
+            self.game_state = self.step(self.game_state, self.pending_events)
+            self.pending_events = []
+            self.accumulator -= self.timestep
+            steps += 1
+
+        if self.accumulator >= self.timestep:
+            self.accumulator %= self.timestep
+
+        return steps
+
+    def get_interpolation_factor(self) -> float:
+        """
+        Gets the fraction of a step the accumulator holds.
+
+        Returns:
+            float: The interpolation factor between 0 and 1.
+        """
+        return self.accumulator / self.timestep
+
+    def get_render_state(self) -> GameState:
+        """
+        Gets the game state to render, interpolated between the last two simulated states.
+
+        Returns:
+            GameState: The interpolated game state.
+        """
+        return interpolate_game_state(
+            self.previous_game_state,
+            self.game_state,
+            self.get_interpolation_factor(),
+        )
+
+
+def interpolate_game_state(
+    previous_game_state: GameState,
+    game_state: GameState,
+    factor: float,
+) -> GameState:
+    """
+    Interpolates the positions of the matters, zombies and matter arrays of two consecutive game states.
+    Matters are paired in the order of get_matters and the rows of the arrays
+    by index, so the bodies that do not line up between the two states, e.g.
+    right after a dead zombie is removed from the horde, are not interpolated.
+
+    Args:
+        previous_game_state (GameState): The game state of the previous step.
+        game_state (GameState): The game state of the current step.
+        factor (float): The interpolation factor, 0 for the previous and 1 for the current state.
+
+    Returns:
+        GameState: The game state with the interpolated positions.
+    """
+    if previous_game_state is game_state:
+        return game_state
+
+    changes = {}
+    previous_horde = previous_game_state.zombies
+    horde = game_state.zombies
+    if are_rows_aligned(previous_horde, horde):
+        changes["zombies"] = horde.replace_arrays(
+            positions=lerp(previous_horde.positions, horde.positions, factor)
+        )
+    for field in get_entity_fields(type(game_state)).matter_arrays_fields:
+        previous_arrays = getattr(previous_game_state, field)
+        arrays = getattr(game_state, field)
+        if are_rows_aligned(previous_arrays, arrays):
+            changes[field] = MatterArrays(
+                lerp(previous_arrays.positions, arrays.positions, factor),
+                arrays.velocities,
+                arrays.accelerations,
+            )
+    if changes:
+        game_state = replace(game_state, **changes)
+
+    previous_matters = previous_game_state.get_matters()
+    matters = game_state.get_matters()
+    if [field for field, _ in previous_matters] != [field for field, _ in matters]:
+        return game_state
+
+    return game_state.replace_matters(
+        [
+            matter.replace_position(
+                previous_matter.get_position().lerp(matter.get_position(), factor)
+            )
+            for (_, previous_matter), (_, matter) in zip(previous_matters, matters)
+        ]
+    )
+
+
+def are_rows_aligned(
+    previous_arrays: ZombieHorde | MatterArrays | None,
+    arrays: ZombieHorde | MatterArrays | None,
+) -> bool:
+    """
+    Checks if the rows of the arrays of two consecutive states hold the same bodies.
+    Bodies are only ever removed from arrays, so arrays of the same length hold
+    the same bodies in the same rows.
+
+    Args:
+        previous_arrays (ZombieHorde | MatterArrays | None): The arrays of the previous step.
+        arrays (ZombieHorde | MatterArrays | None): The arrays of the current step.
+
+    Returns:
+        bool: True if both states hold different arrays of the same length, False otherwise.
+    """
+    return (
+        previous_arrays is not None
+        and arrays is not None
+        and previous_arrays is not arrays
+        and len(previous_arrays) == len(arrays)
+    )
+
+
+def lerp(
+    previous_positions: "np.ndarray",
+    positions: "np.ndarray",
+    factor: float,
+) -> "np.ndarray":
+    """
+    Interpolates two arrays of positions.
+
+    Args:
+        previous_positions (np.ndarray): The positions of the previous step.
+        positions (np.ndarray): The positions of the current step.
+        factor (float): The interpolation factor, 0 for the previous and 1 for the current positions.
+
+    Returns:
+        np.ndarray: The interpolated positions.
+    """
+    return previous_positions + (positions - previous_positions) * factor
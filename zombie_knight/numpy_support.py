@@ -0,0 +1,18 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def require_numpy(feature: str) -> None:
+    """
+    Raises an ImportError if NumPy, an optional dependency of a feature, is missing.
+
+    Args:
+        feature (str): The feature using NumPy, e.g. "the zombie horde".
+
+    Returns:
+        None
+    """
+    if np is None:
+        raise ImportError(f"NumPy is required by {feature}")
@@ -0,0 +1,314 @@
+import functools
+import json
+import time
+
+import pygame
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator
+
+from .stats import percentile
+from .rules.pipeline import EntityStep
+from .state.game_state import GameState
+from .constants.profiling import PROFILE_WINDOW, RENDERER_STAGES
+
+
+class RollingHistogram:
+    def __init__(self, window: int = PROFILE_WINDOW) -> None:
+        """
+        Initializes the rolling histogram, holding the latest durations of a timed section.
+
+        Args:
+            window (int): The number of latest durations kept.
+
+        Returns:
+            None
+        """
+        self.samples: deque[int] = deque(maxlen=window)
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        """
+        Records a duration.
+
+        Args:
+            duration_ns (int): The duration in nanoseconds.
+
+        Returns:
+            None
+        """
+        self.samples.append(duration_ns)
+        self.count += 1
+        self.total_ns += duration_ns
+
+    def summarize(self) -> dict[str, float]:
+        """
+        Summarizes the durations in the window.
+
+        Returns:
+            dict[str, float]: The number of recorded durations, their total in
+                milliseconds, and the mean, p50, p95, p99 and max of the window
+                in milliseconds.
+        """
+        samples = list(self.samples)
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_ms": sum(samples) / len(samples) / 1e6,
+            "p50_ms": percentile(samples, 50) / 1e6,
+            "p95_ms": percentile(samples, 95) / 1e6,
+            "p99_ms": percentile(samples, 99) / 1e6,
+            "max_ms": max(samples) / 1e6,
+        }
+
+
+class Profiler:
+    def __init__(self, enabled: bool = True, window: int = PROFILE_WINDOW) -> None:
+        """
+        Initializes the profiler.
+        Sections are timed with perf_counter_ns and their durations are kept in
+        a rolling histogram per name. A disabled profiler returns the rules and
+        functions it is asked to wrap unchanged, so it costs nothing per call.
+
+        Args:
+            enabled (bool): Whether sections are timed.
+            window (int): The number of latest durations kept per section.
+
+        Returns:
+            None
+        """
+        self.enabled = enabled
+        self.window = window
+        self.histograms: dict[str, RollingHistogram] = {}
+
+    def record(self, name: str, duration_ns: int) -> None:
+        """
+        Records the duration of a section.
+
+        Args:
+            name (str): The name of the section.
+            duration_ns (int): The duration in nanoseconds.
+
+        Returns:
+            None
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = RollingHistogram(self.window)
+        histogram.record(duration_ns)
+
+    def measure(self, name: str):
+        """
+        Times the body of a with statement.
+
+        Args:
+            name (str): The name of the section.
+
+        Returns:
+            The context manager timing the section, or a no-op one when disabled.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.measure_section(name)
+
+    @contextmanager
+    def measure_section(self, name: str) -> Iterator[None]:
+        """
+        Times the body of a with statement, even when it raises.
+
+        Args:
+            name (str): The name of the section.
+
+        Returns:
+            Iterator[None]: The generator of the context manager.
+        """
+        started_at = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - started_at)
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """
+        Wraps a function so every call is timed.
+
+        Args:
+            name (str): The name of the section.
+            function (Callable): The function to time.
+
+        Returns:
+            Callable: The timed function, or the function itself when disabled.
+        """
+        if not self.enabled:
+            return function
+
+        record = self.record
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            started_at = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter_ns() - started_at)
+
+        return timed
+
+    def profile_rules(self, rules: list) -> list:
+        """
+        Wraps rules so their calls are timed under the name of their class.
+        Rules a rule pipeline fuses stay fusable, and then the setup of their
+        step and its application to every entity are added up into one
+        duration per frame, like the whole call of a rule that is not fused.
+
+        Args:
+            rules (list): The rules.
+
+        Returns:
+            list: The timed rules, or the rules themselves when disabled.
+        """
+        if not self.enabled:
+            return rules
+        return [
+            (ProfiledEntityRule if hasattr(rule, "get_entity_step") else ProfiledRule)(
+                rule, self
+            )
+            for rule in rules
+        ]
+
+    def instrument(
+        self,
+        target: object,
+        method_names: tuple[str, ...] = RENDERER_STAGES,
+        prefix: str | None = None,
+    ) -> None:
+        """
+        Times methods of an object, e.g. the stages of a Renderer, by shadowing them on the instance.
+        Calls between the methods of the object go through the instance, so
+        nested stages are timed too, each including the stages it calls.
+
+        Args:
+            target (object): The object, e.g. a Renderer.
+            method_names (tuple[str, ...]): The names of the methods to time.
+            prefix (str | None): The prefix of the section names, the class name by default.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+        prefix = prefix if prefix is not None else type(target).__name__
+        for method_name in method_names:
+            setattr(
+                target,
+                method_name,
+                self.wrap(f"{prefix}.{method_name}", getattr(target, method_name)),
+            )
+
+    def summarize(self) -> dict[str, dict[str, float]]:
+        """
+        Summarizes the durations of every section.
+
+        Returns:
+            dict[str, dict[str, float]]: The summary of every section by name.
+        """
+        return {
+            name: histogram.summarize()
+            for name, histogram in sorted(self.histograms.items())
+        }
+
+    def dump(self, path: str) -> None:
+        """
+        Writes the summary of every section to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        with open(path, "w") as file:
+            json.dump(self.summarize(), file, indent=2)
+
+    def reset(self) -> None:
+        """
+        Drops the recorded durations.
+
+        Returns:
+            None
+        """
+        self.histograms.clear()
+
+
+class ProfiledRule:
+    def __init__(self, rule, profiler: Profiler, name: str | None = None) -> None:
+        """
+        Initializes the profiled rule, a rule whose calls are timed.
+
+        Args:
+            rule: The rule.
+            profiler (Profiler): The profiler recording the durations.
+            name (str | None): The name of the section, the class name of the rule by default.
+
+        Returns:
+            None
+        """
+        self.rule = rule
+        self.profiler = profiler
+        self.name = name if name is not None else type(rule).__name__
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        started_at = time.perf_counter_ns()
+        try:
+            return self.rule(game_state, events)
+        finally:
+            self.profiler.record(self.name, time.perf_counter_ns() - started_at)
+
+
+class ProfiledEntityRule(ProfiledRule):
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the entity step of the rule, timed as a whole once per frame.
+        The duration of the setup of the step and of its application to every
+        entity is recorded when the pipeline finishes the pass.
+
+        Args:
+            game_state (GameState): The game state the rule is applied to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The timed entity step.
+        """
+        perf_counter_ns = time.perf_counter_ns
+        started_at = perf_counter_ns()
+        step = self.rule.get_entity_step(game_state, events)
+        apply = step.apply
+        duration_ns = perf_counter_ns() - started_at
+
+        def timed_apply(entity):
+            nonlocal duration_ns
+            started_at = perf_counter_ns()
+            try:
+                return apply(entity)
+            finally:
+                duration_ns += perf_counter_ns() - started_at
+
+        def finish():
+            nonlocal duration_ns
+            if step.finish is not None:
+                started_at = perf_counter_ns()
+                step.finish()
+                duration_ns += perf_counter_ns() - started_at
+            self.profiler.record(self.name, duration_ns)
+
+        return EntityStep(timed_apply, step.entity_type, step.field, finish)
@@ -0,0 +1,377 @@
+import dataclasses
+import hashlib
+import os
+import struct
+
+import pygame
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Iterator
+
+from .input import FrameInput, Keyboard
+from .state.game_state import GameState
+from .state.tile_grid import TileGrid
+from .state.fields import get_entity_fields
+from .constants.physics import SIMULATION_TIMESTEP
+
+
+RECORDING_MAGIC = b"ZKIR"
+RECORDING_VERSION = 2
+RECORDING_HEADER = struct.Struct("<4sHdQ16s")
+
+HORDE_ARRAY_NAMES = ("positions", "directions", "kinds", "modes", "animation_times")
+MATTER_ARRAY_NAMES = ("positions", "velocities", "accelerations")
+
+LEFT_BIT = 1
+RIGHT_BIT = 2
+JUMP_BIT = 4
+
+
+@dataclass
+class InputRecording:
+    timestep: float = SIMULATION_TIMESTEP
+    runs: list[list[int]] = field(default_factory=list)
+    frame_count: int = 0
+    final_state_hash: bytes = bytes(16)
+    level_path: str | None = None
+
+    def append(self, mask: int) -> None:
+        """
+        Appends the input mask of a frame, extending the last run if the mask did not change.
+
+        Args:
+            mask (int): The input mask of the frame.
+
+        Returns:
+            None
+        """
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.frame_count += 1
+
+    def iter_masks(self) -> Iterator[int]:
+        """
+        Iterates over the input mask of every frame.
+
+        Returns:
+            Iterator[int]: The input masks in frame order.
+        """
+        for mask, length in self.runs:
+            for _ in range(length):
+                yield mask
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the recording as a header followed by the level path and (mask, varint length) runs.
+        The level path is stored as its varint length and UTF-8 bytes, with a
+        length of 0 for the built-in tile map.
+
+        Returns:
+            bytes: The encoded recording.
+        """
+        data = bytearray(
+            RECORDING_HEADER.pack(
+                RECORDING_MAGIC,
+                RECORDING_VERSION,
+                self.timestep,
+                self.frame_count,
+                self.final_state_hash,
+            )
+        )
+        level_path = self.level_path.encode() if self.level_path is not None else b""
+        encode_varint(len(level_path), data)
+        data += level_path
+        for mask, length in self.runs:
+            data.append(mask)
+            encode_varint(length, data)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "InputRecording":
+        """
+        Decodes a recording encoded by to_bytes.
+
+        Args:
+            data (bytes): The encoded recording.
+
+        Returns:
+            InputRecording: The recording.
+        """
+        magic, version, timestep, frame_count, final_state_hash = (
+            RECORDING_HEADER.unpack_from(data)
+        )
+        if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+            raise ValueError("Unsupported input recording")
+
+        try:
+            level_path_length, position = decode_varint(data, RECORDING_HEADER.size)
+            level_path = data[position : position + level_path_length].decode()
+            position += level_path_length
+
+            recording = cls(
+                timestep=timestep,
+                final_state_hash=final_state_hash,
+                level_path=level_path or None,
+            )
+            while position < len(data):
+                mask = data[position]
+                length, position = decode_varint(data, position + 1)
+                recording.runs.append([mask, length])
+                recording.frame_count += length
+        except IndexError:
+            # A varint cut off by the end of the data.
+            raise ValueError("Truncated input recording") from None
+
+        if position != len(data) or recording.frame_count != frame_count:
+            raise ValueError("Truncated input recording")
+        return recording
+
+    def save(self, path: str) -> None:
+        """
+        Saves the recording to a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "InputRecording":
+        """
+        Loads a recording from a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            InputRecording: The recording.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class InputRecorder:
+    def __init__(
+        self,
+        step: Callable[[GameState, list[pygame.event.Event]], GameState],
+        keyboard: Keyboard,
+        timestep: float = SIMULATION_TIMESTEP,
+        level_path: str | None = None,
+    ) -> None:
+        """
+        Initializes the input recorder.
+        The recorder wraps the function applying the rules and records the keys
+        held and the jump events of every step right before it is applied.
+
+        Args:
+            step (Callable[[GameState, list[pygame.event.Event]], GameState]): The function
+                applying the rules to a game state, e.g. a RulePipeline.
+            keyboard (Keyboard): The keyboard the rules read the pressed keys from.
+            timestep (float): The simulated time of one step in seconds.
+            level_path (str | None): The path of the chunked level file played,
+                or None for the built-in tile map. It is stored as an absolute path.
+
+        Returns:
+            None
+        """
+        self.step = step
+        self.keyboard = keyboard
+        self.recording = InputRecording(
+            timestep=timestep,
+            level_path=os.path.abspath(level_path) if level_path is not None else None,
+        )
+        self.game_state: GameState | None = None
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Records the input of a step and applies the rules.
+
+        Args:
+            game_state (GameState): The game state to apply the rules to.
+            events (list[pygame.event.Event]): The events of the step.
+
+        Returns:
+            GameState: The new game state.
+        """
+        self.recording.append(encode_frame_input(self.keyboard.get_pressed(), events))
+        self.game_state = self.step(game_state, events)
+        return self.game_state
+
+    def save(self, path: str) -> None:
+        """
+        Saves the recording with the hash of the last recorded game state.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        if self.game_state is not None:
+            self.recording.final_state_hash = hash_game_state(self.game_state)
+        self.recording.save(path)
+
+
+def encode_frame_input(pressed_keys, events: list[pygame.event.Event]) -> int:
+    """
+    Encodes the input the rules read in a frame as a bit mask.
+
+    Args:
+        pressed_keys: The pressed keys, indexed by key code.
+        events (list[pygame.event.Event]): The events of the frame.
+
+    Returns:
+        int: The input mask.
+    """
+    mask = 0
+    if pressed_keys[pygame.K_LEFT]:
+        mask |= LEFT_BIT
+    if pressed_keys[pygame.K_RIGHT]:
+        mask |= RIGHT_BIT
+    if any(
+        event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE for event in events
+    ):
+        mask |= JUMP_BIT
+    return mask
+
+
+def decode_frame_input(mask: int) -> FrameInput:
+    """
+    Decodes an input mask into the input of a frame.
+
+    Args:
+        mask (int): The input mask.
+
+    Returns:
+        FrameInput: The pressed keys and events of the frame.
+    """
+    pressed_keys = set()
+    if mask & LEFT_BIT:
+        pressed_keys.add(pygame.K_LEFT)
+    if mask & RIGHT_BIT:
+        pressed_keys.add(pygame.K_RIGHT)
+    events = []
+    if mask & JUMP_BIT:
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+    return FrameInput(frozenset(pressed_keys), events)
+
+
+def encode_varint(value: int, data: bytearray) -> None:
+    """
+    Appends an unsigned integer in LEB128 encoding, 7 bits per byte.
+
+    Args:
+        value (int): The integer.
+        data (bytearray): The buffer to append to.
+
+    Returns:
+        None
+    """
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def decode_varint(data: bytes, position: int) -> tuple[int, int]:
+    """
+    Reads an unsigned integer in LEB128 encoding.
+
+    Args:
+        data (bytes): The buffer.
+        position (int): The position of the first byte of the integer.
+
+    Returns:
+        tuple[int, int]: The integer and the position after it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def hash_game_state(game_state: GameState) -> bytes:
+    """
+    Hashes the matters, the zombie horde and the tiles of a game state, including their exact positions.
+    The cells of a TileGrid are hashed as they are. A ChunkedTileGrid is never
+    changed and reading all of its chunks would defeat streaming, so only its
+    size is hashed, and the recording names its level file instead.
+
+    Args:
+        game_state (GameState): The game state.
+
+    Returns:
+        bytes: The 16 byte hash.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name, matter in game_state.get_matters():
+        digest.update(name.encode())
+        for matter_field in dataclasses.fields(matter):
+            digest.update(get_value_bytes(getattr(matter, matter_field.name)))
+    for name in get_entity_fields(type(game_state)).matter_arrays_fields:
+        update_array_digest(digest, name, getattr(game_state, name), MATTER_ARRAY_NAMES)
+    update_array_digest(digest, "zombies", game_state.zombies, HORDE_ARRAY_NAMES)
+
+    tiles = game_state.tiles
+    digest.update(struct.pack("<II", tiles.columns, tiles.rows))
+    if isinstance(tiles, TileGrid):
+        digest.update(tiles.cells)
+    return digest.digest()
+
+
+def update_array_digest(digest, name: str, holder, array_names: tuple[str, ...]) -> None:
+    """
+    Adds the exact bytes of the arrays of an entity stored as arrays to a hash.
+
+    Args:
+        digest: The hash, e.g. a blake2b object.
+        name (str): The game state field holding the entity.
+        holder: The entity holding the arrays, e.g. a ZombieHorde, or None.
+        array_names (tuple[str, ...]): The names of the arrays to hash.
+
+    Returns:
+        None
+    """
+    digest.update(name.encode())
+    if holder is None:
+        return
+    for array_name in array_names:
+        array = getattr(holder, array_name)
+        digest.update(struct.pack("<Q", array.size))
+        digest.update(array.tobytes())
+
+
+def get_value_bytes(value) -> bytes:
+    """
+    Gets the exact bytes of a field value of a matter for hashing.
+    Vectors are hashed by the bits of their floats, which their repr rounds.
+
+    Args:
+        value: The field value.
+
+    Returns:
+        bytes: The bytes of the value.
+    """
+    if isinstance(value, pygame.Vector2):
+        return struct.pack("<2d", value.x, value.y)
+    if isinstance(value, pygame.Rect):
+        return struct.pack("<4q", *value)
+    if isinstance(value, Enum):
+        return repr(value.value).encode()
+    return repr(value).encode()
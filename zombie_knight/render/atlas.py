@@ -0,0 +1,129 @@
+import json
+import os
+
+import pygame
+
+from ..assets import AssetManager, AssetHandle
+from ..constants.atlas import ATLAS_INDEX_VERSION
+from ..constants.paths import ATLAS_INDEX_PATH
+
+
+class TextureAtlas:
+    def __init__(
+        self,
+        asset_manager: AssetManager,
+        index_path: str = ATLAS_INDEX_PATH,
+        priority_animations: list[str] | None = None,
+    ) -> None:
+        """
+        Initializes the texture atlas.
+        Every atlas image is decoded once and frames are served as subsurface
+        views, so they share the pixels of their atlas. The atlases holding the
+        priority animations are requested from the asset manager first.
+
+        Args:
+            asset_manager (AssetManager): The asset manager to decode the atlases with.
+            index_path (str): The path of the atlas index written by tools.pack_atlas.
+            priority_animations (list[str] | None): The animations needed first.
+
+        Returns:
+            None
+        """
+        with open(index_path) as index_file:
+            index = json.load(index_file)
+
+        if index["version"] != ATLAS_INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported atlas index version {index['version']} in {index_path}"
+            )
+
+        self.frame_rects: dict[str, list[tuple[int, pygame.Rect]]] = {
+            animation: [
+                (atlas_index, pygame.Rect(x, y, width, height))
+                for atlas_index, x, y, width, height in frames
+            ]
+            for animation, frames in index["animations"].items()
+        }
+        self.animations: dict[str, list[pygame.Surface]] = {}
+
+        atlas_indices = [
+            atlas_index
+            for animation in priority_animations or []
+            if animation in self.frame_rects
+            for atlas_index, _ in self.frame_rects[animation]
+        ]
+        atlas_indices += range(len(index["atlases"]))
+
+        atlas_directory = os.path.dirname(index_path)
+        atlas_handles: dict[int, AssetHandle[pygame.Surface]] = {}
+        for atlas_index in atlas_indices:
+            if atlas_index not in atlas_handles:
+                atlas_handles[atlas_index] = asset_manager.load_image(
+                    os.path.join(atlas_directory, index["atlases"][atlas_index])
+                )
+        self.atlases = [atlas_handles[i] for i in range(len(index["atlases"]))]
+
+    def has_animation(self, animation: str) -> bool:
+        """
+        Checks if the atlas holds an animation.
+
+        Args:
+            animation (str): The animation name, e.g. "player/idle".
+
+        Returns:
+            bool: True if the atlas holds the animation, False otherwise.
+        """
+        return animation in self.frame_rects
+
+    def get_frames(self, animation: str) -> list[pygame.Surface]:
+        """
+        Gets the frames of an animation, waiting for their atlases to be decoded if needed.
+
+        Args:
+            animation (str): The animation name, e.g. "player/idle".
+
+        Returns:
+            list[pygame.Surface]: The frames of the animation in order.
+        """
+        frames = self.animations.get(animation)
+        if frames is None:
+            frames = [
+                self.atlases[atlas_index].get().subsurface(rect)
+                for atlas_index, rect in self.frame_rects[animation]
+            ]
+            self.animations[animation] = frames
+        return frames
+
+    def get_frame(self, animation: str, frame_index: int) -> pygame.Surface:
+        """
+        Gets a frame of an animation.
+
+        Args:
+            animation (str): The animation name, e.g. "player/idle".
+            frame_index (int): The index of the frame.
+
+        Returns:
+            pygame.Surface: The frame as a view into its atlas.
+        """
+        return self.get_frames(animation)[frame_index]
+
+
+def load_texture_atlas(
+    asset_manager: AssetManager,
+    index_path: str = ATLAS_INDEX_PATH,
+    priority_animations: list[str] | None = None,
+) -> TextureAtlas | None:
+    """
+    Loads the texture atlas if it has been built.
+
+    Args:
+        asset_manager (AssetManager): The asset manager to decode the atlases with.
+        index_path (str): The path of the atlas index.
+        priority_animations (list[str] | None): The animations needed first.
+
+    Returns:
+        TextureAtlas | None: The texture atlas or None if no atlas has been built.
+    """
+    if not os.path.exists(index_path):
+        return None
+    return TextureAtlas(asset_manager, index_path, priority_animations)
@@ -0,0 +1,60 @@
+import pygame
+
+
+class Camera:
+    def __init__(
+        self,
+        size: tuple[int, int],
+    ) -> None:
+        """
+        Initializes the camera.
+
+        Args:
+            size (tuple[int, int]): The size of the viewport in pixels.
+
+        Returns:
+            None
+        """
+        self.rect = pygame.Rect((0, 0), size)
+
+    def follow(
+        self,
+        target_rect: pygame.Rect,
+        world_rect: pygame.Rect,
+    ) -> None:
+        """
+        Centers the viewport on a target, keeping it inside the world where possible.
+
+        Args:
+            target_rect (pygame.Rect): The rect to follow in world coordinates.
+            world_rect (pygame.Rect): The rect of the world in pixels.
+
+        Returns:
+            None
+        """
+        self.rect.center = target_rect.center
+        self.rect.clamp_ip(world_rect)
+
+    def to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Converts a rect from world to screen coordinates.
+
+        Args:
+            rect (pygame.Rect): The rect in world coordinates.
+
+        Returns:
+            pygame.Rect: The rect in screen coordinates.
+        """
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def to_world(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Converts a rect from screen to world coordinates.
+
+        Args:
+            rect (pygame.Rect): The rect in screen coordinates.
+
+        Returns:
+            pygame.Rect: The rect in world coordinates.
+        """
+        return rect.move(self.rect.x, self.rect.y)
@@ -1,5 +1,9 @@
 import pygame
 
+from collections import OrderedDict
+
+from .atlas import TextureAtlas
+from ..assets import AssetManager, AssetHandle
 from ..state.player import PlayerState, PlayerMode
 from ..state.direction import HorizontalDirection
 from ..constants.paths import (
@@ -8,6 +12,7 @@ from ..constants.paths import (
     PLAYER_JUMP_IMAGE_PATHS,
     PLAYER_RUN_IMAGE_PATHS,
 )
+from ..constants.player import PLAYER_FRAME_CACHE_MEMORY_LIMIT
 
 
 player_mode_to_images = {
@@ -17,33 +22,59 @@ player_mode_to_images = {
     PlayerMode.RUNNING: PLAYER_RUN_IMAGE_PATHS,
 }
 
+player_mode_to_animation = {
+    PlayerMode.ATTACKING: "player/attack",
+    PlayerMode.IDLE: "player/idle",
+    PlayerMode.JUMPING: "player/jump",
+    PlayerMode.RUNNING: "player/run",
+}
 
-class Player(pygame.sprite.Sprite):
+player_mode_load_order = [
+    PlayerMode.IDLE,
+    PlayerMode.RUNNING,
+    PlayerMode.JUMPING,
+    PlayerMode.ATTACKING,
+]
+
+
+FrameKey = tuple[PlayerMode, HorizontalDirection, int, int, int]
+
+
+class PlayerFrameCache:
     def __init__(
         self,
-        player_state: PlayerState,
+        asset_manager: AssetManager,
+        memory_limit: int = PLAYER_FRAME_CACHE_MEMORY_LIMIT,
+        atlas: TextureAtlas | None = None,
     ) -> None:
         """
-        Initializes the player.
+        Initializes the player frame cache.
+        Every player animation frame is decoded once in the background, idle and
+        running frames first. Scaled frames are produced on demand and evicted in
+        LRU order once the memory limit is hit. Animations found in the atlas are
+        taken from it instead of their PNG files.
 
         Args:
-            player_state (PlayerState): The state of the player.
+            asset_manager (AssetManager): The asset manager to decode frames with.
+            memory_limit (int): The maximum number of bytes held by scaled frames.
+            atlas (TextureAtlas | None): The texture atlas to take source frames from.
 
         Returns:
             None
         """
-        super().__init__()
-
-        self.rect = player_state.rect
-        self.image = self.load_image(
-            player_state.mode,
-            player_state.horizontal_direction,
-            player_state.animation_index,
-            self.rect.width,
-            self.rect.height,
-        )
+        self.memory_limit = memory_limit
+        self.memory_usage = 0
+        self.atlas = atlas
+        self.source_frame_handles: dict[
+            PlayerMode, list[AssetHandle[pygame.Surface]]
+        ] = {
+            player_mode: asset_manager.load_images(player_mode_to_images[player_mode])
+            for player_mode in player_mode_load_order
+            if not self.has_atlas_animation(player_mode)
+        }
+        self.frames: OrderedDict[FrameKey, pygame.Surface] = OrderedDict()
 
-    def load_image(
+    def get(
         self,
         player_mode: PlayerMode,
         horizontal_direction: HorizontalDirection,
@@ -52,22 +83,146 @@ class Player(pygame.sprite.Sprite):
         height: int,
     ) -> pygame.Surface:
         """
-        Loads the image of the player.
+        Gets a scaled animation frame of the player.
 
         Args:
             player_mode (PlayerMode): The mode of the player.
+            horizontal_direction (HorizontalDirection): The direction the player faces.
             animation_index (int): The index of the animation.
-            width (int): The width of the image.
-            height (int): The height of the image.
+            width (int): The width of the frame.
+            height (int): The height of the frame.
 
         Returns:
-            pygame.Surface: The image of the player.
+            pygame.Surface: The scaled animation frame.
         """
-        image_path = player_mode_to_images[player_mode][animation_index]
-        image = pygame.image.load(image_path)
-        image = pygame.transform.scale(image, (width, height))
+        key = (player_mode, horizontal_direction, animation_index, width, height)
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+            return frame
+
+        self.add_frames(player_mode, animation_index, width, height)
+        return self.frames[key]
+
+    def add_frames(
+        self,
+        player_mode: PlayerMode,
+        animation_index: int,
+        width: int,
+        height: int,
+    ) -> None:
+        """
+        Scales a source frame and stores both its right and left facing copies.
+
+        Args:
+            player_mode (PlayerMode): The mode of the player.
+            animation_index (int): The index of the animation.
+            width (int): The width of the frame.
+            height (int): The height of the frame.
+
+        Returns:
+            None
+        """
+        source_frame = self.get_source_frame(player_mode, animation_index)
+        right_frame = pygame.transform.scale(source_frame, (width, height))
+        left_frame = pygame.transform.flip(right_frame, True, False)
+
+        for horizontal_direction, frame in (
+            (HorizontalDirection.RIGHT, right_frame),
+            (HorizontalDirection.LEFT, left_frame),
+        ):
+            key = (player_mode, horizontal_direction, animation_index, width, height)
+            self.frames[key] = frame
+            self.memory_usage += get_surface_size(frame)
+
+        self.evict()
+
+    def get_source_frame(
+        self,
+        player_mode: PlayerMode,
+        animation_index: int,
+    ) -> pygame.Surface:
+        """
+        Gets an unscaled animation frame, waiting for it to be decoded if needed.
+
+        Args:
+            player_mode (PlayerMode): The mode of the player.
+            animation_index (int): The index of the animation.
+
+        Returns:
+            pygame.Surface: The unscaled animation frame.
+        """
+        if self.has_atlas_animation(player_mode):
+            return self.atlas.get_frame(
+                player_mode_to_animation[player_mode],
+                animation_index,
+            )
+        return self.source_frame_handles[player_mode][animation_index].get()
+
+    def has_atlas_animation(self, player_mode: PlayerMode) -> bool:
+        """
+        Checks if the frames of a player mode are taken from the atlas.
+
+        Args:
+            player_mode (PlayerMode): The mode of the player.
+
+        Returns:
+            bool: True if the atlas holds the animation of the player mode, False otherwise.
+        """
+        return self.atlas is not None and self.atlas.has_animation(
+            player_mode_to_animation[player_mode]
+        )
+
+    def evict(self) -> None:
+        """
+        Evicts the least recently used frames until the cache fits its memory limit.
+        The most recently added pair of frames is always kept.
+
+        Returns:
+            None
+        """
+        while self.memory_usage > self.memory_limit and len(self.frames) > 2:
+            _, frame = self.frames.popitem(last=False)
+            self.memory_usage -= get_surface_size(frame)
+
+
+class Player(pygame.sprite.Sprite):
+    def __init__(
+        self,
+        player_state: PlayerState,
+        frame_cache: PlayerFrameCache,
+    ) -> None:
+        """
+        Initializes the player.
+
+        Args:
+            player_state (PlayerState): The state of the player.
+            frame_cache (PlayerFrameCache): The cache to take animation frames from.
+
+        Returns:
+            None
+        """
+        super().__init__()
+
+        self.rect = player_state.rect
+        self.image = frame_cache.get(
+            player_state.mode,
+            player_state.horizontal_direction,
+            player_state.animation_index,
+            self.rect.width,
+            self.rect.height,
+        )
+
+
+def get_surface_size(surface: pygame.Surface) -> int:
+    """
+    Gets the number of bytes used by the pixels of a surface.
 
-        if horizontal_direction == HorizontalDirection.LEFT:
-            image = pygame.transform.flip(image, True, False)
+    Args:
+        surface (pygame.Surface): The surface to measure.
 
-        return image
+    Returns:
+        int: The number of bytes used by the pixels of the surface.
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
@@ -1,31 +1,199 @@
+from __future__ import annotations
+
 import pygame
 
-from .tile import create_tile_sprites
-from .player import Player
+from itertools import zip_longest
+
+from .tile import create_tile_blits
+from .atlas import load_texture_atlas
+from .camera import Camera
+from .zombie import ZombieFrameCache
+from .player import (
+    Player,
+    PlayerFrameCache,
+    player_mode_load_order,
+    player_mode_to_animation,
+)
+from ..assets import AssetManager
 from ..state.game_state import GameState
 from ..state.tile import TileState
+from ..state.tile_index import TileIndex, create_tile_index
+from ..state.chunked_level import ChunkedTileGrid
 from ..state.player import PlayerState
+from ..state.zombie import ZombieHorde, ZombieMode
+from ..numpy_support import np
 from ..constants.paths import BACKGROUND_IMAGE_PATH
+from ..constants.zombie import ZOMBIE_ANIMATION_FPS
 
 
 class Renderer:
     def __init__(
         self,
         display: pygame.Surface,
+        dirty_rects: bool = False,
+        asset_manager: AssetManager | None = None,
+        camera: Camera | None = None,
     ) -> None:
+        """
+        Initializes the renderer.
+
+        Args:
+            display (pygame.Surface): The surface to render on.
+            dirty_rects (bool): Whether to redraw and report only the regions that changed.
+            asset_manager (AssetManager | None): The asset manager to load images with.
+                Without one the renderer creates its own, whose decoding threads
+                are stopped by close.
+            camera (Camera | None): The camera following the player through a world
+                larger than the display. Without a camera the world is drawn at the
+                origin from a baked tile layer.
+
+        Returns:
+            None
+        """
         self.display = display
+        self.dirty_rects = dirty_rects
+        self.camera = camera
+        self.owns_asset_manager = asset_manager is None
+        self.asset_manager = asset_manager if asset_manager is not None else AssetManager()
+        background_image_handle = self.asset_manager.load_image(
+            BACKGROUND_IMAGE_PATH,
+            alpha=False,
+        )
+        self.texture_atlas = load_texture_atlas(
+            self.asset_manager,
+            priority_animations=[
+                player_mode_to_animation[player_mode]
+                for player_mode in player_mode_load_order
+            ],
+        )
+        self.player_frame_cache = PlayerFrameCache(
+            self.asset_manager,
+            atlas=self.texture_atlas,
+        )
+        self.zombie_frame_cache = ZombieFrameCache(
+            self.asset_manager,
+            atlas=self.texture_atlas,
+        )
         self.background_image = pygame.transform.scale(
-            pygame.image.load(BACKGROUND_IMAGE_PATH),
+            background_image_handle.get(),
             self.display.get_size(),
         )
+        self.tile_layer = pygame.Surface(self.display.get_size(), pygame.SRCALPHA)
+        self.baked_tile_states: list[TileState] | None = None
+        self.tile_index: TileIndex | None = None
+        self.rendered_tile_states: list[TileState] | None = None
+        self.rendered_camera_position: tuple[int, int] | None = None
+        self.sprite_rects: list[pygame.Rect] = []
+        self.pixels_pushed = 0
+
+    def close(self) -> None:
+        """
+        Stops the decoding threads of the asset manager if the renderer created it.
+        An asset manager passed to the renderer is shut down by its owner.
+
+        Returns:
+            None
+        """
+        if self.owns_asset_manager:
+            self.asset_manager.shutdown()
+
+    def __enter__(self) -> Renderer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def render(
         self,
         game_state: GameState,
-    ) -> None:
+    ) -> list[pygame.Rect]:
+        """
+        Renders the game state.
+
+        Args:
+            game_state (GameState): The game state to render.
+
+        Returns:
+            list[pygame.Rect]: The regions of the display that changed and have to be updated.
+        """
+        camera_position = None
+        if self.camera is not None:
+            self.camera.follow(
+                game_state.player.rect,
+                self.get_tile_index(game_state.tiles).get_world_rect(),
+            )
+            camera_position = self.camera.rect.topleft
+
+        if (
+            self.dirty_rects
+            and self.sprite_rects
+            and game_state.tiles is self.rendered_tile_states
+            and camera_position == self.rendered_camera_position
+        ):
+            return self.render_dirty(game_state)
+
         self.render_background()
         self.render_tiles(game_state.tiles)
-        self.render_player(game_state.player)
+        self.sprite_rects = self.render_sprites(game_state)
+        self.rendered_tile_states = game_state.tiles
+        self.rendered_camera_position = camera_position
+
+        changed_rects = [self.display.get_rect()]
+        self.pixels_pushed = get_rects_area(changed_rects)
+        return changed_rects
+
+    def render_dirty(
+        self,
+        game_state: GameState,
+    ) -> list[pygame.Rect]:
+        """
+        Renders only the regions covered by the sprites in the previous and current frame.
+
+        Args:
+            game_state (GameState): The game state to render.
+
+        Returns:
+            list[pygame.Rect]: The regions of the display that changed and have to be updated.
+        """
+        previous_sprite_rects = self.sprite_rects
+        for rect in previous_sprite_rects:
+            self.restore_region(rect)
+
+        self.sprite_rects = self.render_sprites(game_state)
+
+        display_rect = self.display.get_rect()
+        changed_rects = []
+        for previous_rect, rect in zip_longest(previous_sprite_rects, self.sprite_rects):
+            if previous_rect is None:
+                changed_rects.append(rect.clip(display_rect))
+            elif rect is None:
+                changed_rects.append(previous_rect.clip(display_rect))
+            elif previous_rect.colliderect(rect):
+                changed_rects.append(previous_rect.union(rect).clip(display_rect))
+            else:
+                changed_rects += [rect.clip(display_rect), previous_rect.clip(display_rect)]
+        self.pixels_pushed = get_rects_area(changed_rects)
+        return changed_rects
+
+    def restore_region(self, rect: pygame.Rect) -> None:
+        """
+        Redraws the background and the tiles inside a region of the display.
+
+        Args:
+            rect (pygame.Rect): The region to restore.
+
+        Returns:
+            None
+        """
+        self.display.blit(self.background_image, rect, rect)
+        if self.uses_tile_layer(self.rendered_tile_states):
+            x, y = self.get_tile_layer_position()
+            self.display.blit(self.tile_layer, rect, rect.move(-x, -y))
+            return
+
+        self.display.set_clip(rect)
+        self.render_visible_tiles(self.rendered_tile_states, self.camera.to_world(rect))
+        self.display.set_clip(None)
 
     def render_background(self) -> None:
         self.display.blit(self.background_image, (0, 0))
@@ -34,10 +202,221 @@ class Renderer:
         self,
         tile_states: list[TileState],
     ) -> None:
-        tile_sprites = create_tile_sprites(tile_states)
-        for tile in tile_sprites:
-            self.display.blit(tile.image, tile.rect)
+        """
+        Renders the tiles from the baked tile layer when the world fits in it,
+        otherwise only the tiles inside the camera viewport.
+        Tile lists are treated as immutable, so the layer is only rebaked when
+        the game state holds a different list object.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            None
+        """
+        if not self.uses_tile_layer(tile_states):
+            self.render_visible_tiles(tile_states, self.camera.rect)
+            return
+
+        if tile_states is not self.baked_tile_states:
+            self.bake_tiles(tile_states)
+        self.display.blit(self.tile_layer, self.get_tile_layer_position())
+
+    def uses_tile_layer(self, tile_states: list[TileState]) -> bool:
+        """
+        Checks if the tiles are drawn from the baked tile layer.
+        The layer has the size of the display, so it is only used when the whole
+        world fits in it. Baking reads every tile, so streamed levels are never baked.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            bool: True if the tiles are drawn from the tile layer, False otherwise.
+        """
+        if isinstance(tile_states, ChunkedTileGrid):
+            return False
+        if self.camera is None:
+            return True
+        world_rect = self.get_tile_index(tile_states).get_world_rect()
+        return self.tile_layer.get_rect().contains(world_rect)
+
+    def get_tile_layer_position(self) -> tuple[int, int]:
+        """
+        Gets the position of the baked tile layer on the display.
+
+        Returns:
+            tuple[int, int]: The position of the world origin on the display.
+        """
+        if self.camera is None:
+            return 0, 0
+        return -self.camera.rect.x, -self.camera.rect.y
+
+    def render_visible_tiles(
+        self,
+        tile_states: list[TileState],
+        world_rect: pygame.Rect,
+    ) -> None:
+        """
+        Renders the tiles overlapping a region of the world through the camera.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+            world_rect (pygame.Rect): The region of the world to render.
+
+        Returns:
+            None
+        """
+        visible_tiles = self.get_tile_index(tile_states).query(world_rect)
+        self.display.blits(
+            create_tile_blits(visible_tiles, (-self.camera.rect.x, -self.camera.rect.y)),
+            doreturn=False,
+        )
+
+    def get_tile_index(self, tile_states: list[TileState]) -> TileIndex:
+        """
+        Gets the grid index of the tiles, rebuilding it when the tile list changed.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            TileIndex: The grid index of the tiles.
+        """
+        if self.tile_index is None or self.tile_index.tiles is not tile_states:
+            self.tile_index = create_tile_index(tile_states)
+        return self.tile_index
+
+    def bake_tiles(
+        self,
+        tile_states: list[TileState],
+    ) -> None:
+        """
+        Draws the tiles into the tile layer.
+        When only a few tiles differ from the baked ones, only their regions are redrawn.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            None
+        """
+        if self.baked_tile_states is None:
+            self.tile_layer.fill((0, 0, 0, 0))
+            self.tile_layer.blits(create_tile_blits(tile_states), doreturn=False)
+        else:
+            self.update_tile_layer(self.baked_tile_states, tile_states)
+
+        self.baked_tile_states = tile_states
+
+    def update_tile_layer(
+        self,
+        old_tile_states: list[TileState],
+        new_tile_states: list[TileState],
+    ) -> None:
+        """
+        Redraws the regions of the tile layer where the tiles changed.
+
+        Args:
+            old_tile_states (list[TileState]): The baked list of tile states.
+            new_tile_states (list[TileState]): The new list of tile states.
+
+        Returns:
+            None
+        """
+        changed_rects = [
+            tile.rect
+            for tile in set(old_tile_states).symmetric_difference(new_tile_states)
+        ]
+        if not changed_rects:
+            return
+
+        for rect in changed_rects:
+            self.tile_layer.fill((0, 0, 0, 0), rect)
+
+        redrawn_tiles = [
+            tile
+            for tile in new_tile_states
+            if tile.rect.collidelist(changed_rects) != -1
+        ]
+        self.tile_layer.blits(create_tile_blits(redrawn_tiles), doreturn=False)
+
+    def render_sprites(self, game_state: GameState) -> list[pygame.Rect]:
+        """
+        Renders the zombies and then the player on top of them.
+
+        Args:
+            game_state (GameState): The game state to render.
+
+        Returns:
+            list[pygame.Rect]: The regions of the display covered by the sprites.
+        """
+        return self.render_zombies(game_state.zombies) + [
+            self.render_player(game_state.player)
+        ]
+
+    def render_zombies(self, zombie_horde: ZombieHorde | None) -> list[pygame.Rect]:
+        """
+        Renders the zombies of a horde with one batched blit.
+        The zombies outside the display are culled with array operations, so
+        only the visible zombies are looked at one by one.
+
+        Args:
+            zombie_horde (ZombieHorde | None): The zombie horde, if any.
+
+        Returns:
+            list[pygame.Rect]: The regions of the display covered by the visible zombies.
+        """
+        if zombie_horde is None or not len(zombie_horde):
+            return []
+
+        width, height = zombie_horde.width, zombie_horde.height
+        positions = zombie_horde.positions
+        if self.camera is not None:
+            positions = positions - self.camera.rect.topleft
+        positions = np.rint(positions).astype(np.intp)
+        display_width, display_height = self.display.get_size()
+        visible = np.flatnonzero(
+            (positions[:, 0] < display_width)
+            & (positions[:, 0] + width > 0)
+            & (positions[:, 1] < display_height)
+            & (positions[:, 1] + height > 0)
+        )
+
+        get_animation = self.zombie_frame_cache.get_animation
+        frame_numbers = zombie_horde.animation_times[visible] * ZOMBIE_ANIMATION_FPS
+        blits = []
+        for kind, dying, facing_right, frame_number, (x, y) in zip(
+            zombie_horde.kinds[visible].tolist(),
+            (zombie_horde.modes[visible] == ZombieMode.DYING.value).tolist(),
+            (zombie_horde.directions[visible] > 0).tolist(),
+            frame_numbers.astype(np.intp).tolist(),
+            positions[visible].tolist(),
+        ):
+            animation = get_animation(kind, dying, facing_right, width, height)
+            frame, offset = animation[
+                min(frame_number, len(animation) - 1)
+                if dying
+                else frame_number % len(animation)
+            ]
+            blits.append((frame, (x + offset, y)))
+        return self.display.blits(blits)
+
+    def render_player(self, player_state: PlayerState) -> pygame.Rect:
+        player = Player(player_state, self.player_frame_cache)
+        if self.camera is None:
+            return self.display.blit(player.image, player.rect)
+        return self.display.blit(player.image, self.camera.to_screen(player.rect))
+
+
+def get_rects_area(rects: list[pygame.Rect]) -> int:
+    """
+    Gets the total area of a list of rects.
+
+    Args:
+        rects (list[pygame.Rect]): The list of rects.
 
-    def render_player(self, player_state: PlayerState) -> None:
-        player = Player(player_state)
-        self.display.blit(player.image, player.rect)
+    Returns:
+        int: The total number of pixels covered by the rects, counting overlaps twice.
+    """
+    return sum(rect.width * rect.height for rect in rects)
@@ -1,12 +1,8 @@
 import pygame
 
-from ..state.tile import (
-    TileState,
-    GrassTileState,
-    DirtTileState,
-    LeftTileState,
-    RightTileState,
-)
+from functools import cache
+
+from ..state.tile import TileKind, TileState
 from ..constants.paths import (
     DIRT_TILE_IMAGE_PATH,
     GRASS_TILE_IMAGE_PATH,
@@ -16,12 +12,6 @@ from ..constants.paths import (
 from ..constants.tile import TILE_SIZE
 
 
-dirt_tile_image = pygame.image.load(DIRT_TILE_IMAGE_PATH)
-grass_tile_image = pygame.image.load(GRASS_TILE_IMAGE_PATH)
-left_tile_image = pygame.image.load(LEFT_TILE_IMAGE_PATH)
-right_tile_image = pygame.image.load(RIGHT_TILE_IMAGE_PATH)
-
-
 class Tile(pygame.sprite.Sprite):
     def __init__(
         self,
@@ -41,75 +31,119 @@ class Tile(pygame.sprite.Sprite):
         super().__init__()
 
         self.rect = state.rect
-        self.image = pygame.transform.scale(image, TILE_SIZE)
+        self.image = scale_tile_image(image)
 
 
 class DirtTile(Tile):
     def __init__(
         self,
-        state: DirtTileState,
+        state: TileState,
     ) -> None:
         """
         Initializes the dirt tile.
 
         Args:
-            state (DirtTileState): The state of the tile.
+            state (TileState): The state of the tile.
 
         Returns:
             None
         """
-        super().__init__(state, dirt_tile_image)
+        super().__init__(state, load_tile_image(DIRT_TILE_IMAGE_PATH))
 
 
 class GrassTile(Tile):
     def __init__(
         self,
-        state: GrassTileState,
+        state: TileState,
     ) -> None:
         """
         Initializes the grass tile.
 
         Args:
-            state (GrassTileState): The state of the tile.
+            state (TileState): The state of the tile.
 
         Returns:
             None
         """
-        super().__init__(state, grass_tile_image)
+        super().__init__(state, load_tile_image(GRASS_TILE_IMAGE_PATH))
 
 
 class RightTile(Tile):
     def __init__(
         self,
-        state: RightTileState,
+        state: TileState,
     ) -> None:
         """
         Initializes the right tile.
 
         Args:
-            state (RightTileState): The state of the tile.
+            state (TileState): The state of the tile.
 
         Returns:
             None
         """
-        super().__init__(state, right_tile_image)
+        super().__init__(state, load_tile_image(RIGHT_TILE_IMAGE_PATH))
 
 
 class LeftTile(Tile):
     def __init__(
         self,
-        state: LeftTileState,
+        state: TileState,
     ) -> None:
         """
         Initializes the left tile.
 
         Args:
-            state (LeftTileState): The state of the tile.
+            state (TileState): The state of the tile.
 
         Returns:
             None
         """
-        super().__init__(state, left_tile_image)
+        super().__init__(state, load_tile_image(LEFT_TILE_IMAGE_PATH))
+
+
+kind_to_sprite = {
+    TileKind.GRASS: GrassTile,
+    TileKind.DIRT: DirtTile,
+    TileKind.RIGHT: RightTile,
+    TileKind.LEFT: LeftTile,
+}
+
+kind_to_image_path = {
+    TileKind.GRASS: GRASS_TILE_IMAGE_PATH,
+    TileKind.DIRT: DIRT_TILE_IMAGE_PATH,
+    TileKind.RIGHT: RIGHT_TILE_IMAGE_PATH,
+    TileKind.LEFT: LEFT_TILE_IMAGE_PATH,
+}
+
+
+@cache
+def load_tile_image(path: str) -> pygame.Surface:
+    """
+    Loads a tile image the first time it is used.
+
+    Args:
+        path (str): The path of the tile image.
+
+    Returns:
+        pygame.Surface: The tile image.
+    """
+    return pygame.image.load(path)
+
+
+@cache
+def scale_tile_image(image: pygame.Surface) -> pygame.Surface:
+    """
+    Scales a tile image to the tile size.
+    The result is cached, so every tile image is scaled only once.
+
+    Args:
+        image (pygame.Surface): The image of the tile.
+
+    Returns:
+        pygame.Surface: The scaled image of the tile.
+    """
+    return pygame.transform.scale(image, TILE_SIZE)
 
 
 def create_tile_sprites(tiles: list[TileState]) -> list[Tile]:
@@ -122,16 +156,51 @@ def create_tile_sprites(tiles: list[TileState]) -> list[Tile]:
     Returns:
         list[Tile]: The list of tile sprites.
     """
-    state_to_sprite = {
-        TileState: GrassTile,
-        GrassTileState: GrassTile,
-        DirtTileState: DirtTile,
-        RightTileState: RightTile,
-        LeftTileState: LeftTile,
-    }
-
-    tile_sprites = []
-    for tile in tiles:
-        tile_sprites.append(state_to_sprite[type(tile)](tile))
-
-    return tile_sprites
+    return [create_tile_sprite(tile) for tile in tiles]
+
+
+def get_tile_image(tile: TileState) -> pygame.Surface:
+    """
+    Gets the scaled image of a tile without creating a sprite.
+
+    Args:
+        tile (TileState): The tile state.
+
+    Returns:
+        pygame.Surface: The scaled image of the tile.
+    """
+    return scale_tile_image(load_tile_image(kind_to_image_path[tile.kind]))
+
+
+def create_tile_blits(
+    tiles: list[TileState],
+    offset: tuple[int, int] = (0, 0),
+) -> list[tuple[pygame.Surface, pygame.Rect]]:
+    """
+    Creates a blit sequence for a list of tile states.
+    The sequence can be passed to pygame.Surface.blits to draw all tiles in one call.
+
+    Args:
+        tiles (list[TileState]): The list of tile states.
+        offset (tuple[int, int]): The offset to move the tiles by, e.g. the negated camera position.
+
+    Returns:
+        list[tuple[pygame.Surface, pygame.Rect]]: The (image, rect) pairs of the tiles.
+    """
+    offset_x, offset_y = offset
+    return [
+        (get_tile_image(tile), tile.rect.move(offset_x, offset_y)) for tile in tiles
+    ]
+
+
+def create_tile_sprite(tile: TileState) -> Tile:
+    """
+    Creates a tile sprite from a tile state.
+
+    Args:
+        tile (TileState): The tile state.
+
+    Returns:
+        Tile: The tile sprite.
+    """
+    return kind_to_sprite[tile.kind](tile)
@@ -0,0 +1,134 @@
+import pygame
+
+from .atlas import TextureAtlas
+from ..assets import AssetManager, list_animation_frame_paths
+from ..state.zombie import ZombieKind
+from ..constants.paths import (
+    ZOMBIE_BOY_WALK_IMAGE_DIRECTORY,
+    ZOMBIE_BOY_DEAD_IMAGE_DIRECTORY,
+    ZOMBIE_GIRL_WALK_IMAGE_DIRECTORY,
+    ZOMBIE_GIRL_DEAD_IMAGE_DIRECTORY,
+)
+
+
+zombie_animation_directories = {
+    (ZombieKind.BOY, False): ZOMBIE_BOY_WALK_IMAGE_DIRECTORY,
+    (ZombieKind.BOY, True): ZOMBIE_BOY_DEAD_IMAGE_DIRECTORY,
+    (ZombieKind.GIRL, False): ZOMBIE_GIRL_WALK_IMAGE_DIRECTORY,
+    (ZombieKind.GIRL, True): ZOMBIE_GIRL_DEAD_IMAGE_DIRECTORY,
+}
+
+zombie_animations = {
+    (ZombieKind.BOY, False): "zombie/boy/walk",
+    (ZombieKind.BOY, True): "zombie/boy/dead",
+    (ZombieKind.GIRL, False): "zombie/girl/walk",
+    (ZombieKind.GIRL, True): "zombie/girl/dead",
+}
+
+
+ZombieFrame = tuple[pygame.Surface, int]
+
+
+class ZombieFrameCache:
+    def __init__(
+        self,
+        asset_manager: AssetManager,
+        atlas: TextureAtlas | None = None,
+    ) -> None:
+        """
+        Initializes the zombie frame cache.
+        The frames of an animation are requested the first time a zombie needs
+        them and scaled once to the height of the zombies, keeping their aspect
+        ratio, in both facing directions, and run-length encoded. Animations found in the atlas are
+        taken from it instead of their PNG files.
+
+        Args:
+            asset_manager (AssetManager): The asset manager to decode frames with.
+            atlas (TextureAtlas | None): The texture atlas to take source frames from.
+
+        Returns:
+            None
+        """
+        self.asset_manager = asset_manager
+        self.atlas = atlas
+        self.animations: dict[tuple[int, bool, bool, int, int], list[ZombieFrame]] = {}
+
+    def get_animation(
+        self,
+        kind: int,
+        dying: bool,
+        facing_right: bool,
+        width: int,
+        height: int,
+    ) -> list[ZombieFrame]:
+        """
+        Gets the scaled frames of a zombie animation.
+
+        Args:
+            kind (int): The ZombieKind value of the zombie.
+            dying (bool): Whether to get the dying animation instead of the walking one.
+            facing_right (bool): Whether the zombie faces right.
+            width (int): The width of the zombie rect.
+            height (int): The height of the zombie rect.
+
+        Returns:
+            list[ZombieFrame]: The frames in order, each with the horizontal offset
+                centering it on the zombie rect.
+        """
+        key = (kind, dying, facing_right, width, height)
+        animation = self.animations.get(key)
+        if animation is None:
+            self.add_animation(kind, dying, width, height)
+            animation = self.animations[key]
+        return animation
+
+    def add_animation(self, kind: int, dying: bool, width: int, height: int) -> None:
+        """
+        Scales the source frames of an animation and stores their right and left facing copies.
+
+        Args:
+            kind (int): The ZombieKind value of the zombie.
+            dying (bool): Whether the animation is the dying one.
+            width (int): The width of the zombie rect.
+            height (int): The height of the zombie rect.
+
+        Returns:
+            None
+        """
+        right_frames = []
+        left_frames = []
+        for source_frame in self.get_source_frames(ZombieKind(kind), dying):
+            source_width, source_height = source_frame.get_size()
+            frame_width = max(round(source_width * height / source_height), 1)
+            offset = (width - frame_width) // 2
+            right_frame = pygame.transform.scale(source_frame, (frame_width, height))
+            left_frame = pygame.transform.flip(right_frame, True, False)
+            for frame, frames in ((right_frame, right_frames), (left_frame, left_frames)):
+                # Run-length encoding skips the transparent pixels around the
+                # zombie, which makes blitting a large horde several times faster.
+                frame.set_alpha(255, pygame.RLEACCEL)
+                frames.append((frame, offset))
+
+        self.animations[(kind, dying, True, width, height)] = right_frames
+        self.animations[(kind, dying, False, width, height)] = left_frames
+
+    def get_source_frames(self, kind: ZombieKind, dying: bool) -> list[pygame.Surface]:
+        """
+        Gets the unscaled frames of an animation, waiting for them to be decoded if needed.
+
+        Args:
+            kind (ZombieKind): The kind of the zombie.
+            dying (bool): Whether the animation is the dying one.
+
+        Returns:
+            list[pygame.Surface]: The unscaled frames in order.
+        """
+        animation = zombie_animations[(kind, dying)]
+        if self.atlas is not None and self.atlas.has_animation(animation):
+            return self.atlas.get_frames(animation)
+        return [
+            handle.get()
+            for handle in self.asset_manager.load_images(
+                list_animation_frame_paths(zombie_animation_directories[(kind, dying)])
+            )
+        ]
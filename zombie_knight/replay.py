@@ -0,0 +1,154 @@
+import argparse
+import json
+import sys
+
+import pygame
+
+from typing import Callable
+
+from .board import create_game_state, create_rules, stream_assets
+from .assets import AssetManager
+from .input import ScriptedKeyboard
+from .recording import InputRecording, decode_frame_input, hash_game_state
+from .render.camera import Camera
+from .render.renderer import Renderer
+from .simulation import SimulationResult, simulate
+from .state.game_state import GameState
+from .state.chunked_level import ChunkedTileGrid
+from .constants.physics import SIMULATION_TIMESTEP
+
+
+def replay(
+    recording: InputRecording,
+    on_frame: Callable[[int, GameState], None] | None = None,
+    tiles: ChunkedTileGrid | None = None,
+) -> SimulationResult:
+    """
+    Replays a recording from the initial game state at unlimited speed.
+
+    Args:
+        recording (InputRecording): The recording.
+        on_frame (Callable[[int, GameState], None] | None): The function called
+            with the frame number and the game state after every frame, e.g. to render it.
+        tiles (ChunkedTileGrid | None): The level the recording was made on,
+            opened with open_recorded_level, or None for the built-in tile map.
+
+    Returns:
+        SimulationResult: The final game state and the frame times of the replay.
+    """
+    if recording.timestep != SIMULATION_TIMESTEP:
+        raise ValueError(
+            f"The recording was made with a timestep of {recording.timestep}s "
+            f"instead of {SIMULATION_TIMESTEP}s"
+        )
+    if (recording.level_path is None) != (tiles is None):
+        raise ValueError(
+            f"The recording was made on {recording.level_path or 'the built-in tile map'}, "
+            "open its level with open_recorded_level"
+        )
+
+    frame_inputs = {}
+    masks = recording.iter_masks()
+
+    def input_script(frame, game_state):
+        mask = next(masks)
+        if mask not in frame_inputs:
+            frame_inputs[mask] = decode_frame_input(mask)
+        return frame_inputs[mask]
+
+    keyboard = ScriptedKeyboard()
+    return simulate(
+        create_game_state(tiles),
+        create_rules(keyboard),
+        input_script,
+        recording.frame_count,
+        keyboard,
+        on_frame=on_frame,
+    )
+
+
+def open_recorded_level(recording: InputRecording) -> ChunkedTileGrid | None:
+    """
+    Opens the chunked level a recording was made on.
+
+    Args:
+        recording (InputRecording): The recording.
+
+    Returns:
+        ChunkedTileGrid | None: The level, to be closed by the caller, or None
+            if the recording was made on the built-in tile map.
+    """
+    if recording.level_path is None:
+        return None
+    return ChunkedTileGrid.open(recording.level_path)
+
+
+def create_render_callback(asset_manager: AssetManager) -> Callable[[int, GameState], None]:
+    """
+    Creates a window and a function rendering every replayed frame into it.
+
+    Args:
+        asset_manager (AssetManager): The asset manager to load the images with,
+            shut down by the caller once the replay is over.
+
+    Returns:
+        Callable[[int, GameState], None]: The function rendering a frame.
+    """
+    pygame.init()
+    display = pygame.display.set_mode((1280, 640))
+    renderer = Renderer(
+        display,
+        dirty_rects=True,
+        asset_manager=asset_manager,
+        camera=Camera(display.get_size()),
+    )
+    stream_assets(asset_manager, renderer)
+
+    def render(frame: int, game_state: GameState) -> None:
+        pygame.event.pump()
+        pygame.display.update(renderer.render(game_state))
+
+    return render
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replays an input recording at unlimited speed and checks its final state.",
+    )
+    parser.add_argument("path")
+    parser.add_argument("--render", action="store_true")
+    args = parser.parse_args()
+
+    recording = InputRecording.load(args.path)
+    tiles = open_recorded_level(recording)
+    asset_manager = AssetManager() if args.render else None
+    try:
+        result = replay(
+            recording,
+            create_render_callback(asset_manager) if asset_manager is not None else None,
+            tiles,
+        )
+        matches = hash_game_state(result.game_state) == recording.final_state_hash
+    finally:
+        if asset_manager is not None:
+            asset_manager.shutdown()
+        if tiles is not None:
+            tiles.close()
+
+    json.dump(
+        {
+            "frames": result.frames,
+            "elapsed": result.elapsed,
+            "frames_per_second": result.frames_per_second,
+            "final_state_matches": matches,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    print()
+    if not matches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
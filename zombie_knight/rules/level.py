@@ -0,0 +1,41 @@
+import pygame
+
+from ..state.game_state import GameState
+from ..state.chunked_level import ChunkedTileGrid
+from ..constants.level import CHUNK_PREFETCH_LOOKAHEAD
+
+
+class ChunkPrefetchRule:
+    def __init__(self, lookahead: float = CHUNK_PREFETCH_LOOKAHEAD) -> None:
+        """
+        Initializes the chunk prefetch rule.
+
+        Args:
+            lookahead (float): The time to prefetch ahead of the player in seconds.
+
+        Returns:
+            None
+        """
+        self.lookahead = lookahead
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Requests the level chunks around the player and ahead of its movement.
+        The chunks are read in the background, so the game state is returned
+        unchanged. Levels that are not streamed from a file are ignored.
+
+        Args:
+            game_state (GameState): The game state to apply the chunk prefetch rule to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The unchanged game state.
+        """
+        if isinstance(game_state.tiles, ChunkedTileGrid):
+            player = game_state.player
+            game_state.tiles.prefetch(player.rect, player.velocity, self.lookahead)
+        return game_state
@@ -1,8 +1,12 @@
 from .movement import GravityRule, AccelerationRule, VelocityRule
+from .swept import SweptVelocityRule, SweepHit, sweep_axis
 
 
 __all__ = [
     "GravityRule",
     "AccelerationRule",
     "VelocityRule",
+    "SweptVelocityRule",
+    "SweepHit",
+    "sweep_axis",
 ]
@@ -1,11 +1,11 @@
 import pygame
 
 from typing import Callable
-from dataclasses import replace
 
+from ..pipeline import EntityStep
 from ...state.matter import Matter
 from ...state.game_state import GameState
-from ...constants.physics import GRAVITY_ACCELERATION_CONST
+from ...constants.physics import GRAVITY_ACCELERATION_CONST, SIMULATION_TIMESTEP
 
 
 class GravityRule:
@@ -29,24 +29,60 @@ class GravityRule:
             GameState: The new game state with the gravity rule applied.
         """
 
-        def apply_gravity(matter: Matter) -> Matter:
-            acceleration = matter.get_acceleration()
-            new_acceleration = pygame.Vector2(
-                acceleration.x, GRAVITY_ACCELERATION_CONST
-            )
-            return matter.replace_acceleration(new_acceleration)
-
         return apply_on_game_state_matters(
-            apply_gravity,
+            self.apply_gravity,
             game_state,
         )
 
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the gravity rule as a step applied to every matter by a rule pipeline.
+
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The step applying the gravity rule to a matter.
+        """
+        return EntityStep(self.apply_gravity)
+
+    def apply_gravity(self, matter: Matter) -> Matter:
+        """
+        Applies the gravity rule to a matter.
+
+        Args:
+            matter (Matter): The matter to apply the gravity rule to.
+
+        Returns:
+            Matter: The matter with the gravity acceleration.
+        """
+        acceleration = matter.get_acceleration()
+        new_acceleration = pygame.Vector2(acceleration.x, GRAVITY_ACCELERATION_CONST)
+        return matter.replace_acceleration(new_acceleration)
+
 
 class AccelerationRule:
     """
     Acceleration rule.
     """
 
+    def __init__(self, timestep: float = SIMULATION_TIMESTEP) -> None:
+        """
+        Initializes the acceleration rule.
+
+        Args:
+            timestep (float): The simulated time of one step in seconds.
+
+        Returns:
+            None
+        """
+        self.timestep = timestep
+
     def __call__(
         self,
         game_state: GameState,
@@ -63,22 +99,60 @@ class AccelerationRule:
             GameState: The new game state with the acceleration rule applied.
         """
 
-        def apply_acceleration(matter: Matter) -> Matter:
-            acceleration = matter.get_acceleration()
-            new_velocity = matter.get_velocity() + acceleration
-            return matter.replace_velocity(new_velocity)
-
         return apply_on_game_state_matters(
-            apply_acceleration,
+            self.apply_acceleration,
             game_state,
         )
 
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the acceleration rule as a step applied to every matter by a rule pipeline.
+
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The step applying the acceleration rule to a matter.
+        """
+        return EntityStep(self.apply_acceleration)
+
+    def apply_acceleration(self, matter: Matter) -> Matter:
+        """
+        Applies the acceleration rule to a matter.
+
+        Args:
+            matter (Matter): The matter to apply the acceleration rule to.
+
+        Returns:
+            Matter: The matter with its velocity changed by its acceleration over one timestep.
+        """
+        acceleration = matter.get_acceleration()
+        new_velocity = matter.get_velocity() + acceleration * self.timestep
+        return matter.replace_velocity(new_velocity)
+
 
 class VelocityRule:
     """
     Velocity rule.
     """
 
+    def __init__(self, timestep: float = SIMULATION_TIMESTEP) -> None:
+        """
+        Initializes the velocity rule.
+
+        Args:
+            timestep (float): The simulated time of one step in seconds.
+
+        Returns:
+            None
+        """
+        self.timestep = timestep
+
     def __call__(
         self,
         game_state: GameState,
@@ -95,16 +169,42 @@ class VelocityRule:
             GameState: The new game state with the velocity rule applied.
         """
 
-        def apply_velocity(matter: Matter) -> Matter:
-            velocity = matter.get_velocity()
-            new_position = matter.get_position() + velocity
-            return matter.replace_position(new_position)
-
         return apply_on_game_state_matters(
-            apply_velocity,
+            self.apply_velocity,
             game_state,
         )
 
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the velocity rule as a step applied to every matter by a rule pipeline.
+
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The step applying the velocity rule to a matter.
+        """
+        return EntityStep(self.apply_velocity)
+
+    def apply_velocity(self, matter: Matter) -> Matter:
+        """
+        Applies the velocity rule to a matter.
+
+        Args:
+            matter (Matter): The matter to apply the velocity rule to.
+
+        Returns:
+            Matter: The matter with its position changed by its velocity over one timestep.
+        """
+        velocity = matter.get_velocity()
+        new_position = matter.get_position() + velocity * self.timestep
+        return matter.replace_position(new_position)
+
 
 def apply_on_game_state_matters(
     f: Callable[[Matter], Matter],
@@ -121,12 +221,4 @@ def apply_on_game_state_matters(
         GameState: The new game state with the function applied to each matter.
     """
     matters = game_state.get_matters()
-    attr_to_new_matter: dict[str, Matter] = {}
-    for attr, matter in matters:
-        new_matter = f(matter)
-        attr_to_new_matter[attr] = new_matter
-
-    return replace(
-        game_state,
-        **attr_to_new_matter,
-    )
+    return game_state.replace_matters([f(matter) for _, matter in matters])
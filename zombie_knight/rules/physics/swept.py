@@ -0,0 +1,206 @@
+import math
+
+import pygame
+
+from dataclasses import dataclass
+
+from ..pipeline import EntityStep
+from ...state.matter import Matter
+from ...state.collidable import Collidable
+from ...state.game_state import GameState
+from ...state.tile import TileState
+from ...state.tile_index import TileIndex, create_tile_index
+from ...constants.physics import SIMULATION_TIMESTEP
+from .movement import apply_on_game_state_matters
+
+
+@dataclass(frozen=True)
+class SweepHit:
+    time: float
+    normal: pygame.Vector2
+    cell: tuple[int, int]
+
+
+def sweep_axis(
+    tile_index: TileIndex,
+    position: pygame.Vector2,
+    size: tuple[int, int],
+    displacement: float,
+    axis: int,
+) -> SweepHit | None:
+    """
+    Sweeps a box along one axis through the tile grid and finds the first tile it hits.
+    Only the grid columns (or rows) the leading edge of the box crosses are
+    visited, in the order they are crossed, so the cost grows with the distance
+    travelled and not with the number of tiles. Tiles the box already overlaps
+    when the sweep starts are not hit, and cells outside the grid are empty.
+
+    Args:
+        tile_index (TileIndex): The spatial index of the tiles.
+        position (pygame.Vector2): The top left corner of the box in pixels.
+        size (tuple[int, int]): The width and height of the box in pixels.
+        displacement (float): The distance the box moves along the axis in pixels.
+        axis (int): 0 to sweep along x, 1 to sweep along y.
+
+    Returns:
+        SweepHit | None: The fraction of the displacement travelled before the
+            hit, the normal of the hit tile face and the hit cell, or None if
+            the box moves the whole displacement freely.
+    """
+    if displacement == 0:
+        return None
+
+    other_axis = 1 - axis
+    cell_sizes = (tile_index.cell_width, tile_index.cell_height)
+    line_counts = (tile_index.columns, tile_index.rows)
+    cell_size = cell_sizes[axis]
+    other_cell_size = cell_sizes[other_axis]
+
+    start = position[other_axis]
+    lines = range(
+        max(math.floor(start / other_cell_size), 0),
+        min(math.ceil((start + size[other_axis]) / other_cell_size), line_counts[other_axis]),
+    )
+    if not lines:
+        return None
+
+    if displacement > 0:
+        edge = position[axis] + size[axis]
+        line = math.ceil(edge / cell_size)
+        stop = min(math.ceil((edge + displacement) / cell_size), line_counts[axis])
+        step = 1
+        face_offset = 0
+    else:
+        edge = position[axis]
+        line = math.floor(edge / cell_size) - 1
+        stop = max(math.floor((edge + displacement) / cell_size) - 1, -1)
+        step = -1
+        face_offset = 1
+    if step == 1:
+        line = max(line, 0)
+    else:
+        line = min(line, line_counts[axis] - 1)
+
+    for line in range(line, stop, step):
+        for other_line in lines:
+            cell = (line, other_line) if axis == 0 else (other_line, line)
+            if tile_index.get_cell(*cell):
+                face = (line + face_offset) * cell_size
+                normal = pygame.Vector2(0, 0)
+                normal[axis] = -step
+                return SweepHit((face - edge) / displacement, normal, cell)
+    return None
+
+
+class SweptVelocityRule:
+    """
+    Swept velocity rule.
+    """
+
+    def __init__(self, timestep: float = SIMULATION_TIMESTEP) -> None:
+        """
+        Initializes the swept velocity rule.
+        Like the velocity rule, it moves every matter by its velocity over one
+        timestep, but collidables are swept through the tiles one axis at a
+        time, first along x and then along y, and stop at the first tile face
+        they reach with their velocity along that axis zeroed. Bodies therefore
+        never pass through tiles, whatever their speed.
+
+        Args:
+            timestep (float): The simulated time of one step in seconds.
+
+        Returns:
+            None
+        """
+        self.timestep = timestep
+        self.tile_index: TileIndex | None = None
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Applies the swept velocity rule to all matters in the game state.
+
+        Args:
+            game_state (GameState): The game state to apply the swept velocity rule to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The new game state with the swept velocity rule applied.
+        """
+        tile_index = self.get_tile_index(game_state.tiles)
+        return apply_on_game_state_matters(
+            lambda matter: self.apply_swept_velocity(matter, tile_index),
+            game_state,
+        )
+
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the swept velocity rule as a step applied to every matter by a rule pipeline.
+
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The step applying the swept velocity rule to a matter.
+        """
+        tile_index = self.get_tile_index(game_state.tiles)
+        return EntityStep(lambda matter: self.apply_swept_velocity(matter, tile_index))
+
+    def get_tile_index(self, tile_states: list[TileState]) -> TileIndex:
+        """
+        Gets the spatial index of the tiles, rebuilding it when the tile list changed.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            TileIndex: The spatial index of the tiles.
+        """
+        if self.tile_index is None or self.tile_index.tiles is not tile_states:
+            self.tile_index = create_tile_index(tile_states)
+        return self.tile_index
+
+    def apply_swept_velocity(self, matter: Matter, tile_index: TileIndex) -> Matter:
+        """
+        Applies the swept velocity rule to a matter.
+
+        Args:
+            matter (Matter): The matter to apply the swept velocity rule to.
+            tile_index (TileIndex): The spatial index of the tiles.
+
+        Returns:
+            Matter: The matter moved by its velocity over one timestep, up to the
+                first tile it hits if it is a collidable.
+        """
+        if not isinstance(matter, Collidable):
+            return matter.replace_position(
+                matter.get_position() + matter.get_velocity() * self.timestep
+            )
+
+        position = pygame.Vector2(matter.get_position())
+        velocity = pygame.Vector2(matter.get_velocity())
+        size = matter.get_collision_rect().size
+        for axis in (0, 1):
+            displacement = velocity[axis] * self.timestep
+            hit = sweep_axis(tile_index, position, size, displacement, axis)
+            if hit is None:
+                position[axis] += displacement
+                continue
+
+            line = hit.cell[axis]
+            cell_size = tile_index.cell_width if axis == 0 else tile_index.cell_height
+            if hit.normal[axis] < 0:
+                position[axis] = line * cell_size - size[axis]
+            else:
+                position[axis] = (line + 1) * cell_size
+            velocity[axis] = 0
+
+        return matter.replace_position(position).replace_velocity(velocity)
@@ -0,0 +1,156 @@
+import pygame
+
+from dataclasses import replace
+
+from .movement import (
+    GravityRule,
+    AccelerationRule,
+    VelocityRule,
+    apply_on_game_state_matters,
+)
+from ...state.matter import Matter
+from ...state.matter_arrays import MatterArrays
+from ...numpy_support import np, require_numpy
+from ...state.game_state import GameState
+from ...state.fields import get_entity_fields
+from ...constants.physics import GRAVITY_ACCELERATION_CONST, SIMULATION_TIMESTEP
+
+
+def apply_gravity(
+    arrays: MatterArrays,
+    gravity: float = GRAVITY_ACCELERATION_CONST,
+) -> None:
+    """
+    Applies gravity to all matters, the vectorized GravityRule.
+
+    Args:
+        arrays (MatterArrays): The matter arrays to update in place.
+        gravity (float): The vertical gravity acceleration.
+
+    Returns:
+        None
+    """
+    arrays.accelerations[:, 1] = gravity
+
+
+def apply_acceleration(
+    arrays: MatterArrays,
+    timestep: float = SIMULATION_TIMESTEP,
+) -> None:
+    """
+    Changes the velocities of all matters by their accelerations, the vectorized AccelerationRule.
+
+    Args:
+        arrays (MatterArrays): The matter arrays to update in place.
+        timestep (float): The simulated time of one step in seconds.
+
+    Returns:
+        None
+    """
+    np.add(arrays.velocities, arrays.accelerations * timestep, out=arrays.velocities)
+
+
+def apply_velocity(
+    arrays: MatterArrays,
+    timestep: float = SIMULATION_TIMESTEP,
+) -> None:
+    """
+    Changes the positions of all matters by their velocities, the vectorized VelocityRule.
+
+    Args:
+        arrays (MatterArrays): The matter arrays to update in place.
+        timestep (float): The simulated time of one step in seconds.
+
+    Returns:
+        None
+    """
+    np.add(arrays.positions, arrays.velocities * timestep, out=arrays.positions)
+
+
+def apply_movement(
+    arrays: MatterArrays,
+    timestep: float = SIMULATION_TIMESTEP,
+) -> None:
+    """
+    Applies gravity, acceleration and velocity to all matters in that order.
+
+    Args:
+        arrays (MatterArrays): The matter arrays to update in place.
+        timestep (float): The simulated time of one step in seconds.
+
+    Returns:
+        None
+    """
+    apply_gravity(arrays)
+    apply_acceleration(arrays, timestep)
+    apply_velocity(arrays, timestep)
+
+
+class VectorizedMovementRule:
+    """
+    Vectorized movement rule, equivalent to GravityRule, AccelerationRule and
+    VelocityRule applied in sequence.
+    """
+
+    def __init__(self, timestep: float = SIMULATION_TIMESTEP) -> None:
+        """
+        Initializes the vectorized movement rule.
+
+        Args:
+            timestep (float): The simulated time of one step in seconds.
+
+        Returns:
+            None
+        """
+        require_numpy("the vectorized movement rule")
+        self.timestep = timestep
+        self.gravity_rule = GravityRule()
+        self.acceleration_rule = AccelerationRule(timestep)
+        self.velocity_rule = VelocityRule(timestep)
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Applies gravity, acceleration and velocity to all bodies in the game state.
+        The bodies held in MatterArrays fields are moved at once on a copy of
+        their arrays, without converting them to matters. The few matters held
+        in matter fields, such as the player, are moved one by one.
+
+        Args:
+            game_state (GameState): The game state to apply the movement to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The new game state with the movement applied.
+        """
+        changes = {}
+        for field in get_entity_fields(type(game_state)).matter_arrays_fields:
+            arrays = getattr(game_state, field)
+            if arrays is None or not len(arrays):
+                continue
+            arrays = arrays.copy()
+            apply_movement(arrays, self.timestep)
+            changes[field] = arrays
+
+        if game_state.get_matters():
+            game_state = apply_on_game_state_matters(self.move_matter, game_state)
+        return replace(game_state, **changes) if changes else game_state
+
+    def move_matter(self, matter: Matter) -> Matter:
+        """
+        Applies gravity, acceleration and velocity to a single matter.
+
+        Args:
+            matter (Matter): The matter to move.
+
+        Returns:
+            Matter: The moved matter.
+        """
+        return self.velocity_rule.apply_velocity(
+            self.acceleration_rule.apply_acceleration(
+                self.gravity_rule.apply_gravity(matter)
+            )
+        )
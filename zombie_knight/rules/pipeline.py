@@ -0,0 +1,245 @@
+import dataclasses
+import types
+
+import pygame
+
+from dataclasses import dataclass, replace
+from functools import cache
+from typing import Callable
+
+from ..state.game_state import GameState
+from ..state.matter import Matter
+from ..state.fields import get_entity_fields
+
+
+@dataclass(frozen=True)
+class EntityStep:
+    apply: Callable[[Matter], Matter]
+    entity_type: type = Matter
+    field: str | None = None
+    finish: Callable[[], None] | None = None
+
+    def applies_to(self, field: str, entity: Matter) -> bool:
+        """
+        Checks if the step applies to an entity of the game state.
+
+        Args:
+            field (str): The game state field holding the entity.
+            entity (Matter): The entity.
+
+        Returns:
+            bool: True if the step applies to the entity, False otherwise.
+        """
+        return isinstance(entity, self.entity_type) and (
+            self.field is None or self.field == field
+        )
+
+
+class WorkingEntity:
+    __slots__ = ()
+
+    def replace_fields(self, **fields) -> "WorkingEntity":
+        """
+        Replaces fields of the working copy in place.
+
+        Args:
+            **fields: The new values of the fields.
+
+        Returns:
+            WorkingEntity: The working copy itself.
+        """
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+        self._changed_fields.update(fields)
+        return self
+
+    def publish(self) -> Matter:
+        """
+        Creates the immutable entity holding the changes of the working copy.
+
+        Returns:
+            Matter: The entity with the changed fields, or the entity itself if nothing changed.
+        """
+        if not self._changed_fields:
+            return self._entity
+        return replace(
+            self._entity,
+            **{name: getattr(self, name) for name in self._changed_fields},
+        )
+
+
+@cache
+def get_working_class(entity_class: type) -> type:
+    """
+    Creates the working copy class of an entity class.
+    The class is a subclass of the entity class whose replace_fields, and
+    every replace method built on it, change the working copy in place, so
+    the working copies keep the properties, class attributes and isinstance
+    checks of the entity class.
+
+    Args:
+        entity_class (type): The entity class, e.g. PlayerState.
+
+    Returns:
+        type: The subclass of WorkingEntity and of the entity class.
+    """
+    return types.new_class(
+        f"Working{entity_class.__name__}",
+        (WorkingEntity, entity_class),
+        exec_body=lambda namespace: namespace.update(
+            __slots__=("_entity", "_changed_fields")
+        ),
+    )
+
+
+def create_working_entity(entity: Matter) -> WorkingEntity:
+    """
+    Creates a working entity, a mutable copy of an entity used within a frame.
+    The fields of the entity are copied without calling the initializer of the
+    entity class.
+
+    Args:
+        entity (Matter): The entity to work on.
+
+    Returns:
+        WorkingEntity: The working copy of the entity.
+    """
+    working_entity = object.__new__(get_working_class(type(entity)))
+    for name in get_field_names(type(entity)):
+        object.__setattr__(working_entity, name, getattr(entity, name))
+    object.__setattr__(working_entity, "_entity", entity)
+    object.__setattr__(working_entity, "_changed_fields", set())
+    return working_entity
+
+
+@cache
+def get_field_names(entity_class: type) -> tuple[str, ...]:
+    """
+    Gets the field names of an entity dataclass.
+
+    Args:
+        entity_class (type): The entity class, e.g. PlayerState.
+
+    Returns:
+        tuple[str, ...]: The names of the fields.
+    """
+    return tuple(field.name for field in dataclasses.fields(entity_class))
+
+
+class RulePipeline:
+    def __init__(self, rules: list) -> None:
+        """
+        Initializes the rule pipeline.
+        Consecutive rules providing get_entity_step are fused into one pass per
+        entity over a mutable working copy, and a single new game state is created
+        at the end of the pass. A fused step may only read its own entity and
+        the parts of the game state no rule changes, such as the tiles. Other
+        rules run as usual between the fused passes.
+
+        Args:
+            rules (list): The rules to apply in order.
+
+        Returns:
+            None
+        """
+        self.rules = rules
+        self.segments: list[list] = []
+        for rule in rules:
+            fusable = hasattr(rule, "get_entity_step")
+            if fusable and self.segments and is_fused_segment(self.segments[-1]):
+                self.segments[-1].append(rule)
+            else:
+                self.segments.append([rule])
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Applies the rules to the game state.
+
+        Args:
+            game_state (GameState): The game state to apply the rules to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The new game state with all rules applied.
+        """
+        for segment in self.segments:
+            if is_fused_segment(segment):
+                game_state = apply_fused_rules(segment, game_state, events)
+            else:
+                game_state = segment[0](game_state, events)
+        return game_state
+
+
+def is_fused_segment(segment: list) -> bool:
+    """
+    Checks if a segment of the pipeline is a pass of fused rules.
+
+    Args:
+        segment (list): The rules of the segment.
+
+    Returns:
+        bool: True if the rules of the segment provide entity steps, False otherwise.
+    """
+    return hasattr(segment[0], "get_entity_step")
+
+
+def apply_fused_rules(
+    rules: list,
+    game_state: GameState,
+    events: list[pygame.event.Event],
+) -> GameState:
+    """
+    Applies rules entity by entity over working copies, publishing one new game state.
+    The finish function of every step, if any, is called once the pass is done.
+
+    Args:
+        rules (list): The rules providing get_entity_step, in order.
+        game_state (GameState): The game state to apply the rules to.
+        events (list[pygame.event.Event]): The events occurred in the current frame.
+
+    Returns:
+        GameState: The new game state with the rules applied.
+    """
+    steps = [rule.get_entity_step(game_state, events) for rule in rules]
+    entity_fields = get_entity_fields(type(game_state))
+
+    changes = {}
+    for field in entity_fields.matter_fields:
+        changes[field] = apply_entity_steps(steps, field, getattr(game_state, field))
+    for field in entity_fields.matter_list_fields:
+        changes[field] = [
+            apply_entity_steps(steps, field, entity)
+            for entity in getattr(game_state, field)
+        ]
+    for step in steps:
+        if step.finish is not None:
+            step.finish()
+
+    return replace(game_state, **changes)
+
+
+def apply_entity_steps(
+    steps: list[EntityStep],
+    field: str,
+    entity: Matter,
+) -> Matter:
+    """
+    Applies the steps matching an entity to a working copy of it.
+
+    Args:
+        steps (list[EntityStep]): The steps of the fused rules, in order.
+        field (str): The game state field holding the entity.
+        entity (Matter): The entity.
+
+    Returns:
+        Matter: The entity with the steps applied.
+    """
+    working_entity = create_working_entity(entity)
+    for step in steps:
+        if step.applies_to(field, entity):
+            working_entity = step.apply(working_entity)
+    return working_entity.publish()
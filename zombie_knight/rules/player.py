@@ -5,6 +5,8 @@ from dataclasses import replace
 from ..state.game_state import GameState
 from ..state.player import PlayerState, PlayerMode
 from ..state.direction import HorizontalDirection
+from .pipeline import EntityStep
+from ..input import Keyboard, PygameKeyboard
 
 
 class PlayerMoveRule:
@@ -12,6 +14,7 @@ class PlayerMoveRule:
         self,
         horizontal_acceleration: float,
         horizontal_friction: float,
+        keyboard: Keyboard | None = None,
     ) -> None:
         """
         Initializes the player move rule.
@@ -19,12 +22,15 @@ class PlayerMoveRule:
         Args:
             horizontal_acceleration (float): The horizontal acceleration of the player.
             horizontal_friction (float): The horizontal friction of the player.
+            keyboard (Keyboard | None): The keyboard to read the pressed keys from,
+                the pygame keyboard by default.
 
         Returns:
             None
         """
         self.horizontal_acceleration = horizontal_acceleration
         self.horizontal_friction = horizontal_friction
+        self.keyboard = keyboard if keyboard is not None else PygameKeyboard()
 
     def __call__(
         self,
@@ -41,39 +47,84 @@ class PlayerMoveRule:
         Returns:
             GameState: The new game state with the player move rule applied.
         """
+        horizontal_acceleration = self.get_horizontal_acceleration()
+        return replace(
+            game_state,
+            player=self.apply_move(game_state.player, horizontal_acceleration),
+        )
+
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the player move rule as a step applied to the player by a rule pipeline.
+
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The step applying the player move rule to the player.
+        """
+        horizontal_acceleration = self.get_horizontal_acceleration()
+        return EntityStep(
+            lambda player_state: self.apply_move(player_state, horizontal_acceleration),
+            PlayerState,
+            "player",
+        )
+
+    def get_horizontal_acceleration(self) -> float:
+        """
+        Returns the horizontal acceleration requested by the pressed keys.
+
+        Returns:
+            float: The horizontal acceleration of the player.
+        """
         key_to_horizontal_acceleration = {
             pygame.K_LEFT: -self.horizontal_acceleration,
             pygame.K_RIGHT: self.horizontal_acceleration,
         }
 
-        def get_horizontal_acceleration() -> float:
-            for key, horizontal_acceleration in key_to_horizontal_acceleration.items():
-                if pygame.key.get_pressed()[key]:
-                    return horizontal_acceleration
-            return 0.0
+        pressed_keys = self.keyboard.get_pressed()
+        for key, horizontal_acceleration in key_to_horizontal_acceleration.items():
+            if pressed_keys[key]:
+                return horizontal_acceleration
+        return 0.0
 
-        horizontal_acceleration = get_horizontal_acceleration()
+    def apply_move(
+        self,
+        player_state: PlayerState,
+        horizontal_acceleration: float,
+    ) -> PlayerState:
+        """
+        Applies the player move rule to the player.
+
+        Args:
+            player_state (PlayerState): The state of the player.
+            horizontal_acceleration (float): The horizontal acceleration requested by the pressed keys.
+
+        Returns:
+            PlayerState: The new state of the player.
+        """
         new_acceleration = self.get_new_acceleration(
-            game_state.player,
+            player_state,
             horizontal_acceleration,
         )
         new_mode = self.get_player_mode(
-            game_state.player,
+            player_state,
             horizontal_acceleration,
         )
         new__horizontal_direction = self.get_new_horizontal_direction(
-            game_state.player,
+            player_state,
             horizontal_acceleration,
         )
 
-        return replace(
-            game_state,
-            player=replace(
-                game_state.player,
-                acceleration=new_acceleration,
-                mode=new_mode,
-                horizontal_direction=new__horizontal_direction,
-            ),
+        return player_state.replace_fields(
+            acceleration=new_acceleration,
+            mode=new_mode,
+            horizontal_direction=new__horizontal_direction,
         )
 
     def get_new_acceleration(
@@ -177,19 +228,60 @@ class PlayerJumpRule:
         Returns:
             GameState: The new game state with the player jump rule applied.
         """
+        new_player_state = self.apply_jump(game_state.player, events)
+        if new_player_state is game_state.player:
+            return game_state
+
+        return replace(
+            game_state,
+            player=new_player_state,
+        )
+
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the player jump rule as a step applied to the player by a rule pipeline.
+
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            EntityStep: The step applying the player jump rule to the player.
+        """
+        return EntityStep(
+            lambda player_state: self.apply_jump(player_state, events),
+            PlayerState,
+            "player",
+        )
+
+    def apply_jump(
+        self,
+        player_state: PlayerState,
+        events: list[pygame.event.Event],
+    ) -> PlayerState:
+        """
+        Applies the player jump rule to the player.
+
+        Args:
+            player_state (PlayerState): The state of the player.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            PlayerState: The new state of the player, or the same state if it did not jump.
+        """
         for event in events:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 new_velocity = pygame.Vector2(
-                    game_state.player.velocity.x,
+                    player_state.velocity.x,
                     -self.jump_velocity,
                 )
-                return replace(
-                    game_state,
-                    player=replace(
-                        game_state.player,
-                        velocity=new_velocity,
-                        mode=PlayerMode.JUMPING,
-                    ),
+                return player_state.replace_fields(
+                    velocity=new_velocity,
+                    mode=PlayerMode.JUMPING,
                 )
 
-        return game_state
+        return player_state
@@ -1,16 +1,33 @@
 import pygame
 
 from typing import Callable
-from dataclasses import replace
 
 from ..state.game_state import GameState
 from ..state.tile import TileState
+from ..state.tile_index import TileIndex, create_tile_index
+from ..state.tile_grid import TileGrid
+from ..state.collider_mesh import Collider, ColliderMesh
 from ..state.collidable import Collidable
+from .pipeline import EntityStep
+from ..constants.tile import TILE_SIZE
 
 
 class CollideTileRule:
-    def __init__(self, tile_margin: int = 2) -> None:
+    def __init__(self, tile_margin: int = 2, merge_colliders: bool = True) -> None:
+        """
+        Initializes the collide tile rule.
+
+        Args:
+            tile_margin (int): The number of pixels a collidable is pushed into or away from a tile.
+            merge_colliders (bool): Whether collidables collide with the solid tiles
+                of a tile grid merged into rectangles, instead of tile by tile.
+
+        Returns:
+            None
+        """
         self.tile_margin = tile_margin
+        self.merge_colliders = merge_colliders
+        self.tile_index: TileIndex | None = None
 
     def __call__(
         self,
@@ -28,70 +45,139 @@ class CollideTileRule:
         Returns:
             GameState: The new game state with the collide tile rule applied.
         """
+        tile_index = self.get_tile_index(game_state.tiles)
+        return apply_on_game_state_collidables(
+            lambda collidable: self.apply_collide_tile(collidable, tile_index),
+            game_state,
+        )
 
-        def apply_collide_tile(collidable: Collidable) -> Collidable:
-            tile_states = game_state.tiles
-            new_position = self.get_new_position(collidable, tile_states)
-            new_velocity = self.get_new_velocity(collidable, tile_states)
+    def get_entity_step(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> EntityStep:
+        """
+        Gets the collide tile rule as a step applied to every collidable by a rule pipeline.
 
-            return collidable.replace_collision_rect_position(
-                new_position
-            ).replace_collidable_velocity(new_velocity)
+        Args:
+            game_state (GameState): The game state at the start of the frame.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
 
-        return apply_on_game_state_collidables(
-            apply_collide_tile,
-            game_state,
+        Returns:
+            EntityStep: The step applying the collide tile rule to a collidable.
+        """
+        tile_index = self.get_tile_index(game_state.tiles)
+        return EntityStep(
+            lambda collidable: self.apply_collide_tile(collidable, tile_index),
+            Collidable,
         )
 
+    def apply_collide_tile(
+        self,
+        collidable: Collidable,
+        tile_index: TileIndex,
+    ) -> Collidable:
+        """
+        Applies the collide tile rule to a collidable.
+
+        Args:
+            collidable (Collidable): The collidable to apply the collide tile rule to.
+            tile_index (TileIndex): The spatial index of the tiles.
+
+        Returns:
+            Collidable: The collidable moved out of or onto the tile it collides with.
+        """
+        tile = self.get_colliding_tile(collidable, tile_index)
+        new_position = self.get_new_position(collidable, tile)
+        new_velocity = self.get_new_velocity(collidable, tile)
+
+        return collidable.replace_collision_rect_position(
+            new_position
+        ).replace_collidable_velocity(new_velocity)
+
+    def get_tile_index(self, tile_states: list[TileState]) -> TileIndex:
+        """
+        Gets the spatial index of the tiles, rebuilding it when the tile list changed.
+        Tile lists are treated as immutable, so the index is built once per list object.
+        Tile grids are indexed by their collider mesh, which is updated from the
+        mesh of the previous grid so only the changed strips are remeshed.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            TileIndex: The spatial index of the tiles.
+        """
+        if self.tile_index is not None and self.tile_index.tiles is tile_states:
+            return self.tile_index
+
+        if self.merge_colliders and isinstance(tile_states, TileGrid):
+            if isinstance(self.tile_index, ColliderMesh):
+                self.tile_index = self.tile_index.update(tile_states)
+            else:
+                self.tile_index = ColliderMesh(tile_states)
+        else:
+            self.tile_index = create_tile_index(tile_states)
+        return self.tile_index
+
     def get_new_position(
         self,
         collidable: Collidable,
-        tile_states: list[TileState],
+        tile: TileState | Collider | None,
     ) -> pygame.Vector2:
+        """
+        Gets the new position of the collidable.
+
+        Args:
+            collidable (Collidable): The collidable to get the new position of.
+            tile (TileState | Collider | None): The tile or collider the collidable collides with.
+
+        Returns:
+            pygame.Vector2: The new position of the collidable.
+        """
         rect = collidable.get_collision_rect()
-        tile = self.get_colliding_tile(collidable, tile_states)
+        position = collidable.get_position()
         if tile is None:
-            return pygame.Vector2(rect.x, rect.y)
+            return position
 
         if self.is_colliding_from_top(collidable, tile):
             return pygame.Vector2(
-                rect.x,
+                position.x,
                 tile.rect.top - rect.height + self.tile_margin,
             )
         elif self.is_colliding_from_bottom(collidable, tile):
             return pygame.Vector2(
-                rect.x,
+                position.x,
                 tile.rect.bottom + self.tile_margin,
             )
         elif self.is_colliding_from_left(collidable, tile):
             return pygame.Vector2(
                 tile.rect.left - rect.width - self.tile_margin,
-                rect.y,
+                position.y,
             )
         elif self.is_colliding_from_right(collidable, tile):
             return pygame.Vector2(
                 tile.rect.right + self.tile_margin,
-                rect.y,
+                position.y,
             )
         else:
-            return pygame.Vector2(rect.x, rect.y)
+            return position
 
     def get_new_velocity(
         self,
         collidable: Collidable,
-        tile_states: list[TileState],
+        tile: TileState | Collider | None,
     ) -> pygame.Vector2:
         """
         Gets the new velocity of the collidable.
 
         Args:
             collidable (Collidable): The collidable to get the new velocity of.
-            tile_states (list[TileState]): The list of tile states.
+            tile (TileState | Collider | None): The tile or collider the collidable collides with.
 
         Returns:
             pygame.Vector2: The new velocity of the collidable.
         """
-        tile = self.get_colliding_tile(collidable, tile_states)
         if tile is None:
             return collidable.get_velocity()
 
@@ -109,35 +195,35 @@ class CollideTileRule:
     def get_colliding_tile(
         self,
         collidable: Collidable,
-        tile_states: list[TileState],
-    ) -> TileState | None:
+        tile_index: TileIndex,
+    ) -> TileState | Collider | None:
         """
         Gets the colliding tile of the collidable.
+        Only the tiles in the grid cells covered by the collidable are tested.
 
         Args:
             collidable (Collidable): The collidable to get the colliding tile of.
-            tile_states (list[TileState]): The list of tile states.
+            tile_index (TileIndex): The spatial index of the tiles.
 
         Returns:
-            TileState | None: The colliding tile of the collidable or None if no collision.
+            TileState | Collider | None: The first colliding tile or collider, or None if no collision.
         """
-        rect = collidable.get_collision_rect()
-        for tile in tile_states:
-            if rect.colliderect(tile.rect):
-                return tile
-        return None
+        colliding_tiles = tile_index.query(collidable.get_collision_rect())
+        if not colliding_tiles:
+            return None
+        return colliding_tiles[0]
 
     def is_colliding_from_top(
         self,
         collidable: Collidable,
-        tile_state: TileState,
+        tile_state: TileState | Collider,
     ) -> bool:
         """
         Checks if the collidable is colliding from the top of the tile.
 
         Args:
             collidable (Collidable): The collidable to check.
-            tile_state (TileState): The tile state to check against.
+            tile_state (TileState | Collider): The tile or collider to check against.
 
         Returns:
             bool: True if the collidable is colliding from the top of the tile, False otherwise.
@@ -146,21 +232,21 @@ class CollideTileRule:
         velocity = collidable.get_velocity()
         return (
             rect.colliderect(tile_state.rect)
-            and rect.bottom <= tile_state.rect.centery
+            and rect.bottom <= get_contact_bounds(tile_state.rect).top
             and velocity.y >= 0
         )
 
     def is_colliding_from_bottom(
         self,
         collidable: Collidable,
-        tile_state: TileState,
+        tile_state: TileState | Collider,
     ) -> bool:
         """
         Checks if the collidable is colliding from the bottom of the tile.
 
         Args:
             collidable (Collidable): The collidable to check.
-            tile_state (TileState): The tile state to check against.
+            tile_state (TileState | Collider): The tile or collider to check against.
 
         Returns:
             bool: True if the collidable is colliding from the bottom of the tile, False otherwise.
@@ -169,21 +255,21 @@ class CollideTileRule:
         velocity = collidable.get_velocity()
         return (
             rect.colliderect(tile_state.rect)
-            and rect.top >= tile_state.rect.centery
+            and rect.top >= get_contact_bounds(tile_state.rect).bottom
             and velocity.y <= 0
         )
 
     def is_colliding_from_left(
         self,
         collidable: Collidable,
-        tile_state: TileState,
+        tile_state: TileState | Collider,
     ) -> bool:
         """
         Checks if the collidable is colliding from the left of the tile.
 
         Args:
             collidable (Collidable): The collidable to check.
-            tile_state (TileState): The tile state to check against.
+            tile_state (TileState | Collider): The tile or collider to check against.
 
         Returns:
             bool: True if the collidable is colliding from the left of the tile, False otherwise.
@@ -192,21 +278,21 @@ class CollideTileRule:
         velocity = collidable.get_velocity()
         return (
             rect.colliderect(tile_state.rect)
-            and rect.right <= tile_state.rect.centerx
+            and rect.right <= get_contact_bounds(tile_state.rect).left
             and velocity.x >= 0
         )
 
     def is_colliding_from_right(
         self,
         collidable: Collidable,
-        tile_state: TileState,
+        tile_state: TileState | Collider,
     ) -> bool:
         """
         Checks if the collidable is colliding from the right of the tile.
 
         Args:
             collidable (Collidable): The collidable to check.
-            tile_state (TileState): The tile state to check against.
+            tile_state (TileState | Collider): The tile or collider to check against.
 
         Returns:
             bool: True if the collidable is colliding from the right of the tile, False otherwise.
@@ -215,11 +301,36 @@ class CollideTileRule:
         velocity = collidable.get_velocity()
         return (
             rect.colliderect(tile_state.rect)
-            and rect.left >= tile_state.rect.centerx
+            and rect.left >= get_contact_bounds(tile_state.rect).right
             and velocity.x <= 0
         )
 
 
+def get_contact_bounds(rect: pygame.Rect) -> pygame.Rect:
+    """
+    Gets the bounds a collidable must stay within to touch a side of a tile or collider.
+    A collidable touches the top of a rect when its bottom is at most half a
+    tile below the top edge, and likewise for the other sides, so a single tile
+    is split at its center and a merged collider is resolved against the edges
+    of its outer tiles, like tile by tile.
+
+    Args:
+        rect (pygame.Rect): The rect of the tile or collider.
+
+    Returns:
+        pygame.Rect: The rect whose top, bottom, left and right are the limits of the sides.
+    """
+    cell_width, cell_height = TILE_SIZE
+    depth_x = min(rect.width, cell_width) // 2
+    depth_y = min(rect.height, cell_height) // 2
+    return pygame.Rect(
+        rect.left + depth_x,
+        rect.top + depth_y,
+        rect.width - 2 * depth_x,
+        rect.height - 2 * depth_y,
+    )
+
+
 def apply_on_game_state_collidables(
     f: Callable[[Collidable], Collidable],
     game_state: GameState,
@@ -235,12 +346,6 @@ def apply_on_game_state_collidables(
         GameState: The new game state with the function applied to each collidable.
     """
     collidables = game_state.get_collidables()
-    attr_to_new_collidables: dict[str, Collidable] = {}
-    for attr, collidable in collidables:
-        new_collidable = f(collidable)
-        attr_to_new_collidables[attr] = new_collidable
-
-    return replace(
-        game_state,
-        **attr_to_new_collidables,
+    return game_state.replace_collidables(
+        [f(collidable) for _, collidable in collidables]
     )
@@ -0,0 +1,321 @@
+import pygame
+
+from dataclasses import replace
+
+from ..state.game_state import GameState
+from ..state.player import PlayerState, PlayerMode
+from ..state.direction import HorizontalDirection
+from ..state.tile import TileState
+from ..state.tile_index import TileIndex, create_tile_index
+from ..state.tile_grid import TileGrid
+from ..state.zombie import ZombieMode
+from ..numpy_support import np
+from ..constants.physics import SIMULATION_TIMESTEP
+from ..constants.zombie import (
+    ZOMBIE_WALK_SPEED,
+    ZOMBIE_CHASE_SPEED,
+    ZOMBIE_CHASE_DISTANCE,
+    ZOMBIE_HIT_REACH,
+    ZOMBIE_DEATH_TIME,
+)
+
+
+PATROLLING = ZombieMode.PATROLLING.value
+CHASING = ZombieMode.CHASING.value
+DYING = ZombieMode.DYING.value
+
+
+class ZombieChaseRule:
+    def __init__(self, chase_distance: float = ZOMBIE_CHASE_DISTANCE) -> None:
+        """
+        Initializes the zombie chase rule.
+
+        Args:
+            chase_distance (float): The horizontal distance from which zombies see the player.
+
+        Returns:
+            None
+        """
+        self.chase_distance = chase_distance
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Makes the zombies that see the player chase it, and the others patrol.
+        A zombie sees the player when the player is within the chase distance
+        and their rects overlap vertically, i.e. they stand on the same level.
+        Chasing zombies face the player unless it is right above them.
+
+        Args:
+            game_state (GameState): The game state to apply the zombie chase rule to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The new game state with the zombie chase rule applied.
+        """
+        horde = game_state.zombies
+        if horde is None or not len(horde):
+            return game_state
+
+        player_rect = game_state.player.rect
+        x = horde.positions[:, 0]
+        y = horde.positions[:, 1]
+        offsets = player_rect.centerx - (x + horde.width / 2)
+        alive = horde.modes != DYING
+        chasing = (
+            alive
+            & (np.abs(offsets) <= self.chase_distance)
+            & (y < player_rect.bottom)
+            & (y + horde.height > player_rect.top)
+        )
+        turning = chasing & (np.abs(offsets) > horde.width / 2)
+
+        return replace(
+            game_state,
+            zombies=horde.replace_arrays(
+                modes=np.where(
+                    chasing,
+                    CHASING,
+                    np.where(alive, PATROLLING, horde.modes),
+                ).astype(np.uint8),
+                directions=np.where(turning, np.sign(offsets), horde.directions),
+            ),
+        )
+
+
+class ZombiePatrolRule:
+    def __init__(
+        self,
+        walk_speed: float = ZOMBIE_WALK_SPEED,
+        chase_speed: float = ZOMBIE_CHASE_SPEED,
+        timestep: float = SIMULATION_TIMESTEP,
+    ) -> None:
+        """
+        Initializes the zombie patrol rule.
+
+        Args:
+            walk_speed (float): The speed of patrolling zombies.
+            chase_speed (float): The speed of chasing zombies.
+            timestep (float): The simulated time of one step in seconds.
+
+        Returns:
+            None
+        """
+        self.walk_speed = walk_speed
+        self.chase_speed = chase_speed
+        self.timestep = timestep
+        self.tile_index: TileIndex | None = None
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Walks the zombies along the tiles they stand on.
+        A zombie that would step past a ledge or into a wall does not move:
+        a patrolling zombie turns around and a chasing zombie waits for the
+        player at the edge. Walking zombies advance their animation.
+
+        Args:
+            game_state (GameState): The game state to apply the zombie patrol rule to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The new game state with the zombie patrol rule applied.
+        """
+        horde = game_state.zombies
+        if horde is None or not len(horde):
+            return game_state
+
+        tile_index = self.get_tile_index(game_state.tiles)
+        cell_width, cell_height = tile_index.cell_width, tile_index.cell_height
+        x = horde.positions[:, 0]
+        y = horde.positions[:, 1]
+        directions = horde.directions
+        walking = horde.modes != DYING
+        chasing = horde.modes == CHASING
+
+        next_x = x + directions * np.where(chasing, self.chase_speed, self.walk_speed) * self.timestep
+        front_columns = np.floor_divide(
+            np.where(directions > 0, next_x + horde.width - 1, next_x),
+            cell_width,
+        ).astype(np.intp)
+        feet = y + horde.height
+        ground_rows = np.floor_divide(feet, cell_height).astype(np.intp)
+        blocked = ~is_solid(tile_index, front_columns, ground_rows)
+        for row_offset in range(1, -(-horde.height // cell_height) + 1):
+            blocked |= is_solid(tile_index, front_columns, ground_rows - row_offset)
+
+        moving = walking & ~blocked
+        turning = walking & blocked & ~chasing
+        positions = np.column_stack((np.where(moving, next_x, x), y))
+
+        return replace(
+            game_state,
+            zombies=horde.replace_arrays(
+                positions=positions,
+                directions=np.where(turning, -directions, directions),
+                animation_times=np.where(
+                    moving,
+                    horde.animation_times + self.timestep,
+                    horde.animation_times,
+                ),
+            ),
+        )
+
+    def get_tile_index(self, tile_states: list[TileState]) -> TileIndex:
+        """
+        Gets the spatial index of the tiles, rebuilding it when the tile list changed.
+
+        Args:
+            tile_states (list[TileState]): The list of tile states.
+
+        Returns:
+            TileIndex: The spatial index of the tiles.
+        """
+        if self.tile_index is None or self.tile_index.tiles is not tile_states:
+            self.tile_index = create_tile_index(tile_states)
+        return self.tile_index
+
+
+class ZombieDieRule:
+    def __init__(
+        self,
+        hit_reach: int = ZOMBIE_HIT_REACH,
+        death_time: float = ZOMBIE_DEATH_TIME,
+        timestep: float = SIMULATION_TIMESTEP,
+    ) -> None:
+        """
+        Initializes the zombie die rule.
+
+        Args:
+            hit_reach (int): The distance in front of the player its attacks reach.
+            death_time (float): The time a dying zombie stays before it is removed.
+            timestep (float): The simulated time of one step in seconds.
+
+        Returns:
+            None
+        """
+        self.hit_reach = hit_reach
+        self.death_time = death_time
+        self.timestep = timestep
+
+    def __call__(
+        self,
+        game_state: GameState,
+        events: list[pygame.event.Event],
+    ) -> GameState:
+        """
+        Kills the zombies hit by the attacking player and removes the dead ones.
+        A hit zombie plays its dying animation and is removed from the horde
+        once the death time has passed.
+
+        Args:
+            game_state (GameState): The game state to apply the zombie die rule to.
+            events (list[pygame.event.Event]): The events occurred in the current frame.
+
+        Returns:
+            GameState: The new game state with the zombie die rule applied.
+        """
+        horde = game_state.zombies
+        if horde is None or not len(horde):
+            return game_state
+
+        modes = horde.modes
+        animation_times = horde.animation_times
+        dying = modes == DYING
+        if game_state.player.mode is PlayerMode.ATTACKING:
+            attack_rect = self.get_attack_rect(game_state.player)
+            x = horde.positions[:, 0]
+            y = horde.positions[:, 1]
+            hit = (
+                ~dying
+                & (x < attack_rect.right)
+                & (x + horde.width > attack_rect.left)
+                & (y < attack_rect.bottom)
+                & (y + horde.height > attack_rect.top)
+            )
+            if hit.any():
+                dying = dying | hit
+                modes = np.where(hit, DYING, modes).astype(np.uint8)
+                animation_times = np.where(hit, 0.0, animation_times)
+
+        if not dying.any():
+            return game_state
+
+        animation_times = np.where(dying, animation_times + self.timestep, animation_times)
+        horde = horde.replace_arrays(modes=modes, animation_times=animation_times)
+        dead = dying & (animation_times >= self.death_time)
+        if dead.any():
+            horde = horde.select(~dead)
+        return replace(game_state, zombies=horde)
+
+    def get_attack_rect(self, player_state: PlayerState) -> pygame.Rect:
+        """
+        Gets the region hit by an attack of the player.
+
+        Args:
+            player_state (PlayerState): The attacking player.
+
+        Returns:
+            pygame.Rect: The rect of the player stretched by the hit reach in the direction it faces.
+        """
+        attack_rect = player_state.rect.inflate(self.hit_reach, 0)
+        if player_state.horizontal_direction is HorizontalDirection.RIGHT:
+            attack_rect.left = player_state.rect.left
+        else:
+            attack_rect.right = player_state.rect.right
+        return attack_rect
+
+
+def is_solid(
+    tile_index: TileIndex,
+    columns: "np.ndarray",
+    rows: "np.ndarray",
+) -> "np.ndarray":
+    """
+    Checks which of a batch of grid cells hold a tile.
+    The cells of a TileGrid are read with one array lookup, other indexes
+    are asked cell by cell.
+
+    Args:
+        tile_index (TileIndex): The spatial index of the tiles.
+        columns (np.ndarray): The integer columns of the cells.
+        rows (np.ndarray): The integer rows of the cells.
+
+    Returns:
+        np.ndarray: True for the cells holding a tile, False for empty cells and cells outside the grid.
+    """
+    inside = (
+        (columns >= 0)
+        & (columns < tile_index.columns)
+        & (rows >= 0)
+        & (rows < tile_index.rows)
+    )
+    if isinstance(tile_index, TileGrid):
+        cells = np.frombuffer(tile_index.cells, dtype=np.uint8).reshape(
+            tile_index.rows, tile_index.columns
+        )
+        return inside & (
+            cells[
+                np.clip(rows, 0, tile_index.rows - 1),
+                np.clip(columns, 0, tile_index.columns - 1),
+            ]
+            != 0
+        )
+
+    return np.array(
+        [
+            is_inside and bool(tile_index.get_cell(column, row))
+            for is_inside, column, row in zip(
+                inside.tolist(),
+                columns.tolist(),
+                rows.tolist(),
+            )
+        ],
+        dtype=bool,
+    )
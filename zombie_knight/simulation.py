@@ -0,0 +1,177 @@
+import argparse
+import json
+import random
+import sys
+import time
+
+import pygame
+
+from dataclasses import dataclass
+from typing import Callable
+
+from .board import create_game_state, create_rules
+from .input import FrameInput, ScriptedKeyboard
+from .profiling import Profiler
+from .rules.pipeline import RulePipeline
+from .state.game_state import GameState
+
+
+InputScript = Callable[[int, GameState], FrameInput]
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    game_state: GameState
+    frames: int
+    elapsed: float
+    trace: list[GameState] | None = None
+
+    @property
+    def frames_per_second(self) -> float:
+        """
+        Gets the number of simulated frames per second of real time.
+
+        Returns:
+            float: The frames per second of the simulation.
+        """
+        return self.frames / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def simulate(
+    initial_state: GameState,
+    rules: list,
+    input_script: InputScript,
+    n_frames: int,
+    keyboard: ScriptedKeyboard | None = None,
+    trace: bool = False,
+    on_frame: Callable[[int, GameState], None] | None = None,
+) -> SimulationResult:
+    """
+    Applies the rules frame after frame as fast as possible, without a display or a frame cap.
+    Every frame is one fixed simulation step. The input script is asked for the
+    input of every frame before the rules are applied, its pressed keys are set
+    on the keyboard and its events are passed to the rules.
+
+    Args:
+        initial_state (GameState): The game state to start from.
+        rules (list): The rules to apply every frame, fused into a RulePipeline.
+        input_script (InputScript): The function giving the input of a frame
+            from the frame number and the game state at the start of the frame.
+        n_frames (int): The number of frames to simulate.
+        keyboard (ScriptedKeyboard | None): The keyboard the rules were created
+            with, or None if the rules read no keys.
+        trace (bool): Whether to keep the game state of every frame. Game states
+            are immutable, so the trace shares everything that did not change.
+        on_frame (Callable[[int, GameState], None] | None): The function called
+            with the frame number and the game state after every frame, e.g. to render it.
+
+    Returns:
+        SimulationResult: The final game state, the frame times and the optional trace.
+    """
+    pipeline = RulePipeline(rules)
+    game_states = [] if trace else None
+    game_state = initial_state
+
+    started_at = time.perf_counter()
+    for frame in range(n_frames):
+        frame_input = input_script(frame, game_state)
+        if keyboard is not None:
+            keyboard.press(frame_input.pressed_keys)
+        game_state = pipeline(game_state, frame_input.events)
+        if game_states is not None:
+            game_states.append(game_state)
+        if on_frame is not None:
+            on_frame(frame, game_state)
+    elapsed = time.perf_counter() - started_at
+
+    return SimulationResult(game_state, n_frames, elapsed, game_states)
+
+
+def create_input_script(frame_inputs: list[FrameInput]) -> InputScript:
+    """
+    Creates an input script replaying a list of frame inputs.
+    No key is pressed after the end of the list.
+
+    Args:
+        frame_inputs (list[FrameInput]): The input of every frame.
+
+    Returns:
+        InputScript: The input script.
+    """
+    no_input = FrameInput()
+
+    def input_script(frame: int, game_state: GameState) -> FrameInput:
+        return frame_inputs[frame] if frame < len(frame_inputs) else no_input
+
+    return input_script
+
+
+def create_random_input_script(
+    seed: int = 0,
+    hold_frames: int = 120,
+    jump_probability: float = 0.01,
+) -> InputScript:
+    """
+    Creates an input script that walks in random directions and jumps at random.
+
+    Args:
+        seed (int): The seed of the random generator.
+        hold_frames (int): The number of frames each direction is held for.
+        jump_probability (float): The probability of a jump in every frame.
+
+    Returns:
+        InputScript: The input script.
+    """
+    rng = random.Random(seed)
+    key_choices = [frozenset(), frozenset({pygame.K_LEFT}), frozenset({pygame.K_RIGHT})]
+    jump_events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+    pressed_keys = frozenset()
+
+    def input_script(frame: int, game_state: GameState) -> FrameInput:
+        nonlocal pressed_keys
+        if frame % hold_frames == 0:
+            pressed_keys = rng.choice(key_choices)
+        events = jump_events if rng.random() < jump_probability else []
+        return FrameInput(pressed_keys, events)
+
+    return input_script
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Simulates the game headless with random input at full speed.",
+    )
+    parser.add_argument("--frames", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time every rule and report the rule time breakdown",
+    )
+    args = parser.parse_args()
+
+    keyboard = ScriptedKeyboard()
+    profiler = Profiler(enabled=args.profile)
+    result = simulate(
+        create_game_state(),
+        profiler.profile_rules(create_rules(keyboard)),
+        create_random_input_script(args.seed),
+        args.frames,
+        keyboard,
+    )
+    json.dump(
+        {
+            "frames": result.frames,
+            "elapsed": result.elapsed,
+            "frames_per_second": result.frames_per_second,
+            "player_rect": list(result.game_state.player.rect),
+            **({"profile": profiler.summarize()} if args.profile else {}),
+        },
+        sys.stdout,
+        indent=2,
+    )
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,11 @@
 from .game_state import GameState
 from .player import PlayerState, PlayerMode
-from .tile import (
-    TileState,
-    DirtTileState,
-    GrassTileState,
-    LeftTileState,
-    RightTileState,
-)
+from .tile import TileState, TileKind
+from .tile_grid import TileGrid
+from .chunked_level import ChunkedTileGrid
+from .collider_mesh import Collider, ColliderMesh
+from .matter_arrays import MatterArrays
+from .zombie import ZombieState, ZombieKind, ZombieMode, ZombieHorde, spawn_zombies
 from .direction import HorizontalDirection
 from .utils import create_tiles_from_tile_map
 
@@ -16,10 +15,17 @@ __all__ = [
     "PlayerState",
     "PlayerMode",
     "TileState",
-    "DirtTileState",
-    "GrassTileState",
-    "LeftTileState",
-    "RightTileState",
+    "TileKind",
+    "TileGrid",
+    "ChunkedTileGrid",
+    "Collider",
+    "ColliderMesh",
+    "MatterArrays",
+    "ZombieState",
+    "ZombieKind",
+    "ZombieMode",
+    "ZombieHorde",
+    "spawn_zombies",
     "HorizontalDirection",
     "create_tiles_from_tile_map",
 ]
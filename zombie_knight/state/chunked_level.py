@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+import struct
+import threading
+
+import pygame
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterator
+
+from .tile import TileState
+from .tile_grid import CellGrid, TileGrid, SOLID_CELL_PATTERN, cell_to_kind
+from ..constants.tile import TILE_SIZE
+from ..constants.level import (
+    LEVEL_CHUNK_SIZE,
+    CHUNK_CACHE_MEMORY_LIMIT,
+    CHUNK_PREFETCH_WORKERS,
+    CHUNK_PREFETCH_LOOKAHEAD,
+)
+
+
+LEVEL_MAGIC = b"ZKCL"
+LEVEL_VERSION = 1
+LEVEL_HEADER = struct.Struct("<4sHHII")
+
+
+class LevelFile:
+    def __init__(self, path: str) -> None:
+        """
+        Opens a chunked level file.
+        The level is split into square chunks of chunk_size x chunk_size cells,
+        stored one after the other in row-major chunk order after the header.
+        Every chunk holds one byte per cell in row-major order, like a TileGrid,
+        and chunks at the right and bottom edges are padded with empty cells,
+        so the position of a chunk in the file follows from its coordinates.
+
+        Args:
+            path (str): The path of the level file.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.file: BinaryIO = open(path, "rb")
+        self.lock = threading.Lock()
+
+        magic, version, chunk_size, columns, rows = LEVEL_HEADER.unpack(
+            self.file.read(LEVEL_HEADER.size)
+        )
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError(f"Unsupported level file {path}")
+
+        self.chunk_size = chunk_size
+        self.columns = columns
+        self.rows = rows
+        self.chunk_columns = -(-columns // chunk_size)
+        self.chunk_rows = -(-rows // chunk_size)
+
+    def read_chunk(self, chunk_column: int, chunk_row: int) -> bytes:
+        """
+        Reads the cells of a chunk.
+
+        Args:
+            chunk_column (int): The column of the chunk.
+            chunk_row (int): The row of the chunk.
+
+        Returns:
+            bytes: The cells of the chunk in row-major order.
+        """
+        chunk_bytes = self.chunk_size * self.chunk_size
+        offset = LEVEL_HEADER.size + (
+            chunk_row * self.chunk_columns + chunk_column
+        ) * chunk_bytes
+        with self.lock:
+            self.file.seek(offset)
+            return self.file.read(chunk_bytes)
+
+    def close(self) -> None:
+        """
+        Closes the level file.
+
+        Returns:
+            None
+        """
+        self.file.close()
+
+
+def write_level(
+    path: str,
+    columns: int,
+    rows: int,
+    chunk_rows: Iterator[bytes | bytearray],
+    chunk_size: int = LEVEL_CHUNK_SIZE,
+) -> None:
+    """
+    Writes a chunked level file band by band, so the whole level is never held in memory.
+
+    Args:
+        path (str): The path of the level file.
+        columns (int): The number of columns of the level.
+        rows (int): The number of rows of the level.
+        chunk_rows (Iterator[bytes | bytearray]): The cells of every band of
+            chunk_size rows, row-major, columns cells per row. The last band
+            may hold fewer rows.
+        chunk_size (int): The number of cells along each side of a chunk.
+
+    Returns:
+        None
+    """
+    chunk_columns = -(-columns // chunk_size)
+    with open(path, "wb") as file:
+        file.write(LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, chunk_size, columns, rows))
+        for band in chunk_rows:
+            band_rows = len(band) // columns
+            for chunk_column in range(chunk_columns):
+                chunk = bytearray(chunk_size * chunk_size)
+                start = chunk_column * chunk_size
+                width = min(chunk_size, columns - start)
+                for row in range(band_rows):
+                    chunk[row * chunk_size : row * chunk_size + width] = band[
+                        row * columns + start : row * columns + start + width
+                    ]
+                file.write(chunk)
+
+
+class ChunkCache:
+    def __init__(
+        self,
+        level_file: LevelFile,
+        memory_limit: int = CHUNK_CACHE_MEMORY_LIMIT,
+        max_workers: int = CHUNK_PREFETCH_WORKERS,
+    ) -> None:
+        """
+        Initializes the chunk cache.
+        Chunks are kept in least recently used order and the oldest ones are
+        dropped once their cells take more than the memory limit. Chunks can be
+        prefetched on a background thread before they are needed, and chunks
+        that are needed but not loaded yet are read right away.
+
+        Args:
+            level_file (LevelFile): The level file to read chunks from.
+            memory_limit (int): The maximum number of bytes taken by the cached chunks.
+            max_workers (int): The number of prefetching threads.
+
+        Returns:
+            None
+        """
+        self.level_file = level_file
+        self.memory_limit = memory_limit
+        self.chunks: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        self.pending: set[tuple[int, int]] = set()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="chunk-prefetch",
+        )
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+
+    def get(self, key: tuple[int, int]) -> bytes:
+        """
+        Gets the cells of a chunk, reading it if it is not loaded.
+
+        Args:
+            key (tuple[int, int]): The column and row of the chunk.
+
+        Returns:
+            bytes: The cells of the chunk.
+        """
+        with self.lock:
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                self.chunks.move_to_end(key)
+                self.hits += 1
+                return chunk
+            self.misses += 1
+
+        chunk = self.level_file.read_chunk(*key)
+        self.add(key, chunk)
+        return chunk
+
+    def prefetch(self, keys: list[tuple[int, int]]) -> None:
+        """
+        Requests chunks to be read in the background if they are not loaded or requested yet.
+
+        Args:
+            keys (list[tuple[int, int]]): The columns and rows of the chunks.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            keys = [
+                key for key in keys if key not in self.chunks and key not in self.pending
+            ]
+            self.pending.update(keys)
+        for key in keys:
+            self.executor.submit(self.load_prefetched, key)
+
+    def load_prefetched(self, key: tuple[int, int]) -> None:
+        """
+        Reads a prefetched chunk into the cache.
+
+        Args:
+            key (tuple[int, int]): The column and row of the chunk.
+
+        Returns:
+            None
+        """
+        try:
+            chunk = self.level_file.read_chunk(*key)
+            self.add(key, chunk)
+            with self.lock:
+                self.prefetched += 1
+        finally:
+            with self.lock:
+                self.pending.discard(key)
+
+    def add(self, key: tuple[int, int], chunk: bytes) -> None:
+        """
+        Adds a chunk to the cache and evicts the least recently used chunks over the memory limit.
+
+        Args:
+            key (tuple[int, int]): The column and row of the chunk.
+            chunk (bytes): The cells of the chunk.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.chunks[key] = chunk
+            self.chunks.move_to_end(key)
+            while len(self.chunks) > 1 and self.get_memory() > self.memory_limit:
+                self.chunks.popitem(last=False)
+
+    def get_memory(self) -> int:
+        """
+        Gets the number of bytes taken by the cells of the cached chunks.
+
+        Returns:
+            int: The number of bytes.
+        """
+        return len(self.chunks) * self.level_file.chunk_size**2
+
+    def shutdown(self) -> None:
+        """
+        Stops the prefetching threads, dropping the chunks that have not started loading.
+
+        Returns:
+            None
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ChunkedTileGrid(CellGrid):
+    def __init__(self, chunk_cache: ChunkCache) -> None:
+        """
+        Initializes the chunked tile grid, a tile grid read from a level file chunk by chunk.
+        Only the chunks around the queried rects are loaded, so collision and
+        rendering work against it like against a TileGrid while the memory
+        stays within the limit of the chunk cache. Unlike a TileGrid, it cannot
+        be iterated over or counted, since both read every chunk of the level;
+        tools use the full scans iter_tiles and count_tiles instead.
+
+        Args:
+            chunk_cache (ChunkCache): The cache of the chunks of the level.
+
+        Returns:
+            None
+        """
+        level_file = chunk_cache.level_file
+        self.tiles = self
+        self.chunk_cache = chunk_cache
+        self.chunk_size = level_file.chunk_size
+        self.columns = level_file.columns
+        self.rows = level_file.rows
+        self.cell_width, self.cell_height = TILE_SIZE
+        self.solid_cell_count: int | None = None
+
+    @classmethod
+    def open(
+        cls,
+        path: str,
+        memory_limit: int = CHUNK_CACHE_MEMORY_LIMIT,
+    ) -> ChunkedTileGrid:
+        """
+        Opens a chunked level file as a tile grid.
+
+        Args:
+            path (str): The path of the level file.
+            memory_limit (int): The maximum number of bytes taken by the cached chunks.
+
+        Returns:
+            ChunkedTileGrid: The tile grid of the level.
+        """
+        return cls(ChunkCache(LevelFile(path), memory_limit))
+
+    def close(self) -> None:
+        """
+        Stops the prefetching threads of the chunk cache and closes the level file.
+
+        Returns:
+            None
+        """
+        self.chunk_cache.shutdown()
+        self.chunk_cache.level_file.close()
+
+    def __enter__(self) -> ChunkedTileGrid:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_cell_value(self, column: int, row: int) -> int:
+        """
+        Gets the byte stored for a cell, reading its chunk if needed.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            int: 0 for an empty cell, the TileKind value of the tile otherwise.
+        """
+        chunk_column, local_column = divmod(column, self.chunk_size)
+        chunk_row, local_row = divmod(row, self.chunk_size)
+        chunk = self.chunk_cache.get((chunk_column, chunk_row))
+        return chunk[local_row * self.chunk_size + local_column]
+
+    def get_region(self, columns: int, rows: int) -> TileGrid:
+        """
+        Copies the cells at the top left of the level into a tile grid, reading the chunks they cover.
+
+        Args:
+            columns (int): The number of columns to copy, at most the columns of the level.
+            rows (int): The number of rows to copy, at most the rows of the level.
+
+        Returns:
+            TileGrid: The tile grid of the region, whose cells have the same columns and rows as in the level.
+        """
+        columns = min(columns, self.columns)
+        rows = min(rows, self.rows)
+        size = self.chunk_size
+        cells = bytearray(columns * rows)
+        for row in range(rows):
+            chunk_row, local_row = divmod(row, size)
+            for start in range(0, columns, size):
+                chunk = self.chunk_cache.get((start // size, chunk_row))
+                width = min(size, columns - start)
+                cells[row * columns + start : row * columns + start + width] = chunk[
+                    local_row * size : local_row * size + width
+                ]
+        return TileGrid(columns, rows, cells)
+
+    def query(self, rect: pygame.Rect) -> list[TileState]:
+        """
+        Gets the tiles overlapping a rect, reading the chunks it covers if needed.
+
+        Args:
+            rect (pygame.Rect): The rect in pixels.
+
+        Returns:
+            list[TileState]: The overlapping tiles in row-major order.
+        """
+        columns, rows = self.get_cell_ranges(rect)
+        size = self.chunk_size
+        chunks = {}
+        tiles = []
+        for row in rows:
+            chunk_row, local_row = divmod(row, size)
+            for column in columns:
+                chunk_column, local_column = divmod(column, size)
+                key = (chunk_column, chunk_row)
+                chunk = chunks.get(key)
+                if chunk is None:
+                    chunk = chunks[key] = self.chunk_cache.get(key)
+                cell = chunk[local_row * size + local_column]
+                if cell:
+                    tile = TileState(cell_to_kind[cell], column, row)
+                    if tile.rect.colliderect(rect):
+                        tiles.append(tile)
+        return tiles
+
+    def prefetch(
+        self,
+        rect: pygame.Rect,
+        velocity: pygame.Vector2 | None = None,
+        lookahead: float = CHUNK_PREFETCH_LOOKAHEAD,
+    ) -> None:
+        """
+        Prefetches the chunks around a rect and ahead of its movement.
+        The rect is grown by one chunk on every side and stretched to where
+        the velocity takes it within the lookahead time.
+
+        Args:
+            rect (pygame.Rect): The rect in pixels, e.g. of the player.
+            velocity (pygame.Vector2 | None): The velocity of the rect in pixels
+                per second, or None for a rect standing still.
+            lookahead (float): The time to prefetch ahead in seconds.
+
+        Returns:
+            None
+        """
+        if velocity is None:
+            velocity = pygame.Vector2(0, 0)
+        margin_x = self.chunk_size * self.cell_width
+        margin_y = self.chunk_size * self.cell_height
+        area = rect.inflate(2 * margin_x, 2 * margin_y)
+        area.union_ip(
+            area.move(round(velocity.x * lookahead), round(velocity.y * lookahead))
+        )
+
+        columns, rows = self.get_cell_ranges(area)
+        if not columns or not rows:
+            return
+        self.chunk_cache.prefetch(
+            [
+                (chunk_column, chunk_row)
+                for chunk_row in range(rows[0] // self.chunk_size, rows[-1] // self.chunk_size + 1)
+                for chunk_column in range(
+                    columns[0] // self.chunk_size,
+                    columns[-1] // self.chunk_size + 1,
+                )
+            ]
+        )
+
+    def iter_tiles(self) -> Iterator[TileState]:
+        """
+        Iterates over the tile states of the solid cells in row-major order.
+        This is a full scan reading every chunk of the level through the cache,
+        only meant for tools, never for a frame.
+
+        Returns:
+            Iterator[TileState]: The tile states.
+        """
+        for row in range(self.rows):
+            for column in range(self.columns):
+                tile = self.get_tile(column, row)
+                if tile is not None:
+                    yield tile
+
+    def count_tiles(self) -> int:
+        """
+        Counts the solid cells of the level.
+        This is a full scan reading every chunk from the file once, only meant
+        for tools, never for a frame.
+
+        Returns:
+            int: The number of solid cells.
+        """
+        if self.solid_cell_count is None:
+            level_file = self.chunk_cache.level_file
+            self.solid_cell_count = sum(
+                sum(1 for _ in SOLID_CELL_PATTERN.finditer(level_file.read_chunk(column, row)))
+                for row in range(level_file.chunk_rows)
+                for column in range(level_file.chunk_columns)
+            )
+        return self.solid_cell_count
+
+    def __iter__(self) -> Iterator[TileState]:
+        raise TypeError(
+            "Iterating over a ChunkedTileGrid reads every chunk of the level, use iter_tiles"
+        )
+
+    def __len__(self) -> int:
+        raise TypeError(
+            "Counting the tiles of a ChunkedTileGrid reads every chunk of the level, use count_tiles"
+        )
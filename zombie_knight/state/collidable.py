@@ -8,6 +8,8 @@ from .matter import Matter
 
 
 class Collidable(Matter):
+    __slots__ = ()
+
     @abstractmethod
     def get_collision_rect(self) -> pygame.Rect:
         """
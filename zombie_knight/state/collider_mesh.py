@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import bisect
+import re
+
+import pygame
+
+from dataclasses import dataclass
+
+from .tile_grid import TileGrid
+from .tile_index import TileIndex
+from ..constants.tile import TILE_SIZE, COLLIDER_STRIP_ROWS
+
+
+SOLID_RUN_PATTERN = re.compile(b"[^\x00]+")
+
+
+@dataclass(slots=True, frozen=True)
+class Collider:
+    column: int
+    row: int
+    columns: int
+    rows: int
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        Gets the rect of the collider, derived from the grid cells it covers.
+
+        Returns:
+            pygame.Rect: The rect of the collider.
+        """
+        width, height = TILE_SIZE
+        return pygame.Rect(
+            self.column * width,
+            self.row * height,
+            self.columns * width,
+            self.rows * height,
+        )
+
+
+class ColliderMesh(TileIndex):
+    def __init__(
+        self,
+        tile_grid: TileGrid,
+        strip_rows: int = COLLIDER_STRIP_ROWS,
+        previous: ColliderMesh | None = None,
+    ) -> None:
+        """
+        Initializes the collider mesh, the solid cells of a tile grid merged into rectangles.
+        The grid is split into horizontal strips of strip_rows rows that are meshed
+        independently: in every strip, each run of solid cells in a row that is
+        not covered yet becomes a collider, grown down as long as the cells below
+        the whole run are solid. Queries return the colliders instead of the tiles.
+        When the mesh of the previous tile grid is given, the strips whose cells
+        did not change are reused, so changing a tile only remeshes its strip.
+
+        Args:
+            tile_grid (TileGrid): The tile grid to mesh.
+            strip_rows (int): The number of rows of a strip.
+            previous (ColliderMesh | None): The mesh of the previous tile grid, if any.
+
+        Returns:
+            None
+        """
+        self.tiles = tile_grid
+        self.columns = tile_grid.columns
+        self.rows = tile_grid.rows
+        self.cell_width, self.cell_height = TILE_SIZE
+        self.strip_rows = strip_rows
+
+        if (
+            previous is not None
+            and previous.strip_rows == strip_rows
+            and (previous.columns, previous.rows) == (self.columns, self.rows)
+        ):
+            self.strips = list(previous.strips)
+            self.row_starts = list(previous.row_starts)
+            self.row_colliders = list(previous.row_colliders)
+            strip_length = strip_rows * self.columns
+            for strip, top in enumerate(range(0, self.rows, strip_rows)):
+                start = top * self.columns
+                cells = tile_grid.cells[start : start + strip_length].tobytes()
+                if cells != previous.tiles.cells[start : start + strip_length].tobytes():
+                    self.mesh_strip(strip)
+        else:
+            self.strips: list[list[Collider]] = []
+            self.row_starts: list[list[int]] = [[] for _ in range(self.rows)]
+            self.row_colliders: list[list[Collider]] = [[] for _ in range(self.rows)]
+            for strip in range(-(-self.rows // strip_rows)):
+                self.strips.append([])
+                self.mesh_strip(strip)
+
+    def mesh_strip(self, strip: int) -> None:
+        """
+        Merges the solid cells of a strip into colliders with greedy meshing.
+
+        Args:
+            strip (int): The index of the strip.
+
+        Returns:
+            None
+        """
+        columns = self.columns
+        top = strip * self.strip_rows
+        bottom = min(top + self.strip_rows, self.rows)
+        cells = self.tiles.cells[top * columns : bottom * columns].tobytes()
+
+        colliders = []
+        covering: list[Collider] = []
+        for row in range(top, bottom):
+            offset = (row - top) * columns
+            row_cells = bytearray(cells[offset : offset + columns])
+            covering = [
+                collider for collider in covering if collider.row + collider.rows > row
+            ]
+            for collider in covering:
+                row_cells[collider.column : collider.column + collider.columns] = bytes(
+                    collider.columns
+                )
+
+            for match in SOLID_RUN_PATTERN.finditer(row_cells):
+                start, end = match.span()
+                last_row = row + 1
+                while last_row < bottom and 0 not in cells[
+                    (last_row - top) * columns + start : (last_row - top) * columns + end
+                ]:
+                    last_row += 1
+                collider = Collider(start, row, end - start, last_row - row)
+                colliders.append(collider)
+                covering.append(collider)
+
+        self.strips[strip] = colliders
+        strip_row_colliders: list[list[Collider]] = [[] for _ in range(top, bottom)]
+        for collider in colliders:
+            for row in range(collider.row, collider.row + collider.rows):
+                strip_row_colliders[row - top].append(collider)
+        for row, row_colliders in enumerate(strip_row_colliders, top):
+            row_colliders.sort(key=lambda collider: collider.column)
+            self.row_colliders[row] = row_colliders
+            self.row_starts[row] = [collider.column for collider in row_colliders]
+
+    def update(self, tile_grid: TileGrid) -> ColliderMesh:
+        """
+        Creates the mesh of a changed tile grid, remeshing only the strips that changed.
+
+        Args:
+            tile_grid (TileGrid): The changed tile grid.
+
+        Returns:
+            ColliderMesh: The mesh of the changed tile grid.
+        """
+        return ColliderMesh(tile_grid, self.strip_rows, self)
+
+    def get_colliders(self) -> list[Collider]:
+        """
+        Gets all the colliders of the mesh.
+
+        Returns:
+            list[Collider]: The colliders, strip by strip in row-major order.
+        """
+        return [collider for strip in self.strips for collider in strip]
+
+    def get_cell(self, column: int, row: int) -> tuple[int, ...]:
+        return self.tiles.get_cell(column, row)
+
+    def get_tile_cells(self) -> dict[tuple[int, int], list[int]]:
+        return self.tiles.get_tile_cells()
+
+    def query(self, rect: pygame.Rect) -> list[Collider]:
+        """
+        Gets the colliders overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): The rect in pixels.
+
+        Returns:
+            list[Collider]: The overlapping colliders, ordered by their first covered row in the rect, then column.
+        """
+        columns, rows = self.get_cell_ranges(rect)
+        if not columns:
+            return []
+
+        colliders = {}
+        for row in rows:
+            row_starts = self.row_starts[row]
+            row_colliders = self.row_colliders[row]
+            position = max(bisect.bisect_right(row_starts, columns.start) - 1, 0)
+            while position < len(row_colliders) and row_starts[position] < columns.stop:
+                collider = row_colliders[position]
+                if collider.column + collider.columns > columns.start:
+                    colliders[collider] = None
+                position += 1
+
+        return [collider for collider in colliders if collider.rect.colliderect(rect)]
@@ -0,0 +1,91 @@
+import dataclasses
+import types
+import typing
+
+from dataclasses import dataclass
+from functools import cache
+
+from .matter import Matter
+from .matter_arrays import MatterArrays
+from .collidable import Collidable
+
+
+@dataclass(frozen=True)
+class EntityFields:
+    matter_fields: tuple[str, ...]
+    matter_list_fields: tuple[str, ...]
+    collidable_fields: tuple[str, ...]
+    collidable_list_fields: tuple[str, ...]
+    matter_arrays_fields: tuple[str, ...]
+
+
+@cache
+def get_entity_fields(cls: type) -> EntityFields:
+    """
+    Gets the fields of a dataclass holding matters and collidables.
+    The fields are found once per class from the dataclass fields and their
+    type annotations, either as a single entity or as a list of entities.
+    Bodies stored as matter arrays are found from fields annotated with
+    MatterArrays, optionally None.
+
+    Args:
+        cls (type): The dataclass, e.g. GameState.
+
+    Returns:
+        EntityFields: The names of the fields holding matters and collidables.
+    """
+    type_hints = typing.get_type_hints(cls)
+
+    def get_fields(entity_type: type, in_list: bool) -> tuple[str, ...]:
+        return tuple(
+            field.name
+            for field in dataclasses.fields(cls)
+            if is_entity_type(type_hints[field.name], entity_type, in_list)
+        )
+
+    return EntityFields(
+        matter_fields=get_fields(Matter, in_list=False),
+        matter_list_fields=get_fields(Matter, in_list=True),
+        collidable_fields=get_fields(Collidable, in_list=False),
+        collidable_list_fields=get_fields(Collidable, in_list=True),
+        matter_arrays_fields=tuple(
+            field.name
+            for field in dataclasses.fields(cls)
+            if MatterArrays in get_union_types(type_hints[field.name])
+        ),
+    )
+
+
+def is_entity_type(type_hint: typing.Any, entity_type: type, in_list: bool) -> bool:
+    """
+    Checks if a type annotation is an entity type or a list of it.
+
+    Args:
+        type_hint (typing.Any): The type annotation of a field.
+        entity_type (type): The entity type, e.g. Matter.
+        in_list (bool): Whether to check for a list of the entity type.
+
+    Returns:
+        bool: True if the annotation matches, False otherwise.
+    """
+    if in_list:
+        if typing.get_origin(type_hint) is not list:
+            return False
+        (type_hint,) = typing.get_args(type_hint)
+
+    return isinstance(type_hint, type) and issubclass(type_hint, entity_type)
+
+
+def get_union_types(type_hint: typing.Any) -> tuple[typing.Any, ...]:
+    """
+    Gets the types of a union type annotation, e.g. the two types of MatterArrays | None.
+
+    Args:
+        type_hint (typing.Any): The type annotation of a field.
+
+    Returns:
+        tuple[typing.Any, ...]: The types of the union, or the annotation itself if it is not a union.
+    """
+    if isinstance(type_hint, types.UnionType) or typing.get_origin(type_hint) is typing.Union:
+        return typing.get_args(type_hint)
+    return (type_hint,)
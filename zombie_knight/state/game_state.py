@@ -1,26 +1,120 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
 
 from .player import PlayerState
-from .tile import TileState
+from .tile_grid import TileGrid
+from .zombie import ZombieHorde
 from .matter import Matter
 from .collidable import Collidable
+from .fields import get_entity_fields
 
 
 @dataclass
 class GameState:
     player: PlayerState
-    tiles: list[TileState]
+    tiles: TileGrid
+    zombies: ZombieHorde | None = None
 
     def get_matters(self) -> list[tuple[str, Matter]]:
-        return [
-            (attr, getattr(self, attr))
-            for attr in dir(self)
-            if isinstance(getattr(self, attr), Matter)
-        ]
+        """
+        Gets the matters of the game state.
+        Matters held in list fields are returned one by one under the field name.
+
+        Returns:
+            list[tuple[str, Matter]]: The field name and the matter of every matter.
+        """
+        return self.get_entities(
+            get_entity_fields(type(self)).matter_fields,
+            get_entity_fields(type(self)).matter_list_fields,
+        )
 
     def get_collidables(self) -> list[tuple[str, Collidable]]:
-        return [
-            (attr, getattr(self, attr))
-            for attr in dir(self)
-            if isinstance(getattr(self, attr), Collidable)
-        ]
+        """
+        Gets the collidables of the game state.
+        Collidables held in list fields are returned one by one under the field name.
+
+        Returns:
+            list[tuple[str, Collidable]]: The field name and the collidable of every collidable.
+        """
+        return self.get_entities(
+            get_entity_fields(type(self)).collidable_fields,
+            get_entity_fields(type(self)).collidable_list_fields,
+        )
+
+    def replace_matters(self, matters: list[Matter]) -> GameState:
+        """
+        Replaces the matters of the game state.
+
+        Args:
+            matters (list[Matter]): The new matters in the order returned by get_matters.
+
+        Returns:
+            GameState: The game state with the new matters.
+        """
+        return self.replace_entities(
+            matters,
+            get_entity_fields(type(self)).matter_fields,
+            get_entity_fields(type(self)).matter_list_fields,
+        )
+
+    def replace_collidables(self, collidables: list[Collidable]) -> GameState:
+        """
+        Replaces the collidables of the game state.
+
+        Args:
+            collidables (list[Collidable]): The new collidables in the order returned by get_collidables.
+
+        Returns:
+            GameState: The game state with the new collidables.
+        """
+        return self.replace_entities(
+            collidables,
+            get_entity_fields(type(self)).collidable_fields,
+            get_entity_fields(type(self)).collidable_list_fields,
+        )
+
+    def get_entities(
+        self,
+        fields: tuple[str, ...],
+        list_fields: tuple[str, ...],
+    ) -> list[tuple[str, Matter]]:
+        """
+        Gets the entities held in single entity fields and in list fields.
+
+        Args:
+            fields (tuple[str, ...]): The fields holding a single entity.
+            list_fields (tuple[str, ...]): The fields holding a list of entities.
+
+        Returns:
+            list[tuple[str, Matter]]: The field name and the entity of every entity.
+        """
+        entities = [(field, getattr(self, field)) for field in fields]
+        for field in list_fields:
+            entities += [(field, entity) for entity in getattr(self, field)]
+        return entities
+
+    def replace_entities(
+        self,
+        entities: list[Matter],
+        fields: tuple[str, ...],
+        list_fields: tuple[str, ...],
+    ) -> GameState:
+        """
+        Replaces the entities held in single entity fields and in list fields.
+
+        Args:
+            entities (list[Matter]): The new entities in the order returned by get_entities.
+            fields (tuple[str, ...]): The fields holding a single entity.
+            list_fields (tuple[str, ...]): The fields holding a list of entities.
+
+        Returns:
+            GameState: The game state with the new entities.
+        """
+        changes = dict(zip(fields, entities))
+        position = len(fields)
+        for field in list_fields:
+            length = len(getattr(self, field))
+            changes[field] = entities[position : position + length]
+            position += length
+        return replace(self, **changes)
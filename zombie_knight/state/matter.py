@@ -3,9 +3,12 @@ from __future__ import annotations
 import pygame
 
 from abc import ABC, abstractmethod
+from dataclasses import replace
 
 
 class Matter(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_position(self) -> pygame.Vector2:
         """
@@ -74,3 +77,17 @@ class Matter(ABC):
             Matter: The matter with the new acceleration.
         """
         pass
+
+    def replace_fields(self, **fields) -> Matter:
+        """
+        Replaces fields of the matter.
+        Every replace method of a matter goes through this method, so a mutable
+        working copy of the matter can apply them in place.
+
+        Args:
+            **fields: The new values of the fields.
+
+        Returns:
+            Matter: The matter with the new field values.
+        """
+        return replace(self, **fields)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import pygame
+
+from .matter import Matter
+from ..numpy_support import np, require_numpy
+
+
+class MatterArrays:
+    def __init__(
+        self,
+        positions: "np.ndarray",
+        velocities: "np.ndarray",
+        accelerations: "np.ndarray",
+    ) -> None:
+        """
+        Initializes the matter arrays.
+        The motion of every body is stored as one row of three contiguous
+        (n, 2) float64 arrays, so the movement rules run as vectorized operations.
+        A game state holds the arrays in a field annotated with MatterArrays for
+        the whole run, and the bodies only become Matter objects at the edges,
+        e.g. when they are created or inspected one by one. The arrays of a game
+        state are never changed in place: a rule moves a copy of them.
+
+        Args:
+            positions (np.ndarray): The positions of the bodies.
+            velocities (np.ndarray): The velocities of the bodies.
+            accelerations (np.ndarray): The accelerations of the bodies.
+
+        Returns:
+            None
+        """
+        require_numpy("the matter arrays")
+        self.positions = positions
+        self.velocities = velocities
+        self.accelerations = accelerations
+
+    @classmethod
+    def from_matters(cls, matters: list[Matter]) -> MatterArrays:
+        """
+        Creates the matter arrays from a list of matters.
+
+        Args:
+            matters (list[Matter]): The matters.
+
+        Returns:
+            MatterArrays: The motion of the matters as arrays.
+        """
+        require_numpy("the matter arrays")
+        motions = np.array(
+            [
+                (
+                    *matter.get_position(),
+                    *matter.get_velocity(),
+                    *matter.get_acceleration(),
+                )
+                for matter in matters
+            ],
+            dtype=np.float64,
+        ).reshape(len(matters), 6)
+
+        return cls(
+            np.ascontiguousarray(motions[:, 0:2]),
+            np.ascontiguousarray(motions[:, 2:4]),
+            np.ascontiguousarray(motions[:, 4:6]),
+        )
+
+    def to_matters(self, matters: list[Matter]) -> list[Matter]:
+        """
+        Writes the arrays back into the matters they were created from.
+
+        Args:
+            matters (list[Matter]): The matters the arrays were created from.
+
+        Returns:
+            list[Matter]: The matters with the motion held by the arrays.
+        """
+        return [
+            matter.replace_position(pygame.Vector2(*position))
+            .replace_velocity(pygame.Vector2(*velocity))
+            .replace_acceleration(pygame.Vector2(*acceleration))
+            for matter, position, velocity, acceleration in zip(
+                matters,
+                self.positions.tolist(),
+                self.velocities.tolist(),
+                self.accelerations.tolist(),
+            )
+        ]
+
+    def copy(self) -> MatterArrays:
+        """
+        Copies the arrays, so the copy can be changed in place.
+
+        Returns:
+            MatterArrays: The copy of the arrays.
+        """
+        return MatterArrays(
+            self.positions.copy(),
+            self.velocities.copy(),
+            self.accelerations.copy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
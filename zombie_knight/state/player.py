@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pygame
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from enum import Enum
 
 from .collidable import Collidable
@@ -16,7 +16,7 @@ class PlayerMode(Enum):
     JUMPING = 2
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayerState(Collidable):
     rect: pygame.Rect
     mode: PlayerMode
@@ -26,8 +26,27 @@ class PlayerState(Collidable):
     score: int
     velocity: pygame.Vector2
     acceleration: pygame.Vector2
+    position: pygame.Vector2 | None = None
+
+    # The rect and the vectors are mutable pygame objects, so the accessors
+    # return copies of them and callers cannot change a frozen state.
+
+    def __post_init__(self) -> None:
+        # The rect is the position of the player, and position only keeps the
+        # exact position the rect was rounded from. It is copied, so the caller
+        # cannot change it afterwards, and dropped when the rect was moved without it.
+        position = self.position
+        if position is not None:
+            if (round(position.x), round(position.y)) == self.rect.topleft:
+                position = pygame.Vector2(position)
+            else:
+                position = None
+            object.__setattr__(self, "position", position)
 
     def get_position(self) -> pygame.Vector2:
+        if self.position is not None:
+            return pygame.Vector2(self.position)
+
         position = pygame.Vector2(
             self.rect.x,
             self.rect.y,
@@ -36,36 +55,30 @@ class PlayerState(Collidable):
         return position
 
     def get_velocity(self) -> pygame.Vector2:
-        return self.velocity
+        return pygame.Vector2(self.velocity)
 
     def get_acceleration(self) -> pygame.Vector2:
-        return self.acceleration
+        return pygame.Vector2(self.acceleration)
 
     def get_collision_rect(self) -> pygame.Rect:
-        return self.rect
+        return self.rect.copy()
 
     def replace_position(self, position: pygame.Vector2) -> PlayerState:
-        return replace(
-            self,
+        return self.replace_fields(
             rect=pygame.Rect(
                 round(position.x),
                 round(position.y),
                 self.rect.width,
                 self.rect.height,
             ),
+            position=pygame.Vector2(position),
         )
 
     def replace_velocity(self, velocity: pygame.Vector2) -> PlayerState:
-        return replace(
-            self,
-            velocity=velocity,
-        )
+        return self.replace_fields(velocity=velocity)
 
     def replace_acceleration(self, acceleration: pygame.Vector2) -> PlayerState:
-        return replace(
-            self,
-            acceleration=acceleration,
-        )
+        return self.replace_fields(acceleration=acceleration)
 
     def replace_collision_rect_position(self, position: pygame.Vector2) -> Collidable:
         return self.replace_position(position)
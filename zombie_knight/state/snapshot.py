@@ -0,0 +1,292 @@
+import mmap
+import re
+import struct
+
+import pygame
+
+from .game_state import GameState
+from .player import PlayerState, PlayerMode
+from .direction import HorizontalDirection
+from .tile import TileKind
+from .tile_grid import TileGrid
+from .zombie import ZombieHorde
+from ..numpy_support import np, require_numpy
+
+
+SNAPSHOT_MAGIC = b"ZKSS"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct("<4sH?xIIIIHH")
+PLAYER_RECORD = struct.Struct("<4i?6d2B3i")
+
+# The arrays of the zombie horde in the order they are stored, with their
+# little-endian dtype and the number of values per zombie.
+HORDE_ARRAYS = (
+    ("positions", "<f8", 2),
+    ("directions", "<f8", 1),
+    ("animation_times", "<f8", 1),
+    ("kinds", "u1", 1),
+    ("modes", "u1", 1),
+)
+
+INVALID_CELL_PATTERN = re.compile(
+    b"[^" + re.escape(bytes([0, *(kind.value for kind in TileKind)])) + b"]"
+)
+
+
+def dump(game_state: GameState) -> bytes:
+    """
+    Encodes a game state as a binary snapshot.
+    The snapshot is a header, the fixed-width player record, the arrays of the
+    zombie horde one after the other and the tile map as a row-major grid
+    holding one byte per cell, 0 for an empty cell and the TileKind of the
+    tile otherwise.
+
+    Args:
+        game_state (GameState): The game state.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    grid = game_state.tiles
+    if not isinstance(grid, TileGrid):
+        grid = TileGrid.from_tiles(grid)
+    zombies = game_state.zombies
+
+    return b"".join(
+        (
+            SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                zombies is not None,
+                grid.columns,
+                grid.rows,
+                1,
+                len(zombies) if zombies is not None else 0,
+                zombies.width if zombies is not None else 0,
+                zombies.height if zombies is not None else 0,
+            ),
+            pack_player_state(game_state.player),
+            pack_zombie_horde(zombies) if zombies is not None else b"",
+            grid.cells,
+        )
+    )
+
+
+def load(data: bytes | memoryview | mmap.mmap) -> GameState:
+    """
+    Decodes a binary snapshot created by dump.
+    The tile grid of the game state is a view of the buffer, so no tile is
+    copied or created while loading. The cells are only checked for values
+    that are not a TileKind. The arrays of the zombie horde are copied, which
+    requires NumPy when the snapshot holds a horde.
+
+    Args:
+        data (bytes | memoryview | mmap.mmap): The snapshot.
+
+    Returns:
+        GameState: The game state.
+    """
+    data = memoryview(data)
+    (
+        magic,
+        version,
+        has_zombies,
+        columns,
+        rows,
+        entity_count,
+        zombie_count,
+        zombie_width,
+        zombie_height,
+    ) = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise ValueError("Unsupported game state snapshot")
+    if entity_count != 1:
+        raise ValueError("A game state snapshot holds exactly one player")
+
+    position = SNAPSHOT_HEADER.size
+    player = unpack_player_state(data, position)
+    position += PLAYER_RECORD.size
+
+    zombies = None
+    if has_zombies:
+        zombies, position = unpack_zombie_horde(
+            data, position, zombie_count, (zombie_width, zombie_height)
+        )
+
+    cells = data[position : position + columns * rows]
+    if len(cells) != columns * rows:
+        raise ValueError("Truncated game state snapshot")
+    validate_cells(cells, columns)
+
+    return GameState(player=player, tiles=TileGrid(columns, rows, cells), zombies=zombies)
+
+
+def validate_cells(cells: memoryview, columns: int) -> None:
+    """
+    Raises a ValueError if a cell of a snapshot holds neither 0 nor a TileKind value.
+    The cells are scanned in place, so the buffer is not copied.
+
+    Args:
+        cells (memoryview): The cells of the snapshot in row-major order.
+        columns (int): The number of columns of the tile grid.
+
+    Returns:
+        None
+    """
+    invalid_cell = INVALID_CELL_PATTERN.search(cells)
+    if invalid_cell is not None:
+        row, column = divmod(invalid_cell.start(), columns)
+        raise ValueError(
+            f"Unknown tile value {cells[invalid_cell.start()]} "
+            f"in the cell ({column}, {row}) of the game state snapshot"
+        )
+
+
+def load_file(path: str) -> GameState:
+    """
+    Loads a snapshot from a memory mapped file.
+    The tile grid of the game state is a view of the mapped file, which stays
+    mapped as long as the grid is used.
+
+    Args:
+        path (str): The path of the snapshot file.
+
+    Returns:
+        GameState: The game state.
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return load(mapped)
+
+
+def dump_file(game_state: GameState, path: str) -> None:
+    """
+    Saves a snapshot of a game state to a file.
+
+    Args:
+        game_state (GameState): The game state.
+        path (str): The path of the snapshot file.
+
+    Returns:
+        None
+    """
+    with open(path, "wb") as file:
+        file.write(dump(game_state))
+
+
+def pack_player_state(player_state: PlayerState) -> bytes:
+    """
+    Packs a player state into a fixed-width record.
+
+    Args:
+        player_state (PlayerState): The player state.
+
+    Returns:
+        bytes: The record.
+    """
+    position = player_state.position
+    return PLAYER_RECORD.pack(
+        *player_state.rect,
+        position is not None,
+        *(position if position is not None else (0.0, 0.0)),
+        *player_state.velocity,
+        *player_state.acceleration,
+        player_state.mode.value,
+        player_state.horizontal_direction.value,
+        player_state.animation_index,
+        player_state.lives,
+        player_state.score,
+    )
+
+
+def unpack_player_state(data: memoryview, offset: int) -> PlayerState:
+    """
+    Unpacks a player state from a fixed-width record.
+
+    Args:
+        data (memoryview): The buffer holding the record.
+        offset (int): The position of the record in the buffer.
+
+    Returns:
+        PlayerState: The player state.
+    """
+    (
+        x,
+        y,
+        width,
+        height,
+        has_position,
+        position_x,
+        position_y,
+        velocity_x,
+        velocity_y,
+        acceleration_x,
+        acceleration_y,
+        mode,
+        horizontal_direction,
+        animation_index,
+        lives,
+        score,
+    ) = PLAYER_RECORD.unpack_from(data, offset)
+
+    return PlayerState(
+        rect=pygame.Rect(x, y, width, height),
+        mode=PlayerMode(mode),
+        horizontal_direction=HorizontalDirection(horizontal_direction),
+        animation_index=animation_index,
+        lives=lives,
+        score=score,
+        velocity=pygame.Vector2(velocity_x, velocity_y),
+        acceleration=pygame.Vector2(acceleration_x, acceleration_y),
+        position=pygame.Vector2(position_x, position_y) if has_position else None,
+    )
+
+
+def pack_zombie_horde(zombies: ZombieHorde) -> bytes:
+    """
+    Packs the arrays of a zombie horde one after the other.
+
+    Args:
+        zombies (ZombieHorde): The zombie horde.
+
+    Returns:
+        bytes: The arrays in the order of HORDE_ARRAYS.
+    """
+    return b"".join(
+        np.ascontiguousarray(getattr(zombies, name), dtype=dtype).tobytes()
+        for name, dtype, _ in HORDE_ARRAYS
+    )
+
+
+def unpack_zombie_horde(
+    data: memoryview,
+    offset: int,
+    count: int,
+    size: tuple[int, int],
+) -> tuple[ZombieHorde, int]:
+    """
+    Unpacks the arrays of a zombie horde into a new zombie horde.
+
+    Args:
+        data (memoryview): The buffer holding the arrays.
+        offset (int): The position of the first array in the buffer.
+        count (int): The number of zombies.
+        size (tuple[int, int]): The size of the rect of every zombie.
+
+    Returns:
+        tuple[ZombieHorde, int]: The zombie horde and the position after its arrays.
+    """
+    require_numpy("snapshots holding zombies")
+
+    arrays = {}
+    for name, dtype, width in HORDE_ARRAYS:
+        item_count = count * width
+        item_size = np.dtype(dtype).itemsize
+        if offset + item_count * item_size > len(data):
+            raise ValueError("Truncated game state snapshot")
+        array = np.frombuffer(data, dtype=dtype, count=item_count, offset=offset)
+        arrays[name] = array.astype(array.dtype.newbyteorder("="))
+        if width > 1:
+            arrays[name] = arrays[name].reshape(count, width)
+        offset += item_count * item_size
+    return ZombieHorde(**arrays, size=size), offset
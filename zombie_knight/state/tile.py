@@ -1,24 +1,31 @@
 import pygame
 
 from dataclasses import dataclass
+from enum import IntEnum
 
-
-@dataclass
-class TileState:
-    rect: pygame.Rect
-
-
-class GrassTileState(TileState):
-    pass
+from ..constants.tile import TILE_SIZE
 
 
-class DirtTileState(TileState):
-    pass
+class TileKind(IntEnum):
+    GRASS = 1
+    DIRT = 2
+    LEFT = 3
+    RIGHT = 4
 
 
-class RightTileState(TileState):
-    pass
-
-
-class LeftTileState(TileState):
-    pass
+@dataclass(slots=True, frozen=True)
+class TileState:
+    kind: TileKind
+    column: int
+    row: int
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """
+        Gets the rect of the tile, derived from its grid coordinates.
+
+        Returns:
+            pygame.Rect: The rect of the tile.
+        """
+        width, height = TILE_SIZE
+        return pygame.Rect(self.column * width, self.row * height, width, height)
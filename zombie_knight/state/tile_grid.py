@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import re
+
+import pygame
+
+from abc import abstractmethod
+from typing import Iterator
+
+from .tile import TileKind, TileState
+from .tile_index import TileIndex
+from ..constants.tile import TILE_SIZE
+
+
+SOLID_CELL_PATTERN = re.compile(b"[^\x00]")
+
+tile_kind_values = frozenset(kind.value for kind in TileKind)
+
+cell_to_kind: list[TileKind | None] = [None] * 256
+for kind in TileKind:
+    cell_to_kind[kind.value] = kind
+
+
+class CellGrid(TileIndex):
+    """
+    Base of the tile indexes storing the tile map as one byte per cell.
+    """
+
+    @abstractmethod
+    def get_cell_value(self, column: int, row: int) -> int:
+        """
+        Gets the byte stored for a cell inside the grid.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            int: 0 for an empty cell, the TileKind value of the tile otherwise.
+        """
+        pass
+
+    def get(self, column: int, row: int) -> TileKind | None:
+        """
+        Gets the kind of the tile in a cell.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            TileKind | None: The kind of the tile, or None if the cell is empty or outside the grid.
+        """
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            return None
+        return cell_to_kind[self.get_cell_value(column, row)]
+
+    def get_tile(self, column: int, row: int) -> TileState | None:
+        """
+        Gets the tile state of a cell.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            TileState | None: The tile state, or None if the cell is empty or outside the grid.
+        """
+        kind = self.get(column, row)
+        return TileState(kind, column, row) if kind is not None else None
+
+    def get_cell(self, column: int, row: int) -> tuple[int, ...]:
+        order = row * self.columns + column
+        return (order,) if self.get_cell_value(column, row) else ()
+
+    def get_tile_cells(self) -> dict[tuple[int, int], list[int]]:
+        return {
+            (tile.column, tile.row): [tile.row * self.columns + tile.column]
+            for tile in self
+        }
+
+
+class TileGrid(CellGrid):
+    def __init__(
+        self,
+        columns: int,
+        rows: int,
+        cells: bytearray | bytes | memoryview | None = None,
+    ) -> None:
+        """
+        Initializes the tile grid, a tile map stored as one byte per cell.
+        A cell holds 0 when it is empty and the TileKind of its tile otherwise,
+        in row-major order. The buffer is used as is, e.g. a memoryview of a
+        memory mapped snapshot, and must not be changed afterwards; changed
+        grids are created with replace_cells.
+        The grid is its own tile index, and iterating over it yields the tile
+        states of the solid cells in row-major order, like the tile list
+        created by create_tiles_from_tile_map.
+
+        Args:
+            columns (int): The number of columns.
+            rows (int): The number of rows.
+            cells (bytearray | bytes | memoryview | None): The cells, or None for an empty grid.
+
+        Returns:
+            None
+        """
+        if cells is None:
+            cells = bytearray(columns * rows)
+        cells = memoryview(cells).cast("B")
+        if len(cells) != columns * rows:
+            raise ValueError(
+                f"A {columns}x{rows} tile grid needs {columns * rows} cells, got {len(cells)}"
+            )
+
+        self.tiles = self
+        self.columns = columns
+        self.rows = rows
+        self.cells = cells
+        self.cell_width, self.cell_height = TILE_SIZE
+        self.solid_cell_count: int | None = None
+
+    @classmethod
+    def from_tile_map(cls, tile_map: list[list[int]]) -> TileGrid:
+        """
+        Creates a tile grid from a tile map.
+
+        Args:
+            tile_map (list[list[int]]): The tile map, holding a TileKind value or 0 per cell.
+
+        Returns:
+            TileGrid: The tile grid.
+        """
+        rows = len(tile_map)
+        columns = max((len(row) for row in tile_map), default=0)
+        cells = bytearray(columns * rows)
+        for y, row in enumerate(tile_map):
+            cells[y * columns : y * columns + len(row)] = bytes(
+                tile if tile in tile_kind_values else 0 for tile in row
+            )
+        return cls(columns, rows, cells)
+
+    @classmethod
+    def from_tiles(cls, tiles: list[TileState]) -> TileGrid:
+        """
+        Creates a tile grid from a list of tile states.
+
+        Args:
+            tiles (list[TileState]): The list of tile states.
+
+        Returns:
+            TileGrid: The tile grid.
+        """
+        columns = max((tile.column + 1 for tile in tiles), default=0)
+        rows = max((tile.row + 1 for tile in tiles), default=0)
+        cells = bytearray(columns * rows)
+        for tile in tiles:
+            cells[tile.row * columns + tile.column] = tile.kind
+        return cls(columns, rows, cells)
+
+    def get_cell_value(self, column: int, row: int) -> int:
+        return self.cells[row * self.columns + column]
+
+    def query(self, rect: pygame.Rect) -> list[TileState]:
+        """
+        Gets the tiles overlapping a rect, reading only the cells the rect covers.
+
+        Args:
+            rect (pygame.Rect): The rect in pixels.
+
+        Returns:
+            list[TileState]: The overlapping tiles in row-major order.
+        """
+        columns, rows = self.get_cell_ranges(rect)
+        cells = self.cells
+        tiles = []
+        for row in rows:
+            offset = row * self.columns
+            for column in columns:
+                cell = cells[offset + column]
+                if cell:
+                    tile = TileState(cell_to_kind[cell], column, row)
+                    if tile.rect.colliderect(rect):
+                        tiles.append(tile)
+        return tiles
+
+    def replace_cells(self, changes: dict[tuple[int, int], TileKind | None]) -> TileGrid:
+        """
+        Creates a copy of the grid with some cells changed.
+
+        Args:
+            changes (dict[tuple[int, int], TileKind | None]): The new tile kind,
+                or None for an empty cell, by (column, row).
+
+        Returns:
+            TileGrid: The changed grid.
+        """
+        cells = bytearray(self.cells)
+        for (column, row), kind in changes.items():
+            if not (0 <= column < self.columns and 0 <= row < self.rows):
+                raise IndexError(f"The cell ({column}, {row}) is outside the tile grid")
+            cells[row * self.columns + column] = kind if kind is not None else 0
+        return TileGrid(self.columns, self.rows, cells)
+
+    def get_tiles(self) -> list[TileState]:
+        """
+        Gets the tile states of the solid cells as a list.
+
+        Returns:
+            list[TileState]: The tile states in row-major order.
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[TileState]:
+        columns = self.columns
+        cells = self.cells
+        for match in SOLID_CELL_PATTERN.finditer(cells):
+            row, column = divmod(match.start(), columns)
+            yield TileState(cell_to_kind[cells[match.start()]], column, row)
+
+    def __len__(self) -> int:
+        if self.solid_cell_count is None:
+            self.solid_cell_count = sum(
+                1 for _ in SOLID_CELL_PATTERN.finditer(self.cells)
+            )
+        return self.solid_cell_count
+
+    def __reduce__(self) -> tuple:
+        return TileGrid, (self.columns, self.rows, bytes(self.cells))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TileGrid):
+            return NotImplemented
+        return (
+            self.columns == other.columns
+            and self.rows == other.rows
+            and self.cells == other.cells
+        )
+
+    __hash__ = None
@@ -0,0 +1,212 @@
+import pygame
+
+from abc import ABC, abstractmethod
+
+from .tile import TileState
+from ..constants.tile import TILE_SIZE, DENSE_TILE_INDEX_MAX_CELLS
+
+
+class TileIndex(ABC):
+    def __init__(
+        self,
+        tiles: list[TileState],
+        cell_size: tuple[int, int] = TILE_SIZE,
+    ) -> None:
+        """
+        Initializes the tile index.
+        Every tile is stored in the grid cells its rect covers, so a query only
+        looks at the cells covered by the queried rect.
+
+        Args:
+            tiles (list[TileState]): The list of tile states to index.
+            cell_size (tuple[int, int]): The size of a grid cell in pixels.
+
+        Returns:
+            None
+        """
+        self.tiles = tiles
+        self.cell_width, self.cell_height = cell_size
+        self.columns, self.rows = get_grid_size(tiles, cell_size)
+
+    @abstractmethod
+    def get_cell(self, column: int, row: int) -> tuple[int, ...]:
+        """
+        Gets the tiles stored in a grid cell.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            tuple[int, ...]: The positions of the tiles in the indexed list.
+        """
+        pass
+
+    def get_tile_cells(self) -> dict[tuple[int, int], list[int]]:
+        """
+        Groups the tiles by the grid cells their rects cover.
+
+        Returns:
+            dict[tuple[int, int], list[int]]: The positions of the tiles in the indexed list by (column, row).
+        """
+        cells: dict[tuple[int, int], list[int]] = {}
+        for order, tile in enumerate(self.tiles):
+            columns, rows = self.get_cell_ranges(tile.rect)
+            for row in rows:
+                for column in columns:
+                    cells.setdefault((column, row), []).append(order)
+        return cells
+
+    def get_world_rect(self) -> pygame.Rect:
+        """
+        Gets the rect covered by the grid.
+
+        Returns:
+            pygame.Rect: The rect covered by the grid in pixels.
+        """
+        return pygame.Rect(
+            0,
+            0,
+            self.columns * self.cell_width,
+            self.rows * self.cell_height,
+        )
+
+    def get_cell_ranges(self, rect: pygame.Rect) -> tuple[range, range]:
+        """
+        Gets the grid columns and rows covered by a rect, clipped to the grid.
+
+        Args:
+            rect (pygame.Rect): The rect in pixels.
+
+        Returns:
+            tuple[range, range]: The covered columns and rows.
+        """
+        columns = range(
+            max(rect.left // self.cell_width, 0),
+            min(-(-rect.right // self.cell_width), self.columns),
+        )
+        rows = range(
+            max(rect.top // self.cell_height, 0),
+            min(-(-rect.bottom // self.cell_height), self.rows),
+        )
+        return columns, rows
+
+    def query(self, rect: pygame.Rect) -> list[TileState]:
+        """
+        Gets the tiles overlapping a rect.
+
+        Args:
+            rect (pygame.Rect): The rect in pixels.
+
+        Returns:
+            list[TileState]: The overlapping tiles in the order of the indexed list.
+        """
+        columns, rows = self.get_cell_ranges(rect)
+        orders = set()
+        for row in rows:
+            for column in columns:
+                orders.update(self.get_cell(column, row))
+
+        return [
+            tile
+            for tile in (self.tiles[order] for order in sorted(orders))
+            if tile.rect.colliderect(rect)
+        ]
+
+
+class TileGridIndex(TileIndex):
+    def __init__(
+        self,
+        tiles: list[TileState],
+        cell_size: tuple[int, int] = TILE_SIZE,
+    ) -> None:
+        """
+        Initializes the dense tile index, holding one entry for every grid cell.
+
+        Args:
+            tiles (list[TileState]): The list of tile states to index.
+            cell_size (tuple[int, int]): The size of a grid cell in pixels.
+
+        Returns:
+            None
+        """
+        super().__init__(tiles, cell_size)
+
+        self.cells: list[list[tuple[int, ...]]] = [
+            [()] * self.columns for _ in range(self.rows)
+        ]
+        for (column, row), orders in self.get_tile_cells().items():
+            self.cells[row][column] = tuple(orders)
+
+    def get_cell(self, column: int, row: int) -> tuple[int, ...]:
+        return self.cells[row][column]
+
+
+class SparseTileIndex(TileIndex):
+    def __init__(
+        self,
+        tiles: list[TileState],
+        cell_size: tuple[int, int] = TILE_SIZE,
+    ) -> None:
+        """
+        Initializes the sparse tile index, holding entries only for occupied grid cells.
+
+        Args:
+            tiles (list[TileState]): The list of tile states to index.
+            cell_size (tuple[int, int]): The size of a grid cell in pixels.
+
+        Returns:
+            None
+        """
+        super().__init__(tiles, cell_size)
+
+        self.cells: dict[tuple[int, int], tuple[int, ...]] = {
+            cell: tuple(orders) for cell, orders in self.get_tile_cells().items()
+        }
+
+    def get_cell(self, column: int, row: int) -> tuple[int, ...]:
+        return self.cells.get((column, row), ())
+
+
+def create_tile_index(
+    tiles: list[TileState],
+    cell_size: tuple[int, int] = TILE_SIZE,
+) -> TileIndex:
+    """
+    Creates a dense tile index, or a sparse one when the grid would be too large.
+    Tiles that already are an index, such as a TileGrid, are returned as is.
+
+    Args:
+        tiles (list[TileState]): The list of tile states to index.
+        cell_size (tuple[int, int]): The size of a grid cell in pixels.
+
+    Returns:
+        TileIndex: The tile index.
+    """
+    if isinstance(tiles, TileIndex):
+        return tiles
+
+    columns, rows = get_grid_size(tiles, cell_size)
+    if columns * rows > DENSE_TILE_INDEX_MAX_CELLS:
+        return SparseTileIndex(tiles, cell_size)
+    return TileGridIndex(tiles, cell_size)
+
+
+def get_grid_size(
+    tiles: list[TileState],
+    cell_size: tuple[int, int],
+) -> tuple[int, int]:
+    """
+    Gets the number of grid columns and rows needed to cover a list of tiles.
+
+    Args:
+        tiles (list[TileState]): The list of tile states.
+        cell_size (tuple[int, int]): The size of a grid cell in pixels.
+
+    Returns:
+        tuple[int, int]: The number of columns and rows.
+    """
+    cell_width, cell_height = cell_size
+    columns = max((-(-tile.rect.right // cell_width) for tile in tiles), default=0)
+    rows = max((-(-tile.rect.bottom // cell_height) for tile in tiles), default=0)
+    return columns, rows
@@ -1,13 +1,4 @@
-import pygame
-
-from .tile import (
-    DirtTileState,
-    GrassTileState,
-    LeftTileState,
-    RightTileState,
-    TileState,
-)
-from ..constants.tile import TILE_SIZE
+from .tile import TileKind, TileState
 
 
 def create_tiles_from_tile_map(tile_map: list[list[int]]) -> list[TileState]:
@@ -20,18 +11,12 @@ def create_tiles_from_tile_map(tile_map: list[list[int]]) -> list[TileState]:
     Returns:
         list[TileState]: The list of tile states.
     """
-    width, height = TILE_SIZE
+    kinds = {kind.value: kind for kind in TileKind}
     tiles = []
     for y, row in enumerate(tile_map):
         for x, tile in enumerate(row):
-            rect = pygame.Rect(x * width, y * height, width, height)
-            if tile == 1:
-                tiles.append(GrassTileState(rect=rect))
-            elif tile == 2:
-                tiles.append(DirtTileState(rect=rect))
-            elif tile == 3:
-                tiles.append(LeftTileState(rect=rect))
-            elif tile == 4:
-                tiles.append(RightTileState(rect=rect))
+            kind = kinds.get(tile)
+            if kind is not None:
+                tiles.append(TileState(kind, x, y))
 
     return tiles
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import pygame
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterator
+
+from .direction import HorizontalDirection
+from .tile_grid import TileGrid
+from ..numpy_support import np, require_numpy
+from ..constants.tile import TILE_SIZE
+from ..constants.zombie import ZOMBIE_SIZE
+
+
+class ZombieKind(Enum):
+    BOY = 0
+    GIRL = 1
+
+
+class ZombieMode(Enum):
+    PATROLLING = 0
+    CHASING = 1
+    DYING = 2
+
+
+@dataclass(slots=True, frozen=True)
+class ZombieState:
+    rect: pygame.Rect
+    kind: ZombieKind
+    mode: ZombieMode
+    horizontal_direction: HorizontalDirection
+    animation_time: float = 0.0
+
+
+class ZombieHorde:
+    def __init__(
+        self,
+        positions: "np.ndarray",
+        directions: "np.ndarray",
+        kinds: "np.ndarray",
+        modes: "np.ndarray",
+        animation_times: "np.ndarray",
+        size: tuple[int, int] = ZOMBIE_SIZE,
+    ) -> None:
+        """
+        Initializes the zombie horde, all the zombies of a game state stored as arrays.
+        Zombie i is row i of every array, so the zombie rules update the whole
+        horde with a few vectorized operations per step instead of replacing
+        every zombie. The arrays are never changed in place: a rule creates the
+        arrays it changes and shares the others with the previous horde, like
+        game states share their unchanged entities.
+
+        Args:
+            positions (np.ndarray): The (n, 2) float64 top left positions of the zombies.
+            directions (np.ndarray): The float64 directions the zombies face, -1 for left and 1 for right.
+            kinds (np.ndarray): The uint8 ZombieKind values of the zombies.
+            modes (np.ndarray): The uint8 ZombieMode values of the zombies.
+            animation_times (np.ndarray): The float64 times the zombies spent in their animation.
+            size (tuple[int, int]): The size of the rect of every zombie.
+
+        Returns:
+            None
+        """
+        require_numpy("the zombie horde")
+        self.positions = positions
+        self.directions = directions
+        self.kinds = kinds
+        self.modes = modes
+        self.animation_times = animation_times
+        self.width, self.height = size
+
+    @classmethod
+    def from_zombie_states(
+        cls,
+        zombie_states: list[ZombieState],
+        size: tuple[int, int] = ZOMBIE_SIZE,
+    ) -> ZombieHorde:
+        """
+        Creates a zombie horde from a list of zombie states.
+
+        Args:
+            zombie_states (list[ZombieState]): The zombie states, whose rects are moved to the horde size.
+            size (tuple[int, int]): The size of the rect of every zombie.
+
+        Returns:
+            ZombieHorde: The zombie horde.
+        """
+        require_numpy("the zombie horde")
+        return cls(
+            positions=np.array(
+                [zombie.rect.topleft for zombie in zombie_states],
+                dtype=np.float64,
+            ).reshape(len(zombie_states), 2),
+            directions=np.array(
+                [
+                    1.0
+                    if zombie.horizontal_direction is HorizontalDirection.RIGHT
+                    else -1.0
+                    for zombie in zombie_states
+                ],
+                dtype=np.float64,
+            ),
+            kinds=np.array([zombie.kind.value for zombie in zombie_states], dtype=np.uint8),
+            modes=np.array([zombie.mode.value for zombie in zombie_states], dtype=np.uint8),
+            animation_times=np.array(
+                [zombie.animation_time for zombie in zombie_states],
+                dtype=np.float64,
+            ),
+            size=size,
+        )
+
+    def replace_arrays(self, **arrays: "np.ndarray") -> ZombieHorde:
+        """
+        Creates a horde with some arrays replaced, sharing the other arrays.
+
+        Args:
+            **arrays (np.ndarray): The new arrays by name, e.g. positions.
+
+        Returns:
+            ZombieHorde: The horde with the new arrays.
+        """
+        return ZombieHorde(
+            positions=arrays.get("positions", self.positions),
+            directions=arrays.get("directions", self.directions),
+            kinds=arrays.get("kinds", self.kinds),
+            modes=arrays.get("modes", self.modes),
+            animation_times=arrays.get("animation_times", self.animation_times),
+            size=(self.width, self.height),
+        )
+
+    def select(self, mask: "np.ndarray") -> ZombieHorde:
+        """
+        Creates a horde holding only some of the zombies, e.g. the ones still alive.
+
+        Args:
+            mask (np.ndarray): The boolean array telling which zombies are kept.
+
+        Returns:
+            ZombieHorde: The horde of the kept zombies, in the same order.
+        """
+        return ZombieHorde(
+            positions=self.positions[mask],
+            directions=self.directions[mask],
+            kinds=self.kinds[mask],
+            modes=self.modes[mask],
+            animation_times=self.animation_times[mask],
+            size=(self.width, self.height),
+        )
+
+    def get_zombie_state(self, index: int) -> ZombieState:
+        """
+        Gets one zombie of the horde as a zombie state.
+
+        Args:
+            index (int): The index of the zombie.
+
+        Returns:
+            ZombieState: The state of the zombie.
+        """
+        x, y = self.positions[index].tolist()
+        return ZombieState(
+            rect=pygame.Rect(round(x), round(y), self.width, self.height),
+            kind=ZombieKind(int(self.kinds[index])),
+            mode=ZombieMode(int(self.modes[index])),
+            horizontal_direction=(
+                HorizontalDirection.RIGHT
+                if self.directions[index] > 0
+                else HorizontalDirection.LEFT
+            ),
+            animation_time=float(self.animation_times[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __iter__(self) -> Iterator[ZombieState]:
+        for index in range(len(self)):
+            yield self.get_zombie_state(index)
+
+
+def spawn_zombies(
+    tile_grid: TileGrid,
+    count: int,
+    seed: int = 0,
+    size: tuple[int, int] = ZOMBIE_SIZE,
+) -> ZombieHorde:
+    """
+    Creates a horde of patrolling zombies standing on random floor cells of a tile grid.
+    A floor cell is a solid cell below enough empty cells to fit a zombie.
+
+    Args:
+        tile_grid (TileGrid): The tile grid to spawn the zombies on.
+        count (int): The number of zombies.
+        seed (int): The seed of the random generator.
+        size (tuple[int, int]): The size of the rect of every zombie.
+
+    Returns:
+        ZombieHorde: The zombie horde, empty if the grid has no floor cell.
+    """
+    require_numpy("the zombie horde")
+    cell_width, cell_height = TILE_SIZE
+    width, height = size
+    clearance = -(-height // cell_height)
+    solid = get_solid_cells(tile_grid)
+    floors = solid.copy()
+    floors[:clearance] = False
+    for row_offset in range(1, clearance + 1):
+        floors[clearance:] &= ~solid[clearance - row_offset : solid.shape[0] - row_offset]
+    rows, columns = np.nonzero(floors)
+
+    rng = np.random.default_rng(seed)
+    count = count if len(rows) else 0
+    chosen = rng.integers(max(len(rows), 1), size=count)
+    positions = np.column_stack(
+        (
+            columns[chosen] * cell_width + rng.uniform(0, cell_width - width, count),
+            rows[chosen] * cell_height - height,
+        )
+    ).astype(np.float64)
+    return ZombieHorde(
+        positions=positions,
+        directions=rng.choice(np.array([-1.0, 1.0]), size=count),
+        kinds=rng.integers(len(ZombieKind), size=count).astype(np.uint8),
+        modes=np.full(count, ZombieMode.PATROLLING.value, dtype=np.uint8),
+        animation_times=rng.uniform(0, 1, count),
+        size=size,
+    )
+
+
+def get_solid_cells(tile_grid: TileGrid) -> "np.ndarray":
+    """
+    Gets the solid cells of a tile grid as a boolean array.
+
+    Args:
+        tile_grid (TileGrid): The tile grid.
+
+    Returns:
+        np.ndarray: The (rows, columns) array, True for the solid cells.
+    """
+    require_numpy("the zombie horde")
+    cells = np.frombuffer(tile_grid.cells, dtype=np.uint8)
+    return cells.reshape(tile_grid.rows, tile_grid.columns) != 0
@@ -0,0 +1,17 @@
+import math
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """
+    Gets a percentile of a list of samples with the nearest-rank method.
+
+    Args:
+        samples (list[float]): The samples.
+        q (float): The percentile in [0, 100].
+
+    Returns:
+        float: The percentile of the samples.
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
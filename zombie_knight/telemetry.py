@@ -0,0 +1,288 @@
+import dataclasses
+import gc
+import json
+import queue
+import socket
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from .state.game_state import GameState
+from .constants.telemetry import TELEMETRY_QUEUE_SIZE
+
+
+@dataclass(frozen=True)
+class FrameRecord:
+    frame: int
+    time: float
+    steps: int
+    simulation_ms: float
+    render_ms: float
+    fps: float
+    gc_pause_ms: float
+    gc_collections: int
+    entity_counts: dict[str, int] = field(default_factory=dict)
+    dropped: int = 0
+
+
+class TelemetrySink(ABC):
+    @abstractmethod
+    def write(self, line: bytes) -> None:
+        """
+        Writes an encoded record.
+
+        Args:
+            line (bytes): The record as a line of JSON ending with a newline.
+
+        Returns:
+            None
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Closes the sink.
+
+        Returns:
+            None
+        """
+        pass
+
+
+class FileSink(TelemetrySink):
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the file sink, appending every record to a file as a line.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        self.file = open(path, "ab")
+
+    def write(self, line: bytes) -> None:
+        self.file.write(line)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class DatagramSink(TelemetrySink):
+    def __init__(self, family: int, address) -> None:
+        """
+        Initializes the datagram sink, sending every record as one datagram.
+        Records nobody listens to are lost, which never blocks the writer.
+
+        Args:
+            family (int): The socket family, AF_INET for UDP or AF_UNIX for a Unix socket.
+            address: The address of the socket to send to.
+
+        Returns:
+            None
+        """
+        self.socket = socket.socket(family, socket.SOCK_DGRAM)
+        self.address = address
+
+    def write(self, line: bytes) -> None:
+        try:
+            self.socket.sendto(line, self.address)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+def create_sink(target: str) -> TelemetrySink:
+    """
+    Creates the sink of a telemetry target.
+
+    Args:
+        target (str): udp://host:port for a UDP socket, unix:///path for a Unix
+            datagram socket, or the path of a file to append to.
+
+    Returns:
+        TelemetrySink: The sink.
+    """
+    url = urlparse(target)
+    if url.scheme == "udp":
+        return DatagramSink(socket.AF_INET, (url.hostname, url.port))
+    if url.scheme == "unix":
+        return DatagramSink(socket.AF_UNIX, url.path)
+    if url.scheme == "file":
+        return FileSink(url.path)
+    return FileSink(target)
+
+
+class GCPauseTracker:
+    def __init__(self) -> None:
+        """
+        Initializes the GC pause tracker, summing the time spent in garbage collections.
+        It is registered in gc.callbacks until closed.
+
+        Returns:
+            None
+        """
+        self.started_at: int | None = None
+        self.pause_ns = 0
+        self.collections = 0
+        gc.callbacks.append(self.on_gc)
+
+    def on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self.started_at = time.perf_counter_ns()
+        elif self.started_at is not None:
+            self.pause_ns += time.perf_counter_ns() - self.started_at
+            self.collections += 1
+            self.started_at = None
+
+    def take(self) -> tuple[int, int]:
+        """
+        Takes the pauses summed since the last call.
+
+        Returns:
+            tuple[int, int]: The total pause in nanoseconds and the number of collections.
+        """
+        pause_ns, collections = self.pause_ns, self.collections
+        self.pause_ns = 0
+        self.collections = 0
+        return pause_ns, collections
+
+    def close(self) -> None:
+        """
+        Unregisters the tracker from gc.callbacks.
+
+        Returns:
+            None
+        """
+        gc.callbacks.remove(self.on_gc)
+
+
+class TelemetryWriter:
+    def __init__(
+        self,
+        sink: TelemetrySink,
+        queue_size: int = TELEMETRY_QUEUE_SIZE,
+    ) -> None:
+        """
+        Initializes the telemetry writer.
+        Records are queued by the game loop and encoded and written by a
+        background thread. When the queue is full, because the sink is slower
+        than the game, new records are dropped and counted instead of stalling
+        the frame. Every record holds the number of records dropped before it.
+
+        Args:
+            sink (TelemetrySink): The sink to write the records to.
+            queue_size (int): The maximum number of records waiting to be written.
+
+        Returns:
+            None
+        """
+        self.sink = sink
+        self.queue: queue.Queue[FrameRecord | None] = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.gc_pauses = GCPauseTracker()
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(
+            target=self.run,
+            name="telemetry-writer",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def submit_frame(
+        self,
+        frame: int,
+        steps: int,
+        simulation_ns: int,
+        render_ns: int,
+        fps: float,
+        game_state: GameState,
+    ) -> None:
+        """
+        Queues the record of a frame with the GC pauses since the previous one.
+
+        Args:
+            frame (int): The number of the frame.
+            steps (int): The number of simulation steps run in the frame.
+            simulation_ns (int): The time spent simulating in nanoseconds.
+            render_ns (int): The time spent rendering in nanoseconds.
+            fps (float): The frame rate measured by the clock.
+            game_state (GameState): The rendered game state, whose entities and zombies are counted.
+
+        Returns:
+            None
+        """
+        gc_pause_ns, gc_collections = self.gc_pauses.take()
+        entity_counts = Counter(name for name, _ in game_state.get_matters())
+        if game_state.zombies is not None:
+            entity_counts["zombies"] = len(game_state.zombies)
+        self.submit(
+            FrameRecord(
+                frame=frame,
+                time=time.perf_counter() - self.started_at,
+                steps=steps,
+                simulation_ms=simulation_ns / 1e6,
+                render_ms=render_ns / 1e6,
+                fps=fps,
+                gc_pause_ms=gc_pause_ns / 1e6,
+                gc_collections=gc_collections,
+                entity_counts=dict(entity_counts),
+                dropped=self.dropped,
+            )
+        )
+
+    def submit(self, record: FrameRecord) -> None:
+        """
+        Queues a record without waiting, dropping it if the queue is full.
+
+        Args:
+            record (FrameRecord): The record.
+
+        Returns:
+            None
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self) -> None:
+        while True:
+            record = self.queue.get()
+            if record is None:
+                return
+            line = json.dumps(dataclasses.asdict(record), separators=(",", ":"))
+            self.sink.write(line.encode() + b"\n")
+
+    def close(self) -> None:
+        """
+        Writes the queued records and closes the sink.
+
+        Returns:
+            None
+        """
+        self.gc_pauses.close()
+        self.queue.put(None)
+        self.thread.join()
+        self.sink.close()
+
+
+def read_records(path: str) -> list[dict]:
+    """
+    Reads the records of a telemetry file.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        list[dict]: The records in the order they were written.
+    """
+    with open(path, "rb") as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -0,0 +1,83 @@
+import argparse
+import random
+
+from typing import Iterator
+
+from ..state.chunked_level import write_level
+from ..state.tile import TileKind
+from ..constants.level import LEVEL_CHUNK_SIZE
+
+
+def generate_level_bands(
+    columns: int,
+    rows: int,
+    chunk_size: int = LEVEL_CHUNK_SIZE,
+    seed: int = 0,
+    density: float = 0.15,
+) -> Iterator[bytearray]:
+    """
+    Generates a random level with a solid floor and floating platforms, one band of chunk rows at a time.
+    Every band is generated from its own seed, so only one band is held in memory.
+
+    Args:
+        columns (int): The number of tile columns.
+        rows (int): The number of tile rows.
+        chunk_size (int): The number of rows of a band.
+        seed (int): The seed of the random generator.
+        density (float): The fraction of rows above the floor that hold platforms.
+
+    Returns:
+        Iterator[bytearray]: The cells of every band in row-major order.
+    """
+    for band_top in range(0, rows, chunk_size):
+        rng = random.Random(f"{seed}:{band_top}")
+        band_rows = min(chunk_size, rows - band_top)
+        band = bytearray(columns * band_rows)
+
+        for band_row in range(band_rows):
+            row = band_top + band_row
+            offset = band_row * columns
+            if row >= rows - 2:
+                kind = TileKind.GRASS if row == rows - 2 else TileKind.DIRT
+                band[offset : offset + columns] = bytes([kind]) * columns
+                continue
+            if row < 2 or rng.random() >= density:
+                continue
+
+            column = 0
+            while column < columns:
+                length = rng.randint(3, 12)
+                if rng.random() < 0.5:
+                    end = min(column + length, columns) - 1
+                    band[offset + column : offset + end + 1] = bytes(
+                        [TileKind.GRASS]
+                    ) * (end + 1 - column)
+                    band[offset + column] = TileKind.LEFT
+                    band[offset + end] = TileKind.RIGHT
+                column += length + rng.randint(2, 10)
+
+        yield band
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generates a random chunked level file for zombie_knight.board --level.",
+    )
+    parser.add_argument("path")
+    parser.add_argument("--columns", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=LEVEL_CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    write_level(
+        args.path,
+        args.columns,
+        args.rows,
+        generate_level_bands(args.columns, args.rows, args.chunk_size, args.seed),
+        args.chunk_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+
+import pygame
+
+from dataclasses import dataclass
+
+from ..assets import list_animation_frame_paths
+from ..constants.atlas import ATLAS_MAX_SIZE, ATLAS_INDEX_VERSION
+from ..constants.paths import IMAGES_DIRECTORY, ATLAS_DIRECTORY
+
+
+@dataclass
+class AtlasFrame:
+    animation: str
+    frame_index: int
+    image: pygame.Surface
+
+
+@dataclass
+class AtlasPlacement:
+    frame: AtlasFrame
+    atlas_index: int
+    position: tuple[int, int]
+
+
+def find_animation_directories(images_directory: str) -> list[str]:
+    """
+    Finds every directory under the images directory that directly holds frames.
+
+    Args:
+        images_directory (str): The root directory of the images.
+
+    Returns:
+        list[str]: The sorted directories holding at least two PNG files.
+    """
+    animation_directories = []
+    for directory, _, file_names in os.walk(images_directory):
+        png_file_names = [name for name in file_names if name.endswith(".png")]
+        if len(png_file_names) > 1:
+            animation_directories.append(directory)
+
+    return sorted(animation_directories)
+
+
+def load_animation_frames(
+    images_directory: str,
+    animation_directory: str,
+) -> list[AtlasFrame]:
+    """
+    Loads the frames of an animation directory in frame number order.
+
+    Args:
+        images_directory (str): The root directory of the images.
+        animation_directory (str): The directory of the animation.
+
+    Returns:
+        list[AtlasFrame]: The frames of the animation.
+    """
+    animation = os.path.relpath(animation_directory, images_directory).replace(
+        os.sep, "/"
+    )
+    return [
+        AtlasFrame(
+            animation=animation,
+            frame_index=frame_index,
+            image=pygame.image.load(frame_path),
+        )
+        for frame_index, frame_path in enumerate(
+            list_animation_frame_paths(animation_directory)
+        )
+    ]
+
+
+def pack_frames(
+    frames: list[AtlasFrame],
+    max_size: tuple[int, int],
+) -> tuple[list[AtlasPlacement], list[tuple[int, int]]]:
+    """
+    Packs frames into atlases with a shelf packer.
+    Frames are placed tallest first, left to right on shelves, and a new atlas
+    is started once a shelf no longer fits the maximum height.
+
+    Args:
+        frames (list[AtlasFrame]): The frames to pack.
+        max_size (tuple[int, int]): The maximum size of an atlas.
+
+    Returns:
+        tuple[list[AtlasPlacement], list[tuple[int, int]]]: The placements and the used size of every atlas.
+    """
+    max_width, max_height = max_size
+    placements = []
+    atlas_sizes = []
+    x, y, shelf_height, used_width = 0, 0, 0, 0
+
+    for frame in sorted(frames, key=lambda frame: -frame.image.get_height()):
+        width, height = frame.image.get_size()
+        if width > max_width or height > max_height:
+            raise ValueError(
+                f"Frame {frame.frame_index} of {frame.animation!r} does not fit in an atlas"
+            )
+
+        if x + width > max_width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if not atlas_sizes or y + height > max_height:
+            atlas_sizes.append((0, 0))
+            x, y, shelf_height, used_width = 0, 0, 0, 0
+
+        placements.append(AtlasPlacement(frame, len(atlas_sizes) - 1, (x, y)))
+        x += width
+        shelf_height = max(shelf_height, height)
+        used_width = max(used_width, x)
+        atlas_sizes[-1] = (used_width, y + shelf_height)
+
+    return placements, atlas_sizes
+
+
+def build_atlases(
+    images_directory: str = IMAGES_DIRECTORY,
+    output_directory: str = ATLAS_DIRECTORY,
+    max_size: tuple[int, int] = ATLAS_MAX_SIZE,
+) -> dict:
+    """
+    Packs every animation directory into texture atlases and writes them with their index.
+
+    Args:
+        images_directory (str): The root directory of the images.
+        output_directory (str): The directory to write the atlases and the index to.
+        max_size (tuple[int, int]): The maximum size of an atlas.
+
+    Returns:
+        dict: The written atlas index.
+    """
+    frames = [
+        frame
+        for animation_directory in find_animation_directories(images_directory)
+        for frame in load_animation_frames(images_directory, animation_directory)
+    ]
+    placements, atlas_sizes = pack_frames(frames, max_size)
+
+    atlases = [pygame.Surface(size, pygame.SRCALPHA) for size in atlas_sizes]
+    animations: dict[str, list[list[int]]] = {}
+    for placement in sorted(
+        placements,
+        key=lambda placement: (placement.frame.animation, placement.frame.frame_index),
+    ):
+        frame = placement.frame
+        atlases[placement.atlas_index].blit(frame.image, placement.position)
+        animations.setdefault(frame.animation, []).append(
+            [placement.atlas_index, *placement.position, *frame.image.get_size()]
+        )
+
+    os.makedirs(output_directory, exist_ok=True)
+    atlas_file_names = []
+    for atlas_index, atlas in enumerate(atlases):
+        atlas_file_name = f"atlas_{atlas_index}.png"
+        pygame.image.save(atlas, os.path.join(output_directory, atlas_file_name))
+        atlas_file_names.append(atlas_file_name)
+
+    index = {
+        "version": ATLAS_INDEX_VERSION,
+        "atlases": atlas_file_names,
+        "animations": animations,
+    }
+    with open(os.path.join(output_directory, "index.json"), "w") as index_file:
+        json.dump(index, index_file, separators=(",", ":"))
+
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Packs the animation frames under the images directory into texture atlases.",
+    )
+    parser.add_argument("--images", default=IMAGES_DIRECTORY)
+    parser.add_argument("--output", default=ATLAS_DIRECTORY)
+    parser.add_argument("--max-width", type=int, default=ATLAS_MAX_SIZE[0])
+    parser.add_argument("--max-height", type=int, default=ATLAS_MAX_SIZE[1])
+    args = parser.parse_args()
+
+    index = build_atlases(
+        args.images,
+        args.output,
+        (args.max_width, args.max_height),
+    )
+    frame_count = sum(len(frames) for frames in index["animations"].values())
+    print(
+        f"Packed {frame_count} frames of {len(index['animations'])} animations "
+        f"into {len(index['atlases'])} atlases in {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
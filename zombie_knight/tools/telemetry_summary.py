@@ -0,0 +1,93 @@
+import argparse
+import json
+import sys
+
+from ..stats import percentile
+from ..telemetry import read_records
+from ..constants.telemetry import TELEMETRY_SPIKE_FACTOR
+
+
+SUMMARIZED_FIELDS = ("frame_ms", "simulation_ms", "render_ms", "gc_pause_ms", "fps")
+
+
+def summarize_records(
+    records: list[dict],
+    spike_factor: float = TELEMETRY_SPIKE_FACTOR,
+    max_spikes: int = 20,
+) -> dict:
+    """
+    Summarizes a telemetry capture into percentiles and frame-time spikes.
+    The frame time is the simulation time plus the render time. A frame is a
+    spike when it takes more than spike_factor times the median frame time.
+
+    Args:
+        records (list[dict]): The frame records.
+        spike_factor (float): The multiple of the median frame time a spike exceeds.
+        max_spikes (int): The maximum number of spikes listed, longest first.
+
+    Returns:
+        dict: The number of frames, the duration of the capture, the number
+            of dropped records, the p50, p95, p99 and max of every field, and the spikes.
+    """
+    frame_times = [record["simulation_ms"] + record["render_ms"] for record in records]
+    summary = {
+        "frames": len(records),
+        "duration_s": records[-1]["time"] - records[0]["time"] if records else 0.0,
+        "gc_collections": sum(record["gc_collections"] for record in records),
+        "dropped": records[-1].get("dropped", 0) if records else 0,
+    }
+    if not records:
+        return summary
+
+    for name in SUMMARIZED_FIELDS:
+        values = (
+            frame_times
+            if name == "frame_ms"
+            else [record[name] for record in records]
+        )
+        summary[name] = {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values),
+        }
+
+    threshold = spike_factor * summary["frame_ms"]["p50"]
+    spikes = [
+        {
+            "frame": record["frame"],
+            "time": record["time"],
+            "frame_ms": frame_time,
+            "simulation_ms": record["simulation_ms"],
+            "render_ms": record["render_ms"],
+            "gc_pause_ms": record["gc_pause_ms"],
+            "steps": record["steps"],
+        }
+        for record, frame_time in zip(records, frame_times)
+        if frame_time > threshold
+    ]
+    summary["spike_threshold_ms"] = threshold
+    summary["spike_count"] = len(spikes)
+    summary["spikes"] = sorted(spikes, key=lambda spike: -spike["frame_ms"])[:max_spikes]
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Summarizes a telemetry capture of zombie_knight.board --telemetry.",
+    )
+    parser.add_argument("path")
+    parser.add_argument("--spike-factor", type=float, default=TELEMETRY_SPIKE_FACTOR)
+    parser.add_argument("--max-spikes", type=int, default=20)
+    args = parser.parse_args()
+
+    json.dump(
+        summarize_records(read_records(args.path), args.spike_factor, args.max_spikes),
+        sys.stdout,
+        indent=2,
+    )
+    print()
+
+
+if __name__ == "__main__":
+    main()
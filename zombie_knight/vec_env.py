@@ -0,0 +1,350 @@
+import multiprocessing
+
+import pygame
+
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+
+from .board import create_game_state, create_rules
+from .input import ScriptedKeyboard
+from .numpy_support import np, require_numpy
+from .rules.pipeline import RulePipeline
+from .state.game_state import GameState
+from .state.player import PlayerMode
+from .state.direction import HorizontalDirection
+from .constants.tile import TILE_MAP, TILE_SIZE
+
+
+ACTION_KEYS = [
+    (frozenset(), False),
+    (frozenset({pygame.K_LEFT}), False),
+    (frozenset({pygame.K_RIGHT}), False),
+    (frozenset(), True),
+    (frozenset({pygame.K_LEFT}), True),
+    (frozenset({pygame.K_RIGHT}), True),
+]
+
+OBSERVATION_SIZE = 6
+
+
+class GameInstance:
+    def __init__(self, max_episode_frames: int) -> None:
+        """
+        Initializes a game instance of a vectorized environment.
+        Every instance has its own keyboard and rules, so instances do not share state.
+
+        Args:
+            max_episode_frames (int): The number of frames after which an episode ends.
+
+        Returns:
+            None
+        """
+        self.max_episode_frames = max_episode_frames
+        self.keyboard = ScriptedKeyboard()
+        self.pipeline = RulePipeline(create_rules(self.keyboard))
+        self.jump_events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+        self.world_bottom = len(TILE_MAP) * TILE_SIZE[1]
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Starts a new episode from the initial game state.
+
+        Returns:
+            None
+        """
+        self.game_state = create_game_state()
+        self.frame = 0
+
+    def step(self, action: int, frame_skip: int) -> tuple[float, bool]:
+        """
+        Applies an action for a number of frames.
+
+        Args:
+            action (int): The index of the action in ACTION_KEYS.
+            frame_skip (int): The number of frames to repeat the action for.
+                A jump is only pressed in the first of them.
+
+        Returns:
+            tuple[float, bool]: The reward, the distance moved to the right in
+                pixels, and whether the episode ended.
+        """
+        pressed_keys, jump = ACTION_KEYS[action]
+        self.keyboard.press(pressed_keys)
+        start_x = self.game_state.player.get_position().x
+
+        for frame in range(frame_skip):
+            events = self.jump_events if jump and frame == 0 else []
+            self.game_state = self.pipeline(self.game_state, events)
+            self.frame += 1
+            if self.is_done():
+                break
+
+        return self.game_state.player.get_position().x - start_x, self.is_done()
+
+    def is_done(self) -> bool:
+        """
+        Checks if the episode ended, by time or by the player falling out of the world.
+
+        Returns:
+            bool: True if the episode ended, False otherwise.
+        """
+        return (
+            self.frame >= self.max_episode_frames
+            or self.game_state.player.rect.top > self.world_bottom
+        )
+
+    def write_observation(self, observation: "np.ndarray") -> None:
+        """
+        Writes the observation of the game state into a row of the observation array.
+
+        Args:
+            observation (np.ndarray): The row of the observation array.
+
+        Returns:
+            None
+        """
+        write_observation(self.game_state, observation)
+
+
+def write_observation(game_state: GameState, observation: "np.ndarray") -> None:
+    """
+    Writes the position, velocity, mode and direction of the player into an observation row.
+
+    Args:
+        game_state (GameState): The game state.
+        observation (np.ndarray): The row of the observation array.
+
+    Returns:
+        None
+    """
+    player = game_state.player
+    position = player.get_position()
+    observation[:] = (
+        position.x,
+        position.y,
+        player.velocity.x,
+        player.velocity.y,
+        player.mode == PlayerMode.JUMPING,
+        player.horizontal_direction == HorizontalDirection.RIGHT,
+    )
+
+
+class SharedArrays:
+    def __init__(self, env_count: int, name: str | None = None) -> None:
+        """
+        Initializes the arrays shared between the environment and its workers.
+        All arrays live in one shared memory block, so a step exchanges no
+        pickled game state, only a short command per worker.
+
+        Args:
+            env_count (int): The number of game instances.
+            name (str | None): The name of an existing shared memory block to
+                attach to, or None to create a new one.
+
+        Returns:
+            None
+        """
+        require_numpy("the vectorized environment")
+        layout = [
+            ("actions", np.int64, (env_count,)),
+            ("observations", np.float64, (env_count, OBSERVATION_SIZE)),
+            ("rewards", np.float64, (env_count,)),
+            ("dones", np.bool_, (env_count,)),
+        ]
+        offsets = []
+        size = 0
+        for _, dtype, shape in layout:
+            size = -(-size // 8) * 8
+            offsets.append(size)
+            size += np.dtype(dtype).itemsize * int(np.prod(shape))
+
+        self.env_count = env_count
+        self.memory = shared_memory.SharedMemory(
+            name=name,
+            create=name is None,
+            size=max(size, 1),
+        )
+        for (array_name, dtype, shape), offset in zip(layout, offsets):
+            setattr(
+                self,
+                array_name,
+                np.ndarray(shape, dtype=dtype, buffer=self.memory.buf, offset=offset),
+            )
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory block.
+
+        Returns:
+            None
+        """
+        for array_name in ("actions", "observations", "rewards", "dones"):
+            setattr(self, array_name, None)
+        self.memory.close()
+
+
+def run_worker(
+    connection: Connection,
+    memory_name: str,
+    env_count: int,
+    env_slice: slice,
+    max_episode_frames: int,
+    frame_skip: int,
+) -> None:
+    """
+    Runs the game instances of one worker process until it is told to close.
+    The worker reads the actions of its instances from the shared arrays and
+    writes their observations, rewards and done flags back.
+
+    Args:
+        connection (Connection): The pipe receiving commands from the environment.
+        memory_name (str): The name of the shared memory block.
+        env_count (int): The total number of game instances.
+        env_slice (slice): The instances stepped by this worker.
+        max_episode_frames (int): The number of frames after which an episode ends.
+        frame_skip (int): The number of frames every action is repeated for.
+
+    Returns:
+        None
+    """
+    arrays = SharedArrays(env_count, memory_name)
+    indices = range(*env_slice.indices(env_count))
+    instances = [GameInstance(max_episode_frames) for _ in indices]
+
+    try:
+        while True:
+            command = connection.recv()
+            if command == "step":
+                for index, instance in zip(indices, instances):
+                    reward, done = instance.step(int(arrays.actions[index]), frame_skip)
+                    if done:
+                        instance.reset()
+                    arrays.rewards[index] = reward
+                    arrays.dones[index] = done
+                    instance.write_observation(arrays.observations[index])
+            elif command == "reset":
+                for index, instance in zip(indices, instances):
+                    instance.reset()
+                    arrays.rewards[index] = 0.0
+                    arrays.dones[index] = False
+                    instance.write_observation(arrays.observations[index])
+            elif command == "close":
+                break
+            connection.send(command)
+    finally:
+        arrays.close()
+        connection.close()
+
+
+class VectorEnv:
+    def __init__(
+        self,
+        env_count: int,
+        worker_count: int,
+        max_episode_frames: int = 120 * 60,
+        frame_skip: int = 1,
+    ) -> None:
+        """
+        Initializes the vectorized environment.
+        The game instances are split into contiguous blocks, one per worker
+        process, and are stepped in parallel. Finished episodes are reset
+        by the workers, so every step returns the first observation of the
+        new episode for them.
+
+        Args:
+            env_count (int): The number of game instances.
+            worker_count (int): The number of worker processes.
+            max_episode_frames (int): The number of frames after which an episode ends.
+            frame_skip (int): The number of frames every action is repeated for.
+
+        Returns:
+            None
+        """
+        require_numpy("the vectorized environment")
+        worker_count = max(1, min(worker_count, env_count))
+        self.env_count = env_count
+        self.frame_skip = frame_skip
+        self.arrays = SharedArrays(env_count)
+        self.connections = []
+        self.workers = []
+
+        block_size = -(-env_count // worker_count)
+        for start in range(0, env_count, block_size):
+            connection, worker_connection = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=run_worker,
+                args=(
+                    worker_connection,
+                    self.arrays.memory.name,
+                    env_count,
+                    slice(start, min(start + block_size, env_count)),
+                    max_episode_frames,
+                    frame_skip,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.workers.append(worker)
+
+    def reset(self) -> "np.ndarray":
+        """
+        Resets every game instance.
+
+        Returns:
+            np.ndarray: The (env_count, OBSERVATION_SIZE) observations.
+        """
+        self.send_command("reset")
+        return self.arrays.observations
+
+    def step(
+        self,
+        actions: "np.ndarray",
+    ) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Applies one action to every game instance.
+        The returned arrays are views of the shared memory, which the next call overwrites.
+
+        Args:
+            actions (np.ndarray): The index in ACTION_KEYS of the action of every instance.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The observations, rewards and done flags.
+        """
+        self.arrays.actions[:] = actions
+        self.send_command("step")
+        return self.arrays.observations, self.arrays.rewards, self.arrays.dones
+
+    def send_command(self, command: str) -> None:
+        """
+        Sends a command to every worker and waits until all of them carried it out.
+
+        Args:
+            command (str): The command.
+
+        Returns:
+            None
+        """
+        for connection in self.connections:
+            connection.send(command)
+        for connection in self.connections:
+            connection.recv()
+
+    def close(self) -> None:
+        """
+        Stops the workers and frees the shared memory.
+
+        Returns:
+            None
+        """
+        for connection in self.connections:
+            connection.send("close")
+            connection.close()
+        for worker in self.workers:
+            worker.join()
+        self.arrays.close()
+        self.arrays.memory.unlink()
+        self.connections = []
+        self.workers = []